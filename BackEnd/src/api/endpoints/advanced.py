@@ -1,9 +1,25 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from BackEnd.src.schemas.advanced import TextRequest, FileRequest, ProcessResponse
+from BackEnd.src.schemas.advanced import (
+    TextRequest,
+    FileRequest,
+    ProcessResponse,
+    WordSpansResponse,
+    NERBatchRequest,
+    MultiFunctionRequest,
+    MultiFunctionResponse,
+    TfidfCorpusResponse,
+    TfidfCorpusUpdateResponse,
+)
 from BackEnd.src.services.advanced_service import (
     process_text_function,
     process_file_function,
+    process_ner_batch_function,
+    process_multiple_function,
+    process_tfidf_corpus_text_function,
+    process_tfidf_corpus_file_function,
+    process_tfidf_corpus_stats_function,
 )
+from fastapi.responses import StreamingResponse
 import logging
 from typing import Dict, Any
 
@@ -287,6 +303,63 @@ async def topic_modeling_text(request: TextRequest):
         raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
 
 
+@router.post("/word_spans/text", response_model=WordSpansResponse)
+async def word_spans_text(request: TextRequest):
+    try:
+        logger.info(
+            f"Processing text with word_spans, text length: {len(request.text)}"
+        )
+        result = process_text_function(request.text, "word_spans")
+        logger.debug("Word span extraction completed successfully")
+        return {"count": len(result), "spans": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Error in word_spans_text: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+
+
+@router.post("/analyze/text", response_model=MultiFunctionResponse)
+async def analyze_text(request: MultiFunctionRequest):
+    """
+    Run several functions on one text in a single call.
+
+    Intermediate stages are shared, so e.g. stemming, lemmatization and
+    TF-IDF together tokenize and filter stopwords only once.
+    """
+    try:
+        logger.info(
+            f"Processing text with {', '.join(request.functions)}, text length: {len(request.text)}"
+        )
+        if not request.functions:
+            raise HTTPException(
+                status_code=400, detail="At least one function is required."
+            )
+        result = process_multiple_function(request.text, request.functions)
+        logger.debug("Multi-function analysis completed successfully")
+        return {"results": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid analyze request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in analyze_text: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+
+
 ### 📌 FILE PROCESSING ENDPOINTS ###
 @router.post("/word_tokenizer/file", response_model=ProcessResponse)
 async def word_tokenizer_file(file: UploadFile = File(...)):
@@ -549,3 +622,130 @@ async def topic_modeling_file(file: UploadFile = File(...)):
     except Exception as e:
         logger.error(f"Error in topic_modeling_file: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+@router.post("/word_spans/file", response_model=WordSpansResponse)
+async def word_spans_file(file: UploadFile = File(...)):
+    try:
+        logger.info(f"Processing file with word_spans, filename: {file.filename}")
+        result = await process_file_function(file, "word_spans")
+
+        # The service reports extraction failures as a message
+        if isinstance(result, str):
+            raise HTTPException(status_code=400, detail=result)
+
+        logger.debug("Word span extraction of file completed successfully")
+        return {"count": len(result), "spans": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Error in word_spans_file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+### 📌 BATCH PROCESSING ENDPOINTS ###
+@router.post("/named_entity_recognition/batch")
+async def named_entity_recognition_batch(request: NERBatchRequest):
+    """
+    Extract named entities from many texts in one call.
+
+    Texts go through spaCy's nlp.pipe in batches of `batch_size`, spread
+    over `n_process` worker processes. One NDJSON line
+    ({"index": ..., "entities": [...]}) is streamed per text, in input
+    order, as soon as its batch is done. The number of texts, `batch_size`
+    and `n_process` are bounded by the server (422 beyond the limits).
+    """
+    try:
+        logger.info(
+            f"Processing batch named_entity_recognition for {len(request.texts)} texts"
+        )
+        result = process_ner_batch_function(
+            request.texts, request.batch_size, request.n_process
+        )
+        return StreamingResponse(result, media_type="application/x-ndjson")
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid batch NER request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in named_entity_recognition_batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing batch: {str(e)}")
+
+
+### 📌 CORPUS TF-IDF MODEL ENDPOINTS ###
+@router.post("/tfidf_corpus/text", response_model=TfidfCorpusUpdateResponse)
+async def tfidf_corpus_text(request: TextRequest):
+    """
+    Add a text to the corpus used for the IDF of /tfidf_vectorization.
+    """
+    try:
+        logger.info(
+            f"Adding text to the TF-IDF corpus, text length: {len(request.text)}"
+        )
+        if not request.text.strip():
+            raise HTTPException(status_code=400, detail="Text cannot be empty")
+        result = process_tfidf_corpus_text_function(request.text)
+        logger.debug("Text added to the TF-IDF corpus")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid TF-IDF corpus text: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in tfidf_corpus_text: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+
+
+@router.post("/tfidf_corpus/file", response_model=TfidfCorpusUpdateResponse)
+async def tfidf_corpus_file(file: UploadFile = File(...)):
+    """
+    Add the text of a file to the corpus used for the IDF of
+    /tfidf_vectorization.
+    """
+    try:
+        logger.info(f"Adding file to the TF-IDF corpus, filename: {file.filename}")
+        result = await process_tfidf_corpus_file_function(file)
+        logger.debug("File added to the TF-IDF corpus")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid TF-IDF corpus file: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in tfidf_corpus_file: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+@router.get("/tfidf_corpus", response_model=TfidfCorpusResponse)
+async def tfidf_corpus_stats():
+    """
+    Report how many documents and distinct terms the TF-IDF corpus holds.
+    """
+    return process_tfidf_corpus_stats_function()
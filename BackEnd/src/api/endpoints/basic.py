@@ -1,14 +1,70 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    UploadFile,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    status,
+)
 from BackEnd.src.schemas.basic import (
     BasicTextRequest,
     BasicFileResponse,
     BasicTextResponse,
+    BasicBatchRequest,
+    BasicBatchResponse,
+    BasicTransformRequest,
+    BasicApproximateStatsRequest,
+    BasicApproximateStatsResponse,
+    BasicNgramRequest,
+    BasicNgramResponse,
+    BasicConcordanceRequest,
+    BasicConcordanceResponse,
+    BasicReplaceRequest,
+    BasicReplaceResponse,
+    BasicNearDuplicateIndexResponse,
+    BasicNearDuplicateQueryRequest,
+    BasicNearDuplicateQueryResponse,
+    BasicReadabilityResponse,
+    BasicReadabilityBatchRequest,
+    BasicReadabilityBatchResponse,
+    BasicExportRequest,
+    MAX_CONCORDANCE_WINDOW,
+    MAX_TOP_K,
 )
 from BackEnd.src.services.basic_service import (
     process_text_function,
     process_file_function,
+    process_batch_function,
+    process_transform_function,
+    process_approximate_text_function,
+    process_approximate_file_function,
+    process_corpus_function,
+    read_corpus_uploads,
+    process_ngram_text_function,
+    process_ngram_file_function,
+    process_concordance_text_function,
+    process_concordance_file_function,
+    process_concordance_lookup_function,
+    process_replace_text_function,
+    process_replace_file_function,
+    process_near_duplicate_index_function,
+    process_near_duplicate_text_function,
+    process_near_duplicate_file_function,
+    process_readability_text_function,
+    process_readability_file_function,
+    process_readability_batch_function,
+    process_export_text_function,
+    process_export_file_function,
+    valid_pdf_backend,
 )
+from fastapi.responses import Response, StreamingResponse
+import asyncio
+import json
 import logging
+import zipfile
+from typing import List, Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -465,7 +521,10 @@ async def readability_score_text(request: BasicTextRequest):
 
 ### 📌 FILE PROCESSING ENDPOINTS ###
 @router.post("/count-words/file", response_model=BasicFileResponse)
-async def count_words_file(file: UploadFile = File(...)):
+async def count_words_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing count_words request for file: {file.filename}")
         if not file:
@@ -473,7 +532,7 @@ async def count_words_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "count_words")
+        result = await process_file_function(file, "count_words", pdf_backend)
         logger.info(f"Successfully processed count_words for file: {file.filename}")
         return {"result": result}
     except HTTPException as http_exc:
@@ -496,7 +555,10 @@ async def count_words_file(file: UploadFile = File(...)):
 
 
 @router.post("/count-punctuation/file", response_model=BasicFileResponse)
-async def count_punctuation_file(file: UploadFile = File(...)):
+async def count_punctuation_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing count_punctuation request for file: {file.filename}")
         if not file:
@@ -504,7 +566,7 @@ async def count_punctuation_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "count_punctuation")
+        result = await process_file_function(file, "count_punctuation", pdf_backend)
         logger.info(
             f"Successfully processed count_punctuation for file: {file.filename}"
         )
@@ -529,7 +591,11 @@ async def count_punctuation_file(file: UploadFile = File(...)):
 
 
 @router.post("/most-repeated-word/file", response_model=BasicFileResponse)
-async def most_repeated_word_file(file: UploadFile = File(...)):
+async def most_repeated_word_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+    approximate: bool = False,
+):
     try:
         logger.info(f"Processing most_repeated_word request for file: {file.filename}")
         if not file:
@@ -537,7 +603,9 @@ async def most_repeated_word_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "most_repeated_word")
+        result = await process_file_function(
+            file, "most_repeated_word", pdf_backend, approximate
+        )
         logger.info(
             f"Successfully processed most_repeated_word for file: {file.filename}"
         )
@@ -562,7 +630,11 @@ async def most_repeated_word_file(file: UploadFile = File(...)):
 
 
 @router.post("/least-repeated-word/file", response_model=BasicFileResponse)
-async def least_repeated_word_file(file: UploadFile = File(...)):
+async def least_repeated_word_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+    approximate: bool = False,
+):
     try:
         logger.info(f"Processing least_repeated_word request for file: {file.filename}")
         if not file:
@@ -570,7 +642,9 @@ async def least_repeated_word_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "least_repeated_word")
+        result = await process_file_function(
+            file, "least_repeated_word", pdf_backend, approximate
+        )
         logger.info(
             f"Successfully processed least_repeated_word for file: {file.filename}"
         )
@@ -595,7 +669,10 @@ async def least_repeated_word_file(file: UploadFile = File(...)):
 
 
 @router.post("/to-lowercase/file", response_model=BasicFileResponse)
-async def to_lowercase_file(file: UploadFile = File(...)):
+async def to_lowercase_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing to_lowercase request for file: {file.filename}")
         if not file:
@@ -603,7 +680,7 @@ async def to_lowercase_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "to_lower")
+        result = await process_file_function(file, "to_lower", pdf_backend)
         logger.info(f"Successfully processed to_lowercase for file: {file.filename}")
         return {"result": result}
     except HTTPException as http_exc:
@@ -626,7 +703,10 @@ async def to_lowercase_file(file: UploadFile = File(...)):
 
 
 @router.post("/to-uppercase/file", response_model=BasicFileResponse)
-async def to_uppercase_file(file: UploadFile = File(...)):
+async def to_uppercase_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing to_uppercase request for file: {file.filename}")
         if not file:
@@ -634,7 +714,7 @@ async def to_uppercase_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "to_upper")
+        result = await process_file_function(file, "to_upper", pdf_backend)
         logger.info(f"Successfully processed to_uppercase for file: {file.filename}")
         return {"result": result}
     except HTTPException as http_exc:
@@ -657,7 +737,10 @@ async def to_uppercase_file(file: UploadFile = File(...)):
 
 
 @router.post("/remove-punctuation/file", response_model=BasicFileResponse)
-async def remove_punctuation_file(file: UploadFile = File(...)):
+async def remove_punctuation_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing remove_punctuation request for file: {file.filename}")
         if not file:
@@ -665,7 +748,7 @@ async def remove_punctuation_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "remove_punctuation")
+        result = await process_file_function(file, "remove_punctuation", pdf_backend)
         logger.info(
             f"Successfully processed remove_punctuation for file: {file.filename}"
         )
@@ -690,7 +773,10 @@ async def remove_punctuation_file(file: UploadFile = File(...)):
 
 
 @router.post("/remove-numbers/file", response_model=BasicFileResponse)
-async def remove_numbers_file(file: UploadFile = File(...)):
+async def remove_numbers_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing remove_numbers request for file: {file.filename}")
         if not file:
@@ -698,7 +784,7 @@ async def remove_numbers_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "remove_numbers")
+        result = await process_file_function(file, "remove_numbers", pdf_backend)
         logger.info(f"Successfully processed remove_numbers for file: {file.filename}")
         return {"result": result}
     except HTTPException as http_exc:
@@ -721,7 +807,10 @@ async def remove_numbers_file(file: UploadFile = File(...)):
 
 
 @router.post("/remove-extra-whitespace/file", response_model=BasicFileResponse)
-async def remove_extra_whitespace_file(file: UploadFile = File(...)):
+async def remove_extra_whitespace_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(
             f"Processing remove_extra_whitespace request for file: {file.filename}"
@@ -731,7 +820,9 @@ async def remove_extra_whitespace_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "remove_extra_whitespace")
+        result = await process_file_function(
+            file, "remove_extra_whitespace", pdf_backend
+        )
         logger.info(
             f"Successfully processed remove_extra_whitespace for file: {file.filename}"
         )
@@ -756,7 +847,10 @@ async def remove_extra_whitespace_file(file: UploadFile = File(...)):
 
 
 @router.post("/average-word-length/file", response_model=BasicFileResponse)
-async def average_word_length_file(file: UploadFile = File(...)):
+async def average_word_length_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing average_word_length request for file: {file.filename}")
         if not file:
@@ -764,7 +858,9 @@ async def average_word_length_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "find_average_word_length")
+        result = await process_file_function(
+            file, "find_average_word_length", pdf_backend
+        )
         logger.info(
             f"Successfully processed average_word_length for file: {file.filename}"
         )
@@ -789,7 +885,10 @@ async def average_word_length_file(file: UploadFile = File(...)):
 
 
 @router.post("/average-sentence-length/file", response_model=BasicFileResponse)
-async def average_sentence_length_file(file: UploadFile = File(...)):
+async def average_sentence_length_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(
             f"Processing average_sentence_length request for file: {file.filename}"
@@ -799,7 +898,9 @@ async def average_sentence_length_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "find_average_sentence_length")
+        result = await process_file_function(
+            file, "find_average_sentence_length", pdf_backend
+        )
         logger.info(
             f"Successfully processed average_sentence_length for file: {file.filename}"
         )
@@ -824,7 +925,10 @@ async def average_sentence_length_file(file: UploadFile = File(...)):
 
 
 @router.post("/reverse-text/file", response_model=BasicFileResponse)
-async def reverse_text_file(file: UploadFile = File(...)):
+async def reverse_text_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing reverse_text request for file: {file.filename}")
         if not file:
@@ -832,7 +936,7 @@ async def reverse_text_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "reverse_text")
+        result = await process_file_function(file, "reverse_text", pdf_backend)
         logger.info(f"Successfully processed reverse_text for file: {file.filename}")
         return {"result": result}
     except HTTPException as http_exc:
@@ -855,7 +959,11 @@ async def reverse_text_file(file: UploadFile = File(...)):
 
 
 @router.post("/count-unique-words/file", response_model=BasicFileResponse)
-async def count_unique_words_file(file: UploadFile = File(...)):
+async def count_unique_words_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+    approximate: bool = False,
+):
     try:
         logger.info(f"Processing count_unique_words request for file: {file.filename}")
         if not file:
@@ -863,7 +971,9 @@ async def count_unique_words_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "count_unique_words")
+        result = await process_file_function(
+            file, "count_unique_words", pdf_backend, approximate
+        )
         logger.info(
             f"Successfully processed count_unique_words for file: {file.filename}"
         )
@@ -888,7 +998,10 @@ async def count_unique_words_file(file: UploadFile = File(...)):
 
 
 @router.post("/extract-proper-nouns/file", response_model=BasicFileResponse)
-async def extract_proper_nouns_file(file: UploadFile = File(...)):
+async def extract_proper_nouns_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(
             f"Processing extract_proper_nouns request for file: {file.filename}"
@@ -898,7 +1011,7 @@ async def extract_proper_nouns_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "extract_proper_nouns")
+        result = await process_file_function(file, "extract_proper_nouns", pdf_backend)
         logger.info(
             f"Successfully processed extract_proper_nouns for file: {file.filename}"
         )
@@ -923,7 +1036,10 @@ async def extract_proper_nouns_file(file: UploadFile = File(...)):
 
 
 @router.post("/readability-score/file", response_model=BasicFileResponse)
-async def readability_score_file(file: UploadFile = File(...)):
+async def readability_score_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
     try:
         logger.info(f"Processing readability_score request for file: {file.filename}")
         if not file:
@@ -931,7 +1047,7 @@ async def readability_score_file(file: UploadFile = File(...)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
             )
-        result = await process_file_function(file, "readability_score")
+        result = await process_file_function(file, "readability_score", pdf_backend)
         logger.info(
             f"Successfully processed readability_score for file: {file.filename}"
         )
@@ -953,3 +1069,914 @@ async def readability_score_file(file: UploadFile = File(...)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process file: {str(e)}",
         )
+
+
+### 📌 BATCH PROCESSING ENDPOINTS ###
+@router.post("/batch", response_model=BasicBatchResponse)
+async def batch_text(request: BasicBatchRequest):
+    """
+    Compute several metrics for many texts in one call.
+
+    Large batches are spread across worker processes. Results are returned
+    in column form: one list per metric, in the order of `texts`.
+    """
+    try:
+        logger.info(
+            f"Processing batch request: {len(request.texts)} texts, metrics: {request.metrics}"
+        )
+        if not request.texts or not request.metrics:
+            logger.warning("Empty texts or metrics received for batch")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Texts and metrics cannot be empty",
+            )
+        results = await asyncio.to_thread(
+            process_batch_function, request.texts, request.metrics
+        )
+        logger.info("Successfully processed batch request")
+        return {"count": len(request.texts), "results": results}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid batch request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process batch: {str(e)}",
+        )
+
+
+### 📌 TRANSFORM PIPELINE ENDPOINTS ###
+@router.post("/transform", response_model=BasicTextResponse)
+async def transform_text(request: BasicTransformRequest):
+    """
+    Apply a chain of normalization steps to text in one call.
+
+    Supported steps: lowercase, uppercase, remove_punctuation, remove_numbers
+    and remove_extra_whitespace. Steps run in the given order; adjacent
+    deletions are fused into a single pass.
+    """
+    try:
+        logger.info(f"Processing transform request with steps: {request.steps}")
+        if not request.text.strip():
+            logger.warning("Empty text received for transform")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = process_transform_function(request.text, request.steps)
+        logger.info("Successfully processed transform request")
+        return {"result": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid transform request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing transform: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process transform: {str(e)}",
+        )
+
+
+### 📌 APPROXIMATE WORD STATISTICS ENDPOINTS ###
+@router.post(
+    "/approximate-word-stats/text", response_model=BasicApproximateStatsResponse
+)
+async def approximate_word_stats_text(request: BasicApproximateStatsRequest):
+    """
+    Estimate distinct words, most/least repeated words and word frequencies
+    with fixed-memory sketches, reporting the error bound of every estimate.
+    """
+    try:
+        logger.info("Processing approximate_word_stats request for text")
+        if not request.text.strip():
+            logger.warning("Empty text received for approximate_word_stats")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = process_approximate_text_function(
+            request.text, request.top_k, request.words
+        )
+        logger.info("Successfully processed approximate_word_stats for text")
+        return {"result": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid approximate_word_stats request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing approximate_word_stats for text: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post(
+    "/approximate-word-stats/file", response_model=BasicApproximateStatsResponse
+)
+async def approximate_word_stats_file(
+    file: UploadFile = File(...),
+    top_k: int = Query(10, ge=0, le=MAX_TOP_K),
+    words: Optional[List[str]] = Query(None),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Estimate word statistics of a (possibly multi-GB) file in fixed memory.
+
+    The file is streamed through the sketches, so memory does not grow with
+    the size of the document or its vocabulary.
+    """
+    try:
+        logger.info(
+            f"Processing approximate_word_stats request for file: {file.filename}"
+        )
+        if not file:
+            logger.warning("No file received for approximate_word_stats")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_approximate_file_function(
+            file, top_k, words, pdf_backend
+        )
+        logger.info(
+            f"Successfully processed approximate_word_stats for file: {file.filename}"
+        )
+        return {"result": result}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid approximate_word_stats request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing approximate_word_stats for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+### 📌 CORPUS ANALYSIS ENDPOINT ###
+@router.post("/corpus")
+async def analyze_corpus_files(
+    files: List[UploadFile] = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+    top_k: int = 20,
+):
+    """
+    Analyze a corpus uploaded as a ZIP archive and/or several files.
+
+    Documents are analyzed in parallel worker processes. The response is
+    NDJSON: one line per document as soon as it finishes (with an "error"
+    key if it failed), then a final line of type "corpus" with merged word
+    frequencies and overall readability.
+    """
+    try:
+        logger.info(f"Processing corpus request with {len(files)} uploads")
+        if not files:
+            logger.warning("No files received for corpus analysis")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No files provided"
+            )
+        for file in files:
+            name = file.filename.lower()
+            if name.endswith(".zip"):
+                if not zipfile.is_zipfile(file.file):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"{file.filename} is not a valid ZIP archive",
+                    )
+            elif not name.endswith((".pdf", ".docx", ".txt")):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unsupported file type for {file.filename}. Please upload ZIP, PDF, DOCX, or TXT files only.",
+                )
+        uploads = await read_corpus_uploads(files)
+        return StreamingResponse(
+            process_corpus_function(uploads, pdf_backend, top_k),
+            media_type="application/x-ndjson",
+        )
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Error processing corpus: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process corpus: {str(e)}",
+        )
+
+
+### 📌 N-GRAM FREQUENCY ENDPOINTS ###
+@router.post("/ngrams/text", response_model=BasicNgramResponse)
+async def ngrams_text(request: BasicNgramRequest):
+    """
+    Return the top-k most frequent n-grams (phrases) of the text.
+
+    Counting is case-insensitive; with `remove_stopwords`, n-grams that
+    contain a stopword are skipped.
+    """
+    try:
+        logger.info(f"Processing ngrams request for text (n={request.n})")
+        if not request.text.strip():
+            logger.warning("Empty text received for ngrams")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = await asyncio.to_thread(
+            process_ngram_text_function,
+            request.text,
+            request.n,
+            request.top_k,
+            request.remove_stopwords,
+        )
+        logger.info("Successfully processed ngrams for text")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid ngrams request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing ngrams for text: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post("/ngrams/file", response_model=BasicNgramResponse)
+async def ngrams_file(
+    file: UploadFile = File(...),
+    n: int = Query(2, ge=1),
+    top_k: int = Query(10, ge=0, le=MAX_TOP_K),
+    remove_stopwords: bool = False,
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Return the top-k most frequent n-grams of a file, streaming its text.
+    """
+    try:
+        logger.info(f"Processing ngrams request for file: {file.filename} (n={n})")
+        if not file:
+            logger.warning("No file received for ngrams")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_ngram_file_function(
+            file, n, top_k, remove_stopwords, pdf_backend
+        )
+        logger.info(f"Successfully processed ngrams for file: {file.filename}")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid ngrams request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing ngrams for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+### 📌 CONCORDANCE (KEYWORD-IN-CONTEXT) ENDPOINTS ###
+@router.post("/concordance/text", response_model=BasicConcordanceResponse)
+async def concordance_text(request: BasicConcordanceRequest):
+    """
+    Find every occurrence of a term or phrase with `window` words of context.
+
+    The document is indexed once and cached; query it again through
+    GET /basic/concordance/{document_id}.
+    """
+    try:
+        logger.info(f"Processing concordance request for text: {request.query}")
+        if not request.text.strip():
+            logger.warning("Empty text received for concordance")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = await asyncio.to_thread(
+            process_concordance_text_function,
+            request.text,
+            request.query,
+            request.window,
+            request.limit,
+        )
+        logger.info("Successfully processed concordance for text")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid concordance request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing concordance for text: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post("/concordance/file", response_model=BasicConcordanceResponse)
+async def concordance_file(
+    file: UploadFile = File(...),
+    query: str = Query(...),
+    window: int = Query(5, ge=0, le=MAX_CONCORDANCE_WINDOW),
+    limit: int = Query(50, ge=0, le=MAX_TOP_K),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Find every occurrence of a term or phrase in a file, with context.
+
+    The index is cached by the file's content hash, so repeated queries
+    (re-uploads or GET /basic/concordance/{document_id}) skip extraction.
+    """
+    try:
+        logger.info(
+            f"Processing concordance request for file: {file.filename} ({query})"
+        )
+        if not file:
+            logger.warning("No file received for concordance")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_concordance_file_function(
+            file, query, window, limit, pdf_backend
+        )
+        logger.info(f"Successfully processed concordance for file: {file.filename}")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid concordance request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing concordance for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+@router.get("/concordance/{document_id}", response_model=BasicConcordanceResponse)
+async def concordance_lookup(
+    document_id: str,
+    query: str,
+    window: int = Query(5, ge=0, le=MAX_CONCORDANCE_WINDOW),
+    limit: int = Query(50, ge=0, le=MAX_TOP_K),
+):
+    """
+    Query a document indexed by an earlier concordance request.
+    """
+    try:
+        return process_concordance_lookup_function(document_id, query, window, limit)
+    except KeyError:
+        logger.warning(f"Concordance index not found: {document_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not indexed (or evicted); send the text or file again",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+### 📌 BULK (DICTIONARY) REPLACEMENT ENDPOINTS ###
+@router.post("/replace-words/text", response_model=BasicReplaceResponse)
+async def replace_words_text(request: BasicReplaceRequest):
+    """
+    Replace every key of `mapping` with its value in one pass over the text.
+
+    The mapping is compiled into an Aho-Corasick automaton and cached; pass
+    the returned `automaton_id` instead of the mapping to reuse it.
+    Overlapping matches resolve leftmost-longest.
+    """
+    try:
+        logger.info("Processing replace_words request for text")
+        if not request.text.strip():
+            logger.warning("Empty text received for replace_words")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = await asyncio.to_thread(
+            process_replace_text_function,
+            request.text,
+            request.mapping,
+            request.automaton_id,
+            request.whole_words,
+            request.ignore_case,
+        )
+        logger.info(
+            f"Successfully processed replace_words for text ({result['replacements']} replacements)"
+        )
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except KeyError:
+        logger.warning(f"Replacement automaton not found: {request.automaton_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Automaton not found (or evicted); send the mapping again",
+        )
+    except ValueError as e:
+        logger.warning(f"Invalid replace_words request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing replace_words for text: {str(e)}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post("/replace-words/file", response_model=BasicReplaceResponse)
+async def replace_words_file(
+    file: UploadFile = File(...),
+    mapping: Optional[str] = Form(None),
+    automaton_id: Optional[str] = Form(None),
+    whole_words: bool = Form(False),
+    ignore_case: bool = Form(False),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Replace every key of `mapping` (a JSON object) in the text of a file.
+    """
+    try:
+        logger.info(f"Processing replace_words request for file: {file.filename}")
+        if not file:
+            logger.warning("No file received for replace_words")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        if mapping is not None:
+            mapping = json.loads(mapping)
+            if not isinstance(mapping, dict) or not all(
+                isinstance(k, str) and isinstance(v, str) for k, v in mapping.items()
+            ):
+                raise ValueError("mapping must be a JSON object of strings.")
+        result = await process_replace_file_function(
+            file, mapping, automaton_id, whole_words, ignore_case, pdf_backend
+        )
+        logger.info(f"Successfully processed replace_words for file: {file.filename}")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except KeyError:
+        logger.warning(f"Replacement automaton not found: {automaton_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Automaton not found (or evicted); send the mapping again",
+        )
+    except ValueError as e:
+        logger.warning(f"Invalid replace_words request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing replace_words for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+### 📌 NEAR-DUPLICATE DETECTION ENDPOINTS ###
+@router.post("/near-duplicates/index", response_model=BasicNearDuplicateIndexResponse)
+async def near_duplicates_index(
+    files: List[UploadFile] = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Add documents (PDF, DOCX, TXT) to the near-duplicate index.
+
+    Every document is returned with its document_id and the already indexed
+    documents it nearly duplicates (MinHash estimate of the Jaccard
+    similarity of their word shingles).
+    """
+    try:
+        logger.info(f"Processing near-duplicate indexing for {len(files)} files")
+        for file in files:
+            if not file.filename.lower().endswith((".pdf", ".docx", ".txt")):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unsupported file type for {file.filename}. Please upload PDF, DOCX, or TXT files only.",
+                )
+        result = await process_near_duplicate_index_function(files, pdf_backend)
+        logger.info(
+            f"Successfully indexed {len(files)} files ({result['indexed']} documents indexed)"
+        )
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid near-duplicate index request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error indexing near-duplicates: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process files: {str(e)}",
+        )
+
+
+@router.post(
+    "/near-duplicates/query/text", response_model=BasicNearDuplicateQueryResponse
+)
+async def near_duplicates_query_text(request: BasicNearDuplicateQueryRequest):
+    """
+    Find indexed documents similar to a text, most similar first.
+    """
+    try:
+        logger.info("Processing near-duplicate query for text")
+        if not request.text.strip():
+            logger.warning("Empty text received for near-duplicate query")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = process_near_duplicate_text_function(
+            request.text, request.threshold, request.limit
+        )
+        logger.info(
+            f"Successfully processed near-duplicate query ({len(result['similar'])} similar)"
+        )
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid near-duplicate query: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing near-duplicate query for text: {str(e)}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post(
+    "/near-duplicates/query/file", response_model=BasicNearDuplicateQueryResponse
+)
+async def near_duplicates_query_file(
+    file: UploadFile = File(...),
+    threshold: Optional[float] = None,
+    limit: int = Query(10, ge=0, le=MAX_TOP_K),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Find indexed documents similar to a file, without indexing it.
+    """
+    try:
+        logger.info(f"Processing near-duplicate query for file: {file.filename}")
+        if not file:
+            logger.warning("No file received for near-duplicate query")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_near_duplicate_file_function(
+            file, threshold, limit, pdf_backend
+        )
+        logger.info(
+            f"Successfully processed near-duplicate query for file: {file.filename}"
+        )
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid near-duplicate query: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing near-duplicate query for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+### 📌 READABILITY REPORT ENDPOINTS ###
+@router.post("/readability/text", response_model=BasicReadabilityResponse)
+async def readability_text(request: BasicTextRequest):
+    """
+    Compute Flesch Reading Ease, Flesch-Kincaid grade, Gunning Fog, SMOG,
+    Coleman-Liau and ARI for a text in one pass.
+    """
+    try:
+        logger.info("Processing readability report for text")
+        if not request.text.strip():
+            logger.warning("Empty text received for readability report")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = process_readability_text_function(request.text)
+        logger.info("Successfully processed readability report for text")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(
+            f"Error processing readability report for text: {str(e)}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post("/readability/file", response_model=BasicReadabilityResponse)
+async def readability_file(
+    file: UploadFile = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Compute every readability formula for the text of a file.
+    """
+    try:
+        logger.info(f"Processing readability report for file: {file.filename}")
+        if not file:
+            logger.warning("No file received for readability report")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_readability_file_function(file, pdf_backend)
+        logger.info(
+            f"Successfully processed readability report for file: {file.filename}"
+        )
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid readability request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing readability report for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
+
+
+@router.post("/readability/batch", response_model=BasicReadabilityBatchResponse)
+async def readability_batch_text(request: BasicReadabilityBatchRequest):
+    """
+    Compute the readability report of many texts in one call.
+
+    Large batches are spread across worker processes; results are returned
+    in the order of `texts`.
+    """
+    try:
+        logger.info(f"Processing readability batch: {len(request.texts)} texts")
+        if not request.texts:
+            logger.warning("Empty texts received for readability batch")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Texts cannot be empty",
+            )
+        results = await asyncio.to_thread(
+            process_readability_batch_function, request.texts
+        )
+        logger.info("Successfully processed readability batch")
+        return {"count": len(request.texts), "results": results}
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Error processing readability batch: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process batch: {str(e)}",
+        )
+
+
+### 📌 ARROW / PARQUET EXPORT ENDPOINTS ###
+def _export_response(result: dict) -> Response:
+    """Send an exported table as a file download."""
+    return Response(
+        content=result["content"],
+        media_type=result["media_type"],
+        headers={"Content-Disposition": f'attachment; filename="{result["filename"]}"'},
+    )
+
+
+@router.post("/export/text")
+async def export_text(request: BasicExportRequest):
+    """
+    Download word frequencies, the token stream or per-sentence metrics of
+    the text as an Arrow IPC file or a Parquet file.
+    """
+    try:
+        logger.info(
+            f"Processing {request.format} export of {request.table} for text input"
+        )
+        if not request.text.strip():
+            logger.warning("Empty text received for export")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Text cannot be empty",
+            )
+        result = await asyncio.to_thread(
+            process_export_text_function,
+            request.text,
+            request.table,
+            request.format,
+            request.remove_stopwords,
+            request.lowercase,
+        )
+        logger.info("Successfully processed export for text")
+        return _export_response(result)
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid export request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing export for text: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process text: {str(e)}",
+        )
+
+
+@router.post("/export/file")
+async def export_file(
+    file: UploadFile = File(...),
+    table: str = "frequencies",
+    format: str = "arrow",
+    remove_stopwords: bool = False,
+    lowercase: bool = False,
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+):
+    """
+    Download word frequencies, the token stream or per-sentence metrics of
+    a file as an Arrow IPC file or a Parquet file.
+    """
+    try:
+        logger.info(f"Processing {format} export of {table} for file: {file.filename}")
+        if not file:
+            logger.warning("No file received for export")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
+            )
+        result = await process_export_file_function(
+            file, table, format, remove_stopwords, lowercase, pdf_backend
+        )
+        logger.info(f"Successfully processed export for file: {file.filename}")
+        return _export_response(result)
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except ValueError as e:
+        logger.warning(f"Invalid export request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(
+            f"Error processing export for file {file.filename}: {str(e)}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process file: {str(e)}",
+        )
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Optional
 from fastapi import (
     APIRouter,
     UploadFile,
@@ -11,6 +11,7 @@ from fastapi import (
 )
 
 from BackEnd.src.services.rag_bot_service import RAGBotService
+from BackEnd.src.services.basic_service import valid_pdf_backend
 from BackEnd.src.schemas.rag_bot import (
     FileUploadResponse,
     QueryResponse,
@@ -25,9 +26,18 @@ rag_service = RAGBotService()
 
 
 @router.post("/upload", response_model=FileUploadResponse)
-async def upload_files(files: List[UploadFile] = File(...)):
+async def upload_files(
+    files: List[UploadFile] = File(...),
+    pdf_backend: Optional[str] = Depends(valid_pdf_backend),
+    skip_duplicates: bool = False,
+):
     """
-    Upload documents (PDF, DOCX, or TXT) for RAG processing
+    Upload documents (PDF, DOCX, or TXT) for RAG processing.
+
+    `pdf_backend` optionally selects the PDF extraction backend
+    (pypdf2, pypdfium2, pdfminer or pdfplumber). With `skip_duplicates`,
+    files nearly duplicating an already processed file are not embedded
+    again; `duplicates` maps their names to the existing file IDs.
     """
     if not files:
         raise HTTPException(status_code=400, detail="No files provided")
@@ -41,10 +51,13 @@ async def upload_files(files: List[UploadFile] = File(...)):
             )
 
     # Process files
-    result = await rag_service.process_files(files)
+    result = await rag_service.process_files(files, pdf_backend, skip_duplicates)
 
     return FileUploadResponse(
-        status=result["status"], file_ids=result["file_ids"], message=result["message"]
+        status=result["status"],
+        file_ids=result["file_ids"],
+        duplicates=result.get("duplicates", {}),
+        message=result["message"],
     )
 
 
@@ -0,0 +1,109 @@
+from fastapi import APIRouter, HTTPException, status
+from BackEnd.src.schemas.session import (
+    SessionCreateRequest,
+    SessionAppendRequest,
+    SessionMetricsResponse,
+    SessionDeleteResponse,
+)
+from BackEnd.src.services.session_service import SessionService
+import logging
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/sessions", tags=["Analysis Sessions"])
+
+# Singleton service
+session_service = SessionService()
+
+
+def _session_not_found(session_id: str) -> HTTPException:
+    logger.warning(f"Analysis session not found: {session_id}")
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Session '{session_id}' not found",
+    )
+
+
+### 📌 INCREMENTAL ANALYSIS SESSION ENDPOINTS ###
+@router.post("", response_model=SessionMetricsResponse)
+async def create_session(request: SessionCreateRequest):
+    """
+    Start an analysis session for a growing text (transcript, chat log).
+
+    Returns the session id together with the metrics of the initial text.
+    """
+    try:
+        logger.info("Creating analysis session")
+        result = session_service.create_session(request.text)
+        logger.info(f"Created analysis session {result['session_id']}")
+        return result
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(f"Error creating analysis session: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create session: {str(e)}",
+        )
+
+
+@router.post("/{session_id}/append", response_model=SessionMetricsResponse)
+async def append_to_session(session_id: str, request: SessionAppendRequest):
+    """
+    Append text to a session and return the refreshed metrics.
+
+    Only the appended text (and the pending, unfinished sentence) is
+    analyzed, so the cost does not grow with the length of the session.
+    """
+    try:
+        logger.info(f"Appending {len(request.text)} characters to session {session_id}")
+        return session_service.append_text(session_id, request.text)
+    except KeyError:
+        raise _session_not_found(session_id)
+    except HTTPException as http_exc:
+        if http_exc.status_code == 429:
+            logger.warning("Rate limit exceeded")
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded. Please try again after some time.",
+            )
+        raise
+    except Exception as e:
+        logger.error(
+            f"Error appending to session {session_id}: {str(e)}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process session: {str(e)}",
+        )
+
+
+@router.get("/{session_id}", response_model=SessionMetricsResponse)
+async def get_session(session_id: str):
+    """
+    Return the current metrics of a session.
+    """
+    try:
+        return session_service.get_metrics(session_id)
+    except KeyError:
+        raise _session_not_found(session_id)
+
+
+@router.delete("/{session_id}", response_model=SessionDeleteResponse)
+async def delete_session(session_id: str):
+    """
+    Close a session and discard its running totals.
+    """
+    try:
+        session_service.delete_session(session_id)
+    except KeyError:
+        raise _session_not_found(session_id)
+    logger.info(f"Deleted analysis session {session_id}")
+    return {"status": "success", "message": f"Session '{session_id}' deleted"}
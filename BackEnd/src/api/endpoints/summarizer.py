@@ -26,19 +26,27 @@ def format_summary_response(result: Dict) -> Dict:
         return result
 
     # Return only the summary and word count for successful responses
-    return {
+    response = {
         "success": True,
         "summary": result["summary"],
         "word_count": result["word_count"],
     }
 
+    # Summaries reused from a near-duplicate say which document they came from
+    if "duplicate_of" in result:
+        response["duplicate_of"] = result["duplicate_of"]
+        response["similarity"] = result["similarity"]
+    return response
+
 
 @router.post("/text/brief", response_model=SummarizerResponse)
 async def summarize_text_brief(request: TextSummarizerRequest):
     """Generate a brief summary from raw text input."""
     try:
         result = await SummarizerService.summarize_text(
-            input_text=request.input_text, level="brief"
+            input_text=request.input_text,
+            level="brief",
+            skip_duplicates=request.skip_duplicates,
         )
 
         if not result["success"]:
@@ -66,7 +74,9 @@ async def summarize_text_medium(request: TextSummarizerRequest):
     """Generate a medium summary from raw text input."""
     try:
         result = await SummarizerService.summarize_text(
-            input_text=request.input_text, level="medium"
+            input_text=request.input_text,
+            level="medium",
+            skip_duplicates=request.skip_duplicates,
         )
 
         if not result["success"]:
@@ -94,7 +104,9 @@ async def summarize_text_detailed(request: TextSummarizerRequest):
     """Generate a detailed summary from raw text input."""
     try:
         result = await SummarizerService.summarize_text(
-            input_text=request.input_text, level="detailed"
+            input_text=request.input_text,
+            level="detailed",
+            skip_duplicates=request.skip_duplicates,
         )
 
         if not result["success"]:
@@ -118,8 +130,15 @@ async def summarize_text_detailed(request: TextSummarizerRequest):
 
 
 @router.post("/file/brief", response_model=SummarizerResponse)
-async def summarize_file_brief(file: UploadFile = File(...)):
-    """Generate a brief summary from an uploaded file (PDF, DOCX, TXT)."""
+async def summarize_file_brief(
+    file: UploadFile = File(...), skip_duplicates: bool = False
+):
+    """
+    Generate a brief summary from an uploaded file (PDF, DOCX, TXT).
+
+    With `skip_duplicates`, the summary of an already summarized
+    near-duplicate document is returned instead of summarizing again.
+    """
     try:
         # Validate file extension
         file_extension = os.path.splitext(file.filename)[1].lower()
@@ -130,7 +149,10 @@ async def summarize_file_brief(file: UploadFile = File(...)):
             )
 
         result = await SummarizerService.summarize_file(
-            file_content=file.file, filename=file.filename, level="brief"
+            file_content=file.file,
+            filename=file.filename,
+            level="brief",
+            skip_duplicates=skip_duplicates,
         )
 
         if not result["success"]:
@@ -154,8 +176,15 @@ async def summarize_file_brief(file: UploadFile = File(...)):
 
 
 @router.post("/file/medium", response_model=SummarizerResponse)
-async def summarize_file_medium(file: UploadFile = File(...)):
-    """Generate a medium summary from an uploaded file (PDF, DOCX, TXT)."""
+async def summarize_file_medium(
+    file: UploadFile = File(...), skip_duplicates: bool = False
+):
+    """
+    Generate a medium summary from an uploaded file (PDF, DOCX, TXT).
+
+    With `skip_duplicates`, the summary of an already summarized
+    near-duplicate document is returned instead of summarizing again.
+    """
     try:
         # Validate file extension
         file_extension = os.path.splitext(file.filename)[1].lower()
@@ -166,7 +195,10 @@ async def summarize_file_medium(file: UploadFile = File(...)):
             )
 
         result = await SummarizerService.summarize_file(
-            file_content=file.file, filename=file.filename, level="medium"
+            file_content=file.file,
+            filename=file.filename,
+            level="medium",
+            skip_duplicates=skip_duplicates,
         )
 
         if not result["success"]:
@@ -190,8 +222,15 @@ async def summarize_file_medium(file: UploadFile = File(...)):
 
 
 @router.post("/file/detailed", response_model=SummarizerResponse)
-async def summarize_file_detailed(file: UploadFile = File(...)):
-    """Generate a detailed summary from an uploaded file (PDF, DOCX, TXT)."""
+async def summarize_file_detailed(
+    file: UploadFile = File(...), skip_duplicates: bool = False
+):
+    """
+    Generate a detailed summary from an uploaded file (PDF, DOCX, TXT).
+
+    With `skip_duplicates`, the summary of an already summarized
+    near-duplicate document is returned instead of summarizing again.
+    """
     try:
         # Validate file extension
         file_extension = os.path.splitext(file.filename)[1].lower()
@@ -202,7 +241,10 @@ async def summarize_file_detailed(file: UploadFile = File(...)):
             )
 
         result = await SummarizerService.summarize_file(
-            file_content=file.file, filename=file.filename, level="detailed"
+            file_content=file.file,
+            filename=file.filename,
+            level="detailed",
+            skip_duplicates=skip_duplicates,
         )
 
         if not result["success"]:
@@ -16,8 +16,16 @@ from BackEnd.src.api.endpoints import (
     bhasha_bot,
     translation,
     rag_bot,
+    sessions,
 )
 
+from BackEnd.src.services.advanced_service import (
+    load_caches as load_morphology_caches,
+    load_corpus_model,
+    save_corpus_model,
+    save_caches as save_morphology_caches,
+    warmup as warmup_spacy_models,
+)
 from BackEnd.src.utils.logger import logger
 from BackEnd.src.middleware.cors import setup_cors  # Import CORS middleware
 from BackEnd.src.middleware.throttling import (
@@ -26,6 +34,7 @@ from BackEnd.src.middleware.throttling import (
 from BackEnd.src.middleware.rate_limiting import (
     RateLimitMiddleware,
 )  # Import Rate limiting middleware
+import asyncio
 import os
 
 # Create the database tables
@@ -92,6 +101,7 @@ app.include_router(summarizer.router)
 app.include_router(bhasha_bot.router)
 app.include_router(translation.router)
 app.include_router(rag_bot.router)
+app.include_router(sessions.router)
 
 
 # Root endpoint
@@ -110,8 +120,35 @@ async def home():
 async def startup_event():
     logger.info("Starting Bhashasutra API")
 
+    # Load the spaCy models listed in SPACY_WARMUP_MODELS before the first request
+    models = await asyncio.to_thread(warmup_spacy_models)
+    if models:
+        logger.info(f"Loaded spaCy models: {', '.join(models)}")
+
+    # Reload the stem / lemma caches saved by the previous run
+    entries = await asyncio.to_thread(load_morphology_caches)
+    logger.info(f"Loaded {entries} cached stems and lemmas")
+
+    # Reload the corpus TF-IDF model (document frequencies)
+    documents = await asyncio.to_thread(load_corpus_model)
+    logger.info(f"Loaded TF-IDF corpus model with {documents} documents")
+
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down Bhashasutra API")
+
+    # Keep the stem / lemma caches for the next run
+    try:
+        entries = save_morphology_caches()
+        logger.info(f"Saved {entries} cached stems and lemmas")
+    except OSError as e:
+        logger.error(f"Failed to save the stem / lemma caches: {str(e)}")
+
+    # Keep the corpus TF-IDF model for the next run
+    try:
+        documents = save_corpus_model()
+        logger.info(f"Saved TF-IDF corpus model with {documents} documents")
+    except OSError as e:
+        logger.error(f"Failed to save the TF-IDF corpus model: {str(e)}")
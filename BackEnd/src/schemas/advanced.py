@@ -1,7 +1,16 @@
-from typing import List
-from pydantic import BaseModel
+import os
+from typing import Any, Dict, List
+from pydantic import BaseModel, Field
 from fastapi import UploadFile, File
 
+# Limits of a batch NER request: texts per request, texts per nlp.pipe batch
+# and worker processes (never more than the server's CPUs)
+NER_BATCH_MAX_TEXTS = int(os.environ.get("NER_BATCH_MAX_TEXTS", 10_000))
+NER_BATCH_MAX_SIZE = int(os.environ.get("NER_BATCH_MAX_SIZE", 1_000))
+NER_BATCH_MAX_PROCESSES = int(
+    os.environ.get("NER_BATCH_MAX_PROCESSES", os.cpu_count() or 1)
+)
+
 
 # Schema for Text-based Input
 class TextRequest(BaseModel):
@@ -16,3 +25,45 @@ class FileRequest(BaseModel):
 # Generic response schema
 class ProcessResponse(BaseModel):
     result: List[str]
+
+
+# Word token located in the original text (end offset is exclusive)
+class TokenSpan(BaseModel):
+    token: str
+    start: int
+    end: int
+
+
+# Response schema for the corpus TF-IDF model
+class TfidfCorpusResponse(BaseModel):
+    documents: int
+    vocabulary: int
+
+
+# Response schema after adding a document to the TF-IDF corpus
+class TfidfCorpusUpdateResponse(TfidfCorpusResponse):
+    terms: int
+
+
+# Schema for running several functions on one text
+class MultiFunctionRequest(BaseModel):
+    text: str
+    functions: List[str]
+
+
+# Response schema for several functions (function name -> its result)
+class MultiFunctionResponse(BaseModel):
+    results: Dict[str, Any]
+
+
+# Schema for batch named entity recognition (results are streamed as NDJSON)
+class NERBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=NER_BATCH_MAX_TEXTS)
+    batch_size: int = Field(64, ge=1, le=NER_BATCH_MAX_SIZE)
+    n_process: int = Field(1, ge=1, le=NER_BATCH_MAX_PROCESSES)
+
+
+# Response schema for word spans
+class WordSpansResponse(BaseModel):
+    count: int
+    spans: List[TokenSpan]
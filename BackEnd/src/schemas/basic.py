@@ -1,5 +1,16 @@
 # Basic NLP schemas
-from pydantic import BaseModel
+import os
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+# Texts accepted by one batch request (same limit as the NER batch API)
+BATCH_MAX_TEXTS = int(os.environ.get("BATCH_MAX_TEXTS", 10_000))
+
+# Largest number of ranked items (n-grams, words, matches) a request may ask for
+MAX_TOP_K = int(os.environ.get("MAX_TOP_K", 1000))
+
+# Largest number of context words on each side of a concordance line
+MAX_CONCORDANCE_WINDOW = int(os.environ.get("MAX_CONCORDANCE_WINDOW", 100))
 
 class BasicTextRequest(BaseModel):
     text: str
@@ -9,3 +20,128 @@ class BasicTextResponse(BaseModel):
 
 class BasicFileResponse(BaseModel):
     result: str
+
+class BasicBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_TEXTS)
+    metrics: List[str]
+
+class BasicBatchResponse(BaseModel):
+    count: int
+    results: Dict[str, List[Any]]
+
+class BasicTransformRequest(BaseModel):
+    text: str
+    steps: List[str]
+
+class BasicApproximateStatsRequest(BaseModel):
+    text: str
+    top_k: int = Field(10, ge=0, le=MAX_TOP_K)
+    words: Optional[List[str]] = None
+
+class BasicApproximateStatsResponse(BaseModel):
+    result: Dict[str, Any]
+
+class BasicNgramRequest(BaseModel):
+    text: str
+    n: int = Field(2, ge=1)
+    top_k: int = Field(10, ge=0, le=MAX_TOP_K)
+    remove_stopwords: bool = False
+
+class NgramFrequency(BaseModel):
+    ngram: str
+    count: int
+
+class BasicNgramResponse(BaseModel):
+    n: int
+    total: int
+    distinct: int
+    ngrams: List[NgramFrequency]
+
+class BasicConcordanceRequest(BaseModel):
+    text: str
+    query: str
+    window: int = Field(5, ge=0, le=MAX_CONCORDANCE_WINDOW)
+    limit: int = Field(50, ge=0, le=MAX_TOP_K)
+
+class ConcordanceLine(BaseModel):
+    position: int
+    offset: int
+    left: str
+    match: str
+    right: str
+
+class BasicConcordanceResponse(BaseModel):
+    document_id: str
+    query: str
+    total: int
+    results: List[ConcordanceLine]
+
+class BasicReplaceRequest(BaseModel):
+    text: str
+    mapping: Optional[Dict[str, str]] = None
+    automaton_id: Optional[str] = None
+    whole_words: bool = False
+    ignore_case: bool = False
+
+class BasicReplaceResponse(BaseModel):
+    automaton_id: str
+    replacements: int
+    result: str
+
+class SimilarDocument(BaseModel):
+    document_id: str
+    filename: Optional[str] = None
+    similarity: float
+
+class IndexedDocument(BaseModel):
+    document_id: str
+    filename: str
+    duplicates: List[SimilarDocument]
+
+class BasicNearDuplicateIndexResponse(BaseModel):
+    indexed: int
+    documents: List[IndexedDocument]
+
+class BasicNearDuplicateQueryRequest(BaseModel):
+    text: str
+    threshold: Optional[float] = None
+    limit: int = Field(10, ge=0, le=MAX_TOP_K)
+
+class BasicNearDuplicateQueryResponse(BaseModel):
+    similar: List[SimilarDocument]
+
+class FleschReadingEase(BaseModel):
+    score: float
+    interpretation: str
+
+class ReadabilityCounts(BaseModel):
+    words: int
+    sentences: int
+    syllables: int
+    polysyllables: int
+    complex_words: int
+    letters: int
+    characters: int
+
+class BasicReadabilityResponse(BaseModel):
+    flesch_reading_ease: FleschReadingEase
+    flesch_kincaid_grade: float
+    gunning_fog: float
+    smog_index: float
+    coleman_liau_index: float
+    automated_readability_index: float
+    counts: ReadabilityCounts
+
+class BasicReadabilityBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_TEXTS)
+
+class BasicReadabilityBatchResponse(BaseModel):
+    count: int
+    results: List[BasicReadabilityResponse]
+
+class BasicExportRequest(BaseModel):
+    text: str
+    table: str = "frequencies"  # frequencies, tokens or sentences
+    format: str = "arrow"  # arrow (IPC file) or parquet
+    remove_stopwords: bool = False
+    lowercase: bool = False
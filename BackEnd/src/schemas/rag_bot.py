@@ -1,7 +1,7 @@
 # BackEnd/src/schemas/rag_bot.py
 
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class FileUploadResponse(BaseModel):
@@ -9,6 +9,7 @@ class FileUploadResponse(BaseModel):
 
     status: str
     file_ids: List[str]
+    duplicates: Dict[str, str] = {}
     message: str
 
 
@@ -0,0 +1,67 @@
+# Incremental analysis session schemas
+from pydantic import BaseModel
+from typing import List
+
+
+class SessionCreateRequest(BaseModel):
+    """Request model for starting a session"""
+
+    text: str = ""
+
+
+class SessionAppendRequest(BaseModel):
+    """Request model for appending text to a session"""
+
+    text: str
+
+
+class MostRepeatedWord(BaseModel):
+    word: str
+    count: int
+
+
+class Readability(BaseModel):
+    score: float
+    interpretation: str
+
+
+class SentenceSentiment(BaseModel):
+    text: str
+    sentiment: str
+    polarity: float
+    subjectivity: float
+
+
+class SessionSentiment(BaseModel):
+    sentiment: str
+    polarity: float
+    subjectivity: float
+    positive_sentences: int
+    negative_sentences: int
+    neutral_sentences: int
+
+
+class SessionMetricsResponse(BaseModel):
+    """Running metrics of a session"""
+
+    session_id: str
+    characters: int
+    word_count: int
+    unique_words: int
+    punctuation_count: int
+    sentence_count: int
+    average_word_length: float
+    average_sentence_length: float
+    most_repeated_word: MostRepeatedWord
+    proper_noun_count: int
+    readability: Readability
+    sentiment: SessionSentiment
+    pending_text: str
+    new_sentences: List[SentenceSentiment]
+
+
+class SessionDeleteResponse(BaseModel):
+    """Response model for session deletion"""
+
+    status: str
+    message: str
@@ -4,6 +4,7 @@ from typing import Optional, Dict, List, Any, Union
 
 class TextSummarizerRequest(BaseModel):
     input_text: str
+    skip_duplicates: bool = False
 
     class Config:
         json_schema_extra = {
@@ -17,6 +18,8 @@ class SummarizerResponse(BaseModel):
     success: bool
     summary: Optional[str] = None
     word_count: Optional[Dict[str, int]] = None
+    duplicate_of: Optional[str] = None
+    similarity: Optional[float] = None
 
     class Config:
         json_schema_extra = {
@@ -1,7 +1,9 @@
 import sys
 import os
-import shutil
+import json
+from typing import Any, Dict, Iterator, List
 from fastapi import UploadFile
+from BackEnd.src.utils.logger import logger
 
 # 🔹 Dynamically add 'Functions/' to Python's path
 sys.path.append(
@@ -9,7 +11,18 @@ sys.path.append(
 )
 
 # ✅ Now import `Advanced` AFTER modifying sys.path
-from advanced import Advanced  # Import Advanced class from Functions/advanced.py
+from advanced import (  # Import Advanced class from Functions/advanced.py
+    Advanced,
+    iter_named_entities,
+)
+from spacy_registry import warmup  # Preloads the shared spaCy models at startup
+from morphology import load_caches, save_caches  # Persisted stem / lemma caches
+from tfidf_model import (  # Persisted corpus TF-IDF model
+    corpus_model,
+    load_corpus_model,
+    save_corpus_model,
+    save_corpus_model_throttled,
+)
 
 
 ### 📌 FUNCTION TO PROCESS TEXT ###
@@ -17,9 +30,14 @@ def process_text_function(text: str, function: str) -> str:
     """
     Process text based on the requested function.
     """
-    advanced_instance = Advanced(text)
+    return apply_function(Advanced(text), function)
 
-    function_mapping = {
+
+def _function_mapping(advanced_instance: Advanced) -> Dict:
+    """
+    Map every function name to the matching method of an Advanced instance.
+    """
+    return {
         "word_tokenizer": advanced_instance.word_tokenizer,
         "sentence_tokenizer": advanced_instance.sentence_tokenizer,
         "remove_stopwords": advanced_instance.remove_stopwords,
@@ -31,32 +49,105 @@ def process_text_function(text: str, function: str) -> str:
         "spell_check_and_grammar": advanced_instance.spell_check_and_grammar,
         "named_entity_recognition": advanced_instance.named_entity_recognition,
         "topic_modeling": advanced_instance.topic_modeling,
+        "word_spans": advanced_instance.word_spans,
     }
 
+
+def apply_function(advanced_instance: Advanced, function: str) -> str:
+    """
+    Apply the requested function to an existing Advanced instance.
+    """
+    function_mapping = _function_mapping(advanced_instance)
     return function_mapping.get(function, lambda: "Invalid function")()
 
 
+### 📌 FUNCTION TO RUN SEVERAL FUNCTIONS ON ONE TEXT ###
+def process_multiple_function(text: str, functions: List[str]) -> Dict[str, Any]:
+    """
+    Apply several functions to one text.
+
+    They share one Advanced instance, so intermediate stages (tokens,
+    stopword-filtered words, stems, ...) are computed only once.
+    """
+    advanced_instance = Advanced(text)
+    function_mapping = _function_mapping(advanced_instance)
+    unknown = [function for function in functions if function not in function_mapping]
+    if unknown:
+        raise ValueError(f"Unknown functions: {', '.join(unknown)}")
+    return {function: function_mapping[function]() for function in functions}
+
+
 ### 📌 FUNCTION TO PROCESS FILE ###
 async def process_file_function(file: UploadFile, function: str) -> str:
     """
     Process a file, extract its text, and apply the function.
+
+    The text is extracted straight from the upload's buffer, so nothing is
+    copied to disk.
+    """
+    try:
+        advanced_instance = Advanced(file.file, file_type=file.filename)
+        return apply_function(advanced_instance, function)
+    except Exception as e:
+        return f"Error processing file: {str(e)}"
+
+
+### 📌 FUNCTIONS FOR THE CORPUS TF-IDF MODEL ###
+def process_tfidf_corpus_text_function(text: str) -> Dict[str, int]:
+    """
+    Add raw text to the TF-IDF corpus (document frequencies are updated in
+    place; nothing is refitted). Text without any term is rejected.
     """
-    file_path = f"temp/{file.filename}"
+    result = Advanced(text).add_to_tfidf_corpus()
+    _save_tfidf_corpus()
+    return result
 
-    # 🔹 Ensure temp directory exists
-    os.makedirs("temp", exist_ok=True)
 
-    # 🔹 Save file temporarily
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+async def process_tfidf_corpus_file_function(file: UploadFile) -> Dict[str, int]:
+    """
+    Add the text of a file upload to the TF-IDF corpus. A file whose text
+    cannot be extracted (or has no term) is rejected.
+    """
+    result = Advanced(file.file, file_type=file.filename).add_to_tfidf_corpus()
+    _save_tfidf_corpus()
+    return result
+
 
+def _save_tfidf_corpus():
+    """
+    Persist the corpus after an update (at most every TFIDF_SAVE_INTERVAL
+    seconds); a failed save is retried with the next update or at shutdown.
+    """
     try:
-        advanced_instance = Advanced(file_path)  # Extract text
-        extracted_text = advanced_instance.text
-        return process_text_function(extracted_text, function)
-    except Exception as e:
-        return f"Error processing file: {str(e)}"
-    finally:
-        # 🔹 Cleanup temp file
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        save_corpus_model_throttled()
+    except OSError as e:
+        logger.error(f"Failed to save the TF-IDF corpus model: {str(e)}")
+
+
+def process_tfidf_corpus_stats_function() -> Dict[str, int]:
+    """
+    Report the size of the TF-IDF corpus.
+    """
+    return {
+        "documents": corpus_model.documents,
+        "vocabulary": corpus_model.vocabulary_size,
+    }
+
+
+### 📌 FUNCTION FOR BATCH NAMED ENTITY RECOGNITION ###
+def process_ner_batch_function(
+    texts: List[str], batch_size: int, n_process: int
+) -> Iterator[str]:
+    """
+    Run NER over many texts with spaCy's nlp.pipe.
+
+    Arguments are validated before anything is streamed. Yields one NDJSON
+    line per text, in input order, as soon as its batch is done.
+    """
+    if not texts:
+        raise ValueError("At least one text is required.")
+    entities = iter_named_entities(texts, batch_size, n_process)
+    return (
+        json.dumps({"index": index, "entities": document}, ensure_ascii=False) + "\n"
+        for index, document in enumerate(entities)
+    )
@@ -1,14 +1,81 @@
 import sys
 import os
-import shutil
-from fastapi import UploadFile
+import io
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+from fastapi import HTTPException, UploadFile, status
 
 # 🔹 Dynamically add Functions/ to Python's path
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../Functions"))
 )
 
-from basic import Basic  # Import Basic class from Functions/basic.py
+from basic import (  # Import Basic class from Functions/basic.py
+    Basic,
+    analyze_batch,
+    compile_transforms,
+    count_ngrams,
+    get_stopwords,
+    iter_document_chunks,
+    iter_words,
+    normalize_file_type,
+    readability_batch,
+    stream_count_words,
+    stream_count_punctuation,
+    stream_count_unique_words,
+)
+from sketches import sketch_words
+from corpus import analyze_corpus, iter_zip_documents
+from concordance import document_key, get_cached_index, get_or_build_index
+from replacement import compile_replacements, get_cached_automaton
+from near_duplicates import NearDuplicateIndex, minhash_signature
+from export import EXPORT_FORMATS, export_table
+from pdf_backends import get_pdf_backend
+
+
+### 📌 DEPENDENCY VALIDATING THE PDF BACKEND ###
+def valid_pdf_backend(pdf_backend: Optional[str] = None) -> Optional[str]:
+    """
+    Reject an unknown `pdf_backend` query parameter with 400 before the
+    upload is read (otherwise a typo silently extracts no text).
+    """
+    if pdf_backend is not None:
+        try:
+            get_pdf_backend(pdf_backend)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return pdf_backend
+
+
+# 🔹 Counting functions that can run over a streamed file without loading it
+COUNT_MESSAGES = {
+    "count_words": "The text contains {} words.",
+    "count_punctuation": "The text contains {} punctuation marks.",
+    "count_unique_words": "The text contains {} unique words.",
+}
+STREAMING_FUNCTIONS = {
+    "count_words": stream_count_words,
+    "count_punctuation": stream_count_punctuation,
+    "count_unique_words": stream_count_unique_words,
+}
+
+
+# 🔹 Messages for the opt-in approximate (fixed-memory sketch) mode
+APPROXIMATE_FUNCTIONS = {
+    "count_unique_words": lambda report: "The text contains approximately {} unique words (±{:.1%}).".format(
+        report["unique_words"]["estimate"], report["unique_words"]["relative_error"]
+    ),
+    "most_repeated_word": lambda report: (
+        "The most repeated word is approximately '{word}' which appears about {count} times (overcount ≤ {max_overcount}).".format(
+            **report["most_repeated_words"][0]
+        )
+        if report["most_repeated_words"]
+        else "The most repeated word is 'None' which appears 0 times."
+    ),
+    "least_repeated_word": lambda report: "A least repeated word is approximately '{word}' which appears about {count} times (overcount ≤ {max_overcount}).".format(
+        **report["least_repeated_word"]
+    ),
+}
 
 
 ### 📌 FUNCTION TO PROCESS TEXT INPUT ###
@@ -16,13 +83,44 @@ def process_text_function(text: str, function: str) -> str:
     """
     Process raw text based on the requested function.
     """
-    basic_instance = Basic(text)
+    return apply_function(Basic(text), function)
+
+
+def apply_function(basic_instance: Basic, function: str) -> str:
+    """
+    Apply the requested function to an existing Basic instance.
+
+    Every metric is computed once; repeated values come from the instance's
+    cached statistics instead of rescanning the text.
+    """
+
+    def most_repeated_word():
+        word, count = basic_instance.show_most_repeated_word()
+        return f"The most repeated word is '{word}' which appears {count} times."
+
+    def least_repeated_word():
+        word, count = basic_instance.show_least_repeated_word()
+        return f"The least repeated word is '{word}' which appears {count} times."
+
+    def extract_proper_nouns():
+        proper_nouns = basic_instance.extract_proper_nouns()
+        if not proper_nouns:
+            return "No proper nouns found in the text."
+        return f"Found {len(proper_nouns)} potential proper nouns: {', '.join(proper_nouns)}"
+
+    def readability_score():
+        readability = basic_instance.readability_score()
+        return f" Reading Ease Score: {readability['score']} - {readability['interpretation']} (Higher scores indicate easier readability)"
 
     function_mapping = {
-        "count_words": lambda: f"The text contains {basic_instance.count_words()} words.",
-        "count_punctuation": lambda: f"The text contains {basic_instance.count_punctuation()} punctuation marks.",
-        "most_repeated_word": lambda: f"The most repeated word is '{basic_instance.show_most_repeated_word()[0]}' which appears {basic_instance.show_most_repeated_word()[1]} times.",
-        "least_repeated_word": lambda: f"The least repeated word is '{basic_instance.show_least_repeated_word()[0]}' which appears {basic_instance.show_least_repeated_word()[1]} times.",
+        "count_words": lambda: COUNT_MESSAGES["count_words"].format(
+            basic_instance.count_words()
+        ),
+        "count_punctuation": lambda: COUNT_MESSAGES["count_punctuation"].format(
+            basic_instance.count_punctuation()
+        ),
+        "most_repeated_word": most_repeated_word,
+        "least_repeated_word": least_repeated_word,
         "to_lower": lambda: f'Text converted to lowercase: "{basic_instance.convert_to_lowercase()}"',
         "to_upper": lambda: f'Text converted to uppercase: "{basic_instance.convert_to_uppercase()}"',
         "remove_punctuation": lambda: f'Text with punctuation removed: "{basic_instance.remove_punctuation()}"',
@@ -31,40 +129,478 @@ def process_text_function(text: str, function: str) -> str:
         "find_average_word_length": lambda: f"The average word length is {basic_instance.find_average_word_length():.2f} characters.",
         "find_average_sentence_length": lambda: f"The average sentence length is {basic_instance.find_average_sentence_length():.2f} words.",
         "reverse_text": lambda: f'Reversed text: "{basic_instance.reverse_text()}"',
-        "count_unique_words": lambda: f"The text contains {basic_instance.count_unique_words()} unique words.",
-        "extract_proper_nouns": lambda: (
-            f"Found {len(basic_instance.extract_proper_nouns())} potential proper nouns: {', '.join(basic_instance.extract_proper_nouns())}"
-            if basic_instance.extract_proper_nouns()
-            else "No proper nouns found in the text."
+        "count_unique_words": lambda: COUNT_MESSAGES["count_unique_words"].format(
+            basic_instance.count_unique_words()
         ),
-        "readability_score": lambda: f" Reading Ease Score: {basic_instance.readability_score()['score']} - {basic_instance.readability_score()['interpretation']} (Higher scores indicate easier readability)",
+        "extract_proper_nouns": extract_proper_nouns,
+        "readability_score": readability_score,
     }
 
     result = function_mapping.get(function, lambda: "Invalid function")()
     return result
 
 
-### 📌 FUNCTION TO PROCESS FILE UPLOAD ###
-async def process_file_function(file: UploadFile, function: str) -> str:
+### 📌 FUNCTION TO PROCESS A BATCH OF TEXTS ###
+def process_batch_function(texts: List[str], metrics: List[str]) -> Dict[str, list]:
     """
-    Process a file upload, extract its text, and apply a function.
+    Compute the requested metrics for every text of a batch.
+
+    Large batches are spread across worker processes; results come back in
+    column form (metric -> list of values in input order).
+    """
+    return analyze_batch(texts, metrics)
+
+
+### 📌 FUNCTIONS FOR THE READABILITY REPORT ###
+def process_readability_text_function(text: str) -> Dict:
+    """
+    Compute every readability formula for raw text.
+    """
+    return Basic(text).readability_report()
+
+
+async def process_readability_file_function(
+    file: UploadFile, pdf_backend: Optional[str] = None
+) -> Dict:
+    """
+    Compute every readability formula for the text of a file upload.
     """
-    file_path = f"temp/{file.filename}"
+    basic_instance = Basic(file.file, file_type=file.filename, pdf_backend=pdf_backend)
+    return basic_instance.readability_report()
 
-    # 🔹 Ensure temp directory exists
-    os.makedirs("temp", exist_ok=True)
 
-    # 🔹 Save file temporarily
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+def process_readability_batch_function(texts: List[str]) -> List[Dict]:
+    """
+    Compute the readability report of every text of a batch.
+
+    Large batches are spread across worker processes (see analyze_batch).
+    """
+    return readability_batch(texts)
+
+
+### 📌 FUNCTIONS FOR ARROW / PARQUET EXPORTS ###
+def _export(
+    basic_instance: Basic,
+    name: str,
+    table: str,
+    export_format: str,
+    remove_stopwords: bool,
+    lowercase: bool,
+) -> Dict:
+    """
+    Serialize an export table, returning its content, media type and filename.
+
+    The content is a memoryview over the Arrow buffer, so the file is sent
+    without another copy.
+    """
+    buffer = export_table(
+        basic_instance, table, export_format, remove_stopwords, lowercase
+    )
+    media_type, extension = EXPORT_FORMATS[export_format]
+    return {
+        "content": memoryview(buffer),
+        "media_type": media_type,
+        "filename": f"{os.path.splitext(name)[0]}_{table}{extension}",
+    }
+
+
+def process_export_text_function(
+    text: str,
+    table: str,
+    export_format: str,
+    remove_stopwords: bool = False,
+    lowercase: bool = False,
+) -> Dict:
+    """
+    Export word frequencies, tokens or sentence metrics of raw text.
+    """
+    return _export(
+        Basic(text), "text", table, export_format, remove_stopwords, lowercase
+    )
+
+
+async def process_export_file_function(
+    file: UploadFile,
+    table: str,
+    export_format: str,
+    remove_stopwords: bool = False,
+    lowercase: bool = False,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Export word frequencies, tokens or sentence metrics of a file upload.
+    """
+    basic_instance = Basic(file.file, file_type=file.filename, pdf_backend=pdf_backend)
+    return _export(
+        basic_instance,
+        os.path.basename(file.filename),
+        table,
+        export_format,
+        remove_stopwords,
+        lowercase,
+    )
+
+
+### 📌 FUNCTION TO APPLY A TRANSFORM PIPELINE ###
+def process_transform_function(text: str, steps: List[str]) -> str:
+    """
+    Apply an ordered list of normalization steps to raw text.
+
+    The steps are compiled into one fused pipeline (cached per step list),
+    so the text is walked once per pass instead of once per step.
+    """
+    return compile_transforms(steps)(text.strip())
+
+
+### 📌 FUNCTIONS FOR APPROXIMATE WORD STATISTICS ###
+def process_approximate_text_function(
+    text: str, top_k: int = 10, words: Optional[List[str]] = None
+) -> Dict:
+    """
+    Estimate word statistics of raw text with fixed-memory sketches.
+    """
+    return sketch_words(iter_words([text])).report(top_k, words)
+
+
+async def process_approximate_file_function(
+    file: UploadFile,
+    top_k: int = 10,
+    words: Optional[List[str]] = None,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Estimate word statistics of a file upload with fixed-memory sketches.
+
+    The document is streamed chunk by chunk, so memory stays bounded by the
+    sketch sizes however large the vocabulary is.
+    """
+    chunks = iter_document_chunks(
+        file.file, file_type=file.filename, pdf_backend=pdf_backend
+    )
+    return sketch_words(iter_words(chunks)).report(top_k, words)
+
+
+### 📌 FUNCTIONS FOR N-GRAM FREQUENCIES ###
+def _ngram_result(words, n: int, top_k: int, remove_stopwords: bool) -> Dict:
+    stop_words = get_stopwords() if remove_stopwords else None
+    counts = count_ngrams(words, n, stop_words)
+    return {
+        "n": n,
+        "total": counts.total,
+        "distinct": len(counts),
+        "ngrams": [
+            {"ngram": phrase, "count": count} for phrase, count in counts.top(top_k)
+        ],
+    }
+
+
+def process_ngram_text_function(
+    text: str, n: int = 2, top_k: int = 10, remove_stopwords: bool = False
+) -> Dict:
+    """
+    Compute the top-k n-grams of raw text.
+    """
+    return _ngram_result(iter_words([text]), n, top_k, remove_stopwords)
+
+
+async def process_ngram_file_function(
+    file: UploadFile,
+    n: int = 2,
+    top_k: int = 10,
+    remove_stopwords: bool = False,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Compute the top-k n-grams of a file upload, streaming its text.
+    """
+    chunks = iter_document_chunks(
+        file.file, file_type=file.filename, pdf_backend=pdf_backend
+    )
+    return _ngram_result(iter_words(chunks), n, top_k, remove_stopwords)
 
+
+### 📌 FUNCTIONS FOR CONCORDANCE (KWIC) SEARCH ###
+def process_concordance_text_function(
+    text: str, query: str, window: int = 5, limit: int = 50
+) -> Dict:
+    """
+    Search raw text for a term or phrase and return it in context.
+
+    The document index is cached by content hash; the returned document_id
+    can be used to query the same document again without resending it.
+    """
+    text = text.strip()
+    key = document_key(text)
+    index = get_or_build_index(key, lambda: text)
+    return {"document_id": key, "query": query, **index.search(query, window, limit)}
+
+
+async def process_concordance_file_function(
+    file: UploadFile,
+    query: str,
+    window: int = 5,
+    limit: int = 50,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Search a file upload for a term or phrase and return it in context.
+
+    The index is cached by a hash of the raw upload, so re-uploading the same
+    file skips text extraction as well as indexing.
+    """
+    content = await file.read()
+    key = document_key(content, normalize_file_type(file.filename), pdf_backend or "")
+    index = get_or_build_index(
+        key,
+        lambda: Basic(content, file_type=file.filename, pdf_backend=pdf_backend).text,
+    )
+    return {"document_id": key, "query": query, **index.search(query, window, limit)}
+
+
+def process_concordance_lookup_function(
+    document_id: str, query: str, window: int = 5, limit: int = 50
+) -> Dict:
+    """
+    Query a previously indexed document by its document_id.
+
+    Raises:
+        KeyError: If the document is not (or no longer) cached.
+    """
+    index = get_cached_index(document_id)
+    if index is None:
+        raise KeyError(document_id)
+    return {
+        "document_id": document_id,
+        "query": query,
+        **index.search(query, window, limit),
+    }
+
+
+### 📌 FUNCTIONS FOR BULK (DICTIONARY) REPLACEMENT ###
+def _get_replacement_automaton(
+    mapping: Optional[Dict[str, str]],
+    automaton_id: Optional[str],
+    whole_words: bool,
+    ignore_case: bool,
+):
+    """
+    Compile (or fetch the cached) automaton for a mapping or an automaton_id.
+
+    Raises:
+        KeyError: If automaton_id is not (or no longer) cached.
+        ValueError: If neither a mapping nor an automaton_id is given.
+    """
+    if mapping:
+        return compile_replacements(mapping, whole_words, ignore_case)
+    if automaton_id:
+        automaton = get_cached_automaton(automaton_id)
+        if automaton is None:
+            raise KeyError(automaton_id)
+        return automaton_id, automaton
+    raise ValueError("Either a mapping or an automaton_id is required.")
+
+
+def process_replace_text_function(
+    text: str,
+    mapping: Optional[Dict[str, str]] = None,
+    automaton_id: Optional[str] = None,
+    whole_words: bool = False,
+    ignore_case: bool = False,
+) -> Dict:
+    """
+    Apply a whole replacement mapping to raw text in one pass.
+
+    The returned automaton_id can replace the mapping in later requests.
+    """
+    key, automaton = _get_replacement_automaton(
+        mapping, automaton_id, whole_words, ignore_case
+    )
+    result, replacements = automaton.replace(text.strip())
+    return {"automaton_id": key, "replacements": replacements, "result": result}
+
+
+async def process_replace_file_function(
+    file: UploadFile,
+    mapping: Optional[Dict[str, str]] = None,
+    automaton_id: Optional[str] = None,
+    whole_words: bool = False,
+    ignore_case: bool = False,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Apply a whole replacement mapping to the text of a file upload.
+    """
+    key, automaton = _get_replacement_automaton(
+        mapping, automaton_id, whole_words, ignore_case
+    )
+    text = Basic(file.file, file_type=file.filename, pdf_backend=pdf_backend).text
+    result, replacements = automaton.replace(text)
+    return {"automaton_id": key, "replacements": replacements, "result": result}
+
+
+### 📌 FUNCTIONS FOR NEAR-DUPLICATE DETECTION ###
+# 🔹 MinHash/LSH index of the documents uploaded to /basic/near-duplicates
+near_duplicate_index = NearDuplicateIndex()
+
+
+def _similar_documents(matches: List[Dict]) -> List[Dict]:
+    return [
+        {
+            "document_id": match["document_id"],
+            "filename": match["metadata"].get("filename"),
+            "similarity": match["similarity"],
+        }
+        for match in matches
+    ]
+
+
+def _check_threshold(threshold: Optional[float]):
+    if threshold is not None and not 0 <= threshold <= 1:
+        raise ValueError("Threshold must be between 0 and 1.")
+
+
+async def process_near_duplicate_index_function(
+    files: List[UploadFile], pdf_backend: Optional[str] = None
+) -> Dict:
+    """
+    Add uploaded documents to the near-duplicate index.
+
+    Each document is reported with the already indexed documents it nearly
+    duplicates. Its document_id is the hash of its content, so re-indexing
+    the same file replaces its entry. Every file is read and fingerprinted
+    before any is indexed, so a file that fails leaves the index unchanged.
+    """
+    signatures = []
+    for file in files:
+        content = await file.read()
+        key = document_key(
+            content, normalize_file_type(file.filename), pdf_backend or ""
+        )
+        basic_instance = Basic(
+            content, file_type=file.filename, pdf_backend=pdf_backend
+        )
+        signatures.append((file, key, basic_instance.minhash_signature()))
+
+    documents = []
+    for file, key, signature in signatures:
+        matches = near_duplicate_index.query(signature, exclude=key)
+        near_duplicate_index.add(key, signature, {"filename": file.filename})
+        documents.append(
+            {
+                "document_id": key,
+                "filename": file.filename,
+                "duplicates": _similar_documents(matches),
+            }
+        )
+    return {"indexed": len(near_duplicate_index), "documents": documents}
+
+
+def process_near_duplicate_text_function(
+    text: str, threshold: Optional[float] = None, limit: int = 10
+) -> Dict:
+    """
+    Find indexed documents similar to raw text.
+    """
+    _check_threshold(threshold)
+    matches = near_duplicate_index.query(minhash_signature(text), threshold, limit)
+    return {"similar": _similar_documents(matches)}
+
+
+async def process_near_duplicate_file_function(
+    file: UploadFile,
+    threshold: Optional[float] = None,
+    limit: int = 10,
+    pdf_backend: Optional[str] = None,
+) -> Dict:
+    """
+    Find indexed documents similar to a file upload (not indexed itself).
+    """
+    _check_threshold(threshold)
+    basic_instance = Basic(file.file, file_type=file.filename, pdf_backend=pdf_backend)
+    matches = near_duplicate_index.query(
+        basic_instance.minhash_signature(), threshold, limit
+    )
+    return {"similar": _similar_documents(matches)}
+
+
+### 📌 FUNCTIONS FOR CORPUS (MULTI-FILE / ZIP) ANALYSIS ###
+async def read_corpus_uploads(files: List[UploadFile]) -> List[Tuple[str, bytes]]:
+    """
+    Read every upload of a corpus request into memory.
+
+    Must be awaited before the response is built: uploaded files are closed
+    once the endpoint returns, before a streamed body is iterated.
+    """
+    uploads = []
+    for file in files:
+        await file.seek(0)
+        uploads.append((file.filename, await file.read()))
+    return uploads
+
+
+def _iter_uploaded_documents(uploads: List[Tuple[str, bytes]]):
+    """
+    Yield (name, content) for every document of the upload, expanding ZIPs.
+    """
+    for filename, content in uploads:
+        if filename.lower().endswith(".zip"):
+            yield from iter_zip_documents(io.BytesIO(content))
+        else:
+            yield filename, content
+
+
+def process_corpus_function(
+    uploads: List[Tuple[str, bytes]],
+    pdf_backend: Optional[str] = None,
+    top_k: int = 20,
+) -> Iterator[str]:
+    """
+    Analyze every uploaded document in parallel worker processes.
+
+    `uploads` are (filename, content) pairs from read_corpus_uploads. Yields
+    one NDJSON line per document as soon as it finishes, followed by a final
+    line with the corpus-level aggregates.
+    """
+    documents = _iter_uploaded_documents(uploads)
+    for record in analyze_corpus(documents, pdf_backend=pdf_backend, top_k=top_k):
+        yield json.dumps(record) + "\n"
+
+
+### 📌 FUNCTION TO PROCESS FILE UPLOAD ###
+async def process_file_function(
+    file: UploadFile,
+    function: str,
+    pdf_backend: Optional[str] = None,
+    approximate: bool = False,
+) -> str:
+    """
+    Process a file upload, extract its text, and apply a function.
+
+    The text is extracted straight from the upload's buffer, so nothing is
+    copied to disk. `pdf_backend` selects the PDF extraction backend for
+    this request; the configured PDF_BACKEND is used when it is omitted.
+    With `approximate`, word statistics that support it are estimated with
+    fixed-memory sketches instead of exact counters.
+    """
     try:
-        basic_instance = Basic(file_path)  # Extract text from file
-        extracted_text = basic_instance.text
-        return process_text_function(extracted_text, function)
+        # 🔹 Approximate mode streams the file into fixed-size sketches
+        if approximate and function in APPROXIMATE_FUNCTIONS:
+            report = await process_approximate_file_function(
+                file, pdf_backend=pdf_backend
+            )
+            return APPROXIMATE_FUNCTIONS[function](report)
+
+        # 🔹 Counting functions stream the file page by page / chunk by chunk
+        if function in STREAMING_FUNCTIONS:
+            chunks = iter_document_chunks(
+                file.file, file_type=file.filename, pdf_backend=pdf_backend
+            )
+            count = STREAMING_FUNCTIONS[function](chunks)
+            return COUNT_MESSAGES[function].format(count)
+
+        basic_instance = Basic(
+            file.file, file_type=file.filename, pdf_backend=pdf_backend
+        )  # Extract text from the upload
+        return apply_function(basic_instance, function)
     except Exception as e:
         return f"Error processing file: {str(e)}"
-    finally:
-        # 🔹 Cleanup: Delete the temporary file
-        if os.path.exists(file_path):
-            os.remove(file_path)
@@ -1,17 +1,18 @@
+import io
 import os
+import sys
 import shutil
 import logging
 import asyncio
 from pathlib import Path
 import uuid
-from typing import List, Dict, Any
-import tempfile
+from typing import List, Dict, Any, Optional
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import ConversationalRetrievalChain
 from langchain.memory import ConversationBufferMemory
-from langchain_community.document_loaders import PyPDFLoader, Docx2txtLoader, TextLoader
+from langchain_core.documents import Document
 from langchain_community.vectorstores import FAISS
 from langchain_core.prompts import (
     ChatPromptTemplate,
@@ -23,6 +24,15 @@ from langchain_community.embeddings import HuggingFaceEmbeddings
 
 from BackEnd.src.core.config import settings
 
+# 🔹 Add `Functions/` to Python's path for the shared document extraction
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../Functions"))
+)
+
+from basic import iter_docx_paragraphs, iter_txt_chunks
+from near_duplicates import NearDuplicateIndex, minhash_signature
+from pdf_backends import get_pdf_backend
+
 logger = logging.getLogger("rag_bot")
 
 
@@ -57,6 +67,9 @@ class RAGBotService:
             # File tracking
             self.processed_files = {}
 
+            # MinHash/LSH index of processed files, to skip near-duplicates
+            self.duplicate_index = NearDuplicateIndex()
+
             # System prompt
             self.system_prompt = """You are a helpful AI assistant specializing in information retrieval.
             Answer the user's question based on the provided context. If the information isn't in the context,
@@ -68,51 +81,88 @@ class RAGBotService:
             logger.error(f"Failed to initialize RAGBotService: {str(e)}")
             raise
 
-    async def process_files(self, files: List[Any]) -> Dict[str, Any]:
-        """Process uploaded files and create embeddings"""
+    async def process_files(
+        self,
+        files: List[Any],
+        pdf_backend: Optional[str] = None,
+        skip_duplicates: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Process uploaded files and create embeddings
+
+        With skip_duplicates, files that nearly duplicate an already processed
+        file are not embedded again; the existing file's ID is returned.
+        Files are only recorded (and indexed for duplicates) once the vector
+        store update succeeds, so a failed call can simply be retried.
+        """
         try:
             file_ids = []
             all_docs = []
+            duplicates = {}
+            new_files = []  # (file_id, filename, signature) recorded on success
+            # Files of this call, so duplicates within the upload are skipped too
+            batch_index = NearDuplicateIndex(
+                self.duplicate_index.threshold, self.duplicate_index.num_perm
+            )
 
             for file in files:
                 # Create a unique ID for the file
                 file_id = str(uuid.uuid4())
 
-                # Create temp file
+                # Keep the upload in memory instead of copying it to a temp file
                 suffix = self._get_file_extension(file.filename)
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=suffix
-                ) as temp_file:
-                    temp_file.write(await file.read())
-                    temp_path = temp_file.name
+                content = await file.read()
 
                 # Process file based on type
-                docs = await asyncio.to_thread(self._load_documents, temp_path, suffix)
-
-                # Store file information
-                self.processed_files[file_id] = {
-                    "filename": file.filename,
-                    "path": temp_path,
-                }
-
+                docs = await asyncio.to_thread(
+                    self._load_documents, content, file.filename, suffix, pdf_backend
+                )
+                signature = await asyncio.to_thread(self._get_signature, docs)
+
+                # Skip files already embedded (or nearly so)
+                if skip_duplicates and signature is not None:
+                    match = self.duplicate_index.find_duplicate(
+                        signature
+                    ) or batch_index.find_duplicate(signature)
+                    if match:
+                        logger.info(
+                            f"Skipping {file.filename}: near-duplicate of {match['document_id']}"
+                        )
+                        duplicates[file.filename] = match["document_id"]
+                        file_ids.append(match["document_id"])
+                        continue
+
+                if signature is not None:
+                    batch_index.add(file_id, signature, {"filename": file.filename})
+                new_files.append((file_id, file.filename, signature))
                 file_ids.append(file_id)
                 all_docs.extend(docs)
 
             # Split documents
             splits = self.text_splitter.split_documents(all_docs)
 
-            # Create or update vector store
-            if self.vector_store is None:
+            # Create or update vector store (unless every file was skipped)
+            if splits and self.vector_store is None:
                 self.vector_store = await asyncio.to_thread(
                     FAISS.from_documents, splits, self.embeddings
                 )
-            else:
+            elif splits:
                 await asyncio.to_thread(self.vector_store.add_documents, splits)
 
+            # Store file information
+            for file_id, filename, signature in new_files:
+                self.processed_files[file_id] = {"filename": filename}
+                if signature is not None:
+                    self.duplicate_index.add(file_id, signature, {"filename": filename})
+
+            message = f"Successfully processed {len(files) - len(duplicates)} files"
+            if duplicates:
+                message += f" ({len(duplicates)} near-duplicates skipped)"
             return {
                 "status": "success",
                 "file_ids": file_ids,
-                "message": f"Successfully processed {len(files)} files",
+                "duplicates": duplicates,
+                "message": message,
             }
 
         except Exception as e:
@@ -123,25 +173,46 @@ class RAGBotService:
                 "message": f"Error processing files: {str(e)}",
             }
 
+    def _get_signature(self, docs: List[Any]) -> Optional[Any]:
+        """MinHash signature of a file's documents (None if it has no words)"""
+        try:
+            return minhash_signature("\n".join(doc.page_content for doc in docs))
+        except ValueError:
+            return None
+
     def _get_file_extension(self, filename: str) -> str:
         """Get file extension from filename"""
         return os.path.splitext(filename)[1].lower()
 
-    def _load_documents(self, file_path: str, suffix: str) -> List[Any]:
-        """Load documents based on file type"""
+    def _load_documents(
+        self,
+        content: bytes,
+        filename: str,
+        suffix: str,
+        pdf_backend: Optional[str] = None,
+    ) -> List[Any]:
+        """Load documents from an uploaded file's content based on file type"""
         try:
             if suffix == ".pdf":
-                loader = PyPDFLoader(file_path)
+                # One document per page, like PyPDFLoader, via the shared backends
+                backend = get_pdf_backend(pdf_backend)
+                return [
+                    Document(
+                        page_content=text, metadata={"source": filename, "page": page}
+                    )
+                    for page, text in enumerate(backend.iter_pages(io.BytesIO(content)))
+                ]
             elif suffix in [".docx", ".doc"]:
-                loader = Docx2txtLoader(file_path)
+                # Keep paragraph breaks so the text splitter can use them
+                text = "\n\n".join(iter_docx_paragraphs(io.BytesIO(content)))
             elif suffix == ".txt":
-                loader = TextLoader(file_path)
+                text = "".join(iter_txt_chunks(io.BytesIO(content)))
             else:
                 raise ValueError(f"Unsupported file type: {suffix}")
 
-            return loader.load()
+            return [Document(page_content=text, metadata={"source": filename})]
         except Exception as e:
-            logger.error(f"Error loading document {file_path}: {str(e)}")
+            logger.error(f"Error loading document {filename}: {str(e)}")
             raise
 
     async def get_response(self, query: str) -> Dict[str, Any]:
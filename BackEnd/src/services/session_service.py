@@ -0,0 +1,67 @@
+import sys
+import os
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict
+
+# 🔹 Dynamically add Functions/ to Python's path
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../Functions"))
+)
+
+from analysis_session import AnalysisSession
+
+# 🔹 Sessions kept in memory; the least recently used one is evicted beyond this
+MAX_ANALYSIS_SESSIONS = int(os.environ.get("MAX_ANALYSIS_SESSIONS", 1000))
+
+
+class SessionService:
+    """Service holding the incremental analysis sessions, keyed by session id"""
+
+    def __init__(self, max_sessions: int = MAX_ANALYSIS_SESSIONS):
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()
+
+    def create_session(self, text: str = "") -> Dict[str, Any]:
+        """
+        Start a new session, optionally seeded with text.
+        """
+        session_id = str(uuid.uuid4())
+        session = AnalysisSession()
+        metrics = session.append(text)
+        self.sessions[session_id] = session
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+        return {"session_id": session_id, **metrics}
+
+    def _get_session(self, session_id: str) -> AnalysisSession:
+        """
+        Look up a session and mark it as recently used.
+
+        Raises:
+            KeyError: If the session does not exist (or was evicted).
+        """
+        session = self.sessions[session_id]
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def append_text(self, session_id: str, text: str) -> Dict[str, Any]:
+        """
+        Append text to a session and return its refreshed metrics.
+        """
+        return {"session_id": session_id, **self._get_session(session_id).append(text)}
+
+    def get_metrics(self, session_id: str) -> Dict[str, Any]:
+        """
+        Return the current metrics of a session.
+        """
+        return {"session_id": session_id, **self._get_session(session_id).metrics()}
+
+    def delete_session(self, session_id: str) -> None:
+        """
+        Drop a session and its running totals.
+
+        Raises:
+            KeyError: If the session does not exist.
+        """
+        del self.sessions[session_id]
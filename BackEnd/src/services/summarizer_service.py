@@ -1,9 +1,18 @@
 import os
-import tempfile
+import sys
 from typing import Dict, Any, Optional, BinaryIO
+from Functions.basic import Basic
 from Functions.text_summarizer import TextSummarizer
 from BackEnd.src.utils.logger import get_logger
 
+# 🔹 Add `Functions/` to Python's path for the shared near-duplicate index
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../Functions"))
+)
+
+from concordance import document_key
+from near_duplicates import NearDuplicateIndex
+
 # Set up logger
 logger = get_logger(__name__)
 
@@ -11,34 +20,88 @@ logger = get_logger(__name__)
 class SummarizerService:
     """Service for text summarization operations"""
 
+    # 🔹 MinHash/LSH index of summarized documents, with their summaries per level
+    summary_index = NearDuplicateIndex()
+
     @staticmethod
-    async def summarize_text(input_text: str, level: str) -> Dict[str, Any]:
+    def _summarize(
+        basic: Basic, level: str, skip_duplicates: bool = False
+    ) -> Dict[str, Any]:
         """
-        Summarize raw text input using TextSummarizer class
+        Summarize extracted text, reusing the summary of a near-duplicate.
 
         Args:
-            input_text: Text content to summarize
+            basic: Basic instance holding the extracted text
             level: Level of summary detail ('brief', 'medium', or 'detailed')
+            skip_duplicates: Return the stored summary of an already
+                summarized near-duplicate instead of summarizing again
 
         Returns:
             Dict containing summarization results and metadata
         """
+        document_id = document_key(basic.text)
         try:
-            # Create summarizer instance with raw text
-            summarizer = TextSummarizer(input_text)
+            signature = basic.minhash_signature()
+        except ValueError:
+            signature = None  # No words: nothing to compare
+
+        if skip_duplicates and signature is not None:
+            for match in SummarizerService.summary_index.query(signature):
+                summary_result = match["metadata"].get(level)
+                if summary_result is not None:
+                    logger.info(
+                        f"Skipping summarization: near-duplicate of {match['document_id']}"
+                    )
+                    return {
+                        **summary_result,
+                        "duplicate_of": match["document_id"],
+                        "similarity": match["similarity"],
+                    }
+
+        # Create summarizer instance from the already extracted text
+        summarizer = TextSummarizer(basic)
+
+        # Check if text meets minimum word count requirement
+        if not summarizer.has_enough_words:
+            words_needed = summarizer.min_word_count - summarizer.word_count
+            return {
+                "success": False,
+                "error": f"Text is too short for summarization. Current word count is {summarizer.word_count}. Need {words_needed} more words to reach minimum of {summarizer.min_word_count}.",
+            }
+
+        # Generate summary
+        summary_result = summarizer.summarize(level)
+
+        # Remember the summary so near-duplicates can skip summarization
+        if summary_result.get("success") and signature is not None:
+            summaries = {}
+            if document_id in SummarizerService.summary_index:
+                summaries = SummarizerService.summary_index.get_metadata(document_id)
+            SummarizerService.summary_index.add(
+                document_id, signature, {**summaries, level: summary_result}
+            )
+
+        return summary_result
 
-            # Check if text meets minimum word count requirement
-            if not summarizer.has_enough_words:
-                words_needed = summarizer.min_word_count - summarizer.word_count
-                return {
-                    "success": False,
-                    "error": f"Text is too short for summarization. Current word count is {summarizer.word_count}. Need {words_needed} more words to reach minimum of {summarizer.min_word_count}.",
-                }
+    @staticmethod
+    async def summarize_text(
+        input_text: str, level: str, skip_duplicates: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Summarize raw text input using TextSummarizer class
 
-            # Generate summary
-            summary_result = summarizer.summarize(level)
+        Args:
+            input_text: Text content to summarize
+            level: Level of summary detail ('brief', 'medium', or 'detailed')
+            skip_duplicates: Reuse the summary of a near-duplicate text
 
-            return summary_result
+        Returns:
+            Dict containing summarization results and metadata
+        """
+        try:
+            return SummarizerService._summarize(
+                Basic.from_text(input_text), level, skip_duplicates
+            )
 
         except Exception as e:
             logger.error(f"Error in text summarizer service: {str(e)}")
@@ -46,7 +109,10 @@ class SummarizerService:
 
     @staticmethod
     async def summarize_file(
-        file_content: BinaryIO, filename: str, level: str
+        file_content: BinaryIO,
+        filename: str,
+        level: str,
+        skip_duplicates: bool = False,
     ) -> Dict[str, Any]:
         """
         Summarize uploaded file content using TextSummarizer class
@@ -55,48 +121,17 @@ class SummarizerService:
             file_content: Binary content of the uploaded file
             filename: Name of the uploaded file
             level: Level of summary detail ('brief', 'medium', or 'detailed')
+            skip_duplicates: Reuse the summary of a near-duplicate document
 
         Returns:
             Dict containing summarization results and metadata
         """
-        temp_file = None
-        temp_path = None
         try:
-            # Create a temporary file to store the uploaded content
-            temp_fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1])
-            temp_file = os.fdopen(temp_fd, "wb")
-
-            # Save uploaded content to temporary file
-            file_content.seek(0)
-            content = file_content.read()
-            temp_file.write(content)
-            temp_file.close()
-
-            # Create summarizer instance with file path
-            summarizer = TextSummarizer(temp_path)
-
-            # Check if text meets minimum word count requirement
-            if not summarizer.has_enough_words:
-                words_needed = summarizer.min_word_count - summarizer.word_count
-                return {
-                    "success": False,
-                    "error": f"Text is too short for summarization. Current word count is {summarizer.word_count}. Need {words_needed} more words to reach minimum of {summarizer.min_word_count}.",
-                }
-
-            # Generate summary
-            summary_result = summarizer.summarize(level)
-
-            # Clean up the temporary file
-            os.unlink(temp_path)
-
-            return summary_result
+            # Extract the text straight from the uploaded content
+            return SummarizerService._summarize(
+                Basic(file_content, file_type=filename), level, skip_duplicates
+            )
 
         except Exception as e:
             logger.error(f"Error in file summarizer service: {str(e)}")
-            # Clean up temporary file if it exists
-            if temp_file:
-                temp_file.close()
-            if temp_path and os.path.exists(temp_path):
-                os.unlink(temp_path)
-
             return {"success": False, "error": f"File summarization failed: {str(e)}"}
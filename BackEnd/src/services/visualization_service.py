@@ -1,7 +1,6 @@
 # src/services/visualization_service.py
 
 import os
-import tempfile
 from fastapi import UploadFile
 from Functions.text_visualization import TextVisualization
 
@@ -43,13 +42,9 @@ class VisualizationService:
         Returns:
             Dictionary with success status, message, and image URL
         """
-        temp_file_path = None
         try:
-            # Save uploaded file to temp directory
-            temp_file_path = await VisualizationService._save_upload_file(file)
-
-            # Initialize text visualization with file path
-            visualizer = TextVisualization(temp_file_path)
+            # Initialize text visualization straight from the uploaded content
+            visualizer = TextVisualization(file.file, filename=file.filename)
 
             # Use the process method with the appropriate choice number
             visualizer.process(choice)
@@ -101,30 +96,3 @@ class VisualizationService:
                 "success": False,
                 "message": f"Error generating visualization: {str(e)}",
             }
-        finally:
-            # Clean up temp file
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-
-    @staticmethod
-    async def _save_upload_file(file: UploadFile) -> str:
-        """Save an upload file to a temporary file and return the path"""
-        # Create temp directory if it doesn't exist
-        temp_dir = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            "temp",
-        )
-        os.makedirs(temp_dir, exist_ok=True)
-
-        # Create temp file with original filename to maintain filename consistency
-        temp_file_path = os.path.join(temp_dir, file.filename)
-
-        # Write file content to temp file
-        with open(temp_file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-            await file.seek(0)  # Reset file pointer for future reads
-
-        return temp_file_path
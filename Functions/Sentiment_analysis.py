@@ -13,15 +13,19 @@ class Sentiment:
     Sentiment analysis class that analyzes the emotional tone of text.
     Now works with both file-based input and raw text.
     """
-    def __init__(self, input_data):
+    def __init__(self, input_data, file_type=None):
         """
-        Initialize the Sentiment class with either a file path or raw text.
+        Initialize the Sentiment class with a file path, an in-memory document
+        or raw text.
         
         Args:
-            input_data (str): A file path (PDF, DOCX, TXT) or raw text.
+            input_data (str, bytes, memoryview or file-like): A file path
+                (PDF, DOCX, TXT), the document's bytes / binary stream, or raw text.
+            file_type (str, optional): Declared document type ("pdf", ".docx",
+                "notes.txt"). Required for in-memory documents.
         """
         # Initialize Basic class for text extraction and preprocessing
-        self.basic = Basic(input_data)
+        self.basic = Basic(input_data, file_type=file_type)
         
         # Get the processed text - works for both file and raw text
         self.text = self.basic.text
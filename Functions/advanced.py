@@ -2,19 +2,15 @@ import sys
 import os
 import re
 import string
-import pandas as pd
+from functools import cached_property
 from textblob import TextBlob
 from langdetect import detect  # Language detection
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer, WordNetLemmatizer
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.text_rank import TextRankSummarizer
 import nltk
-import spacy
 
 # Download necessary NLTK data if not already downloaded
 try:
@@ -36,7 +32,117 @@ except LookupError:
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 # ✅ Now import `Basic` AFTER modifying sys.path (Same as Basic in basic_service.py)
-from basic import Basic  # Import Basic from Functions/basic.py
+from basic import Basic, get_stopwords  # Import Basic from Functions/basic.py
+from morphology import lemmatize_words, stem_words
+from spacy_registry import (
+    SPACY_BATCH_SIZE,
+    SPACY_N_PROCESS,
+    get_nlp,
+    iter_entity_spans,
+    process,
+)
+from tfidf_model import corpus_model
+from tokenizer import split_sentences
+
+# Full names of spaCy's abbreviated entity labels
+ENTITY_TYPE_NAMES = {
+    "PERSON": "PERSON",
+    "NORP": "NATIONALITY, RELIGIOUS, OR POLITICAL GROUP",
+    "FAC": "FACILITY (buildings, airports, highways, bridges, etc.)",
+    "ORG": "ORGANIZATION (companies, agencies, institutions, etc.)",
+    "GPE": "GEOPOLITICAL ENTITY (countries, cities, states)",
+    "LOC": "LOCATION (non-GPE locations, mountain ranges, bodies of water)",
+    "PRODUCT": "PRODUCT (objects, vehicles, foods, etc. - not services)",
+    "WORK_OF_ART": "WORK OF ART (titles of books, songs, etc.)",
+    "LAW": "LAW (named documents made into laws)",
+    "LANGUAGE": "LANGUAGE (any named language)",
+    "DATE": "DATE (absolute or relative dates or periods)",
+    "TIME": "TIME (times smaller than a day)",
+    "PERCENT": "PERCENT (percentage, including “%”)",
+    "MONEY": "MONEY (monetary values, including unit)",
+    "QUANTITY": "QUANTITY (measurements, as of weight or distance)",
+    "ORDINAL": "ORDINAL NUMBER (first, second, etc.)",
+    "CARDINAL": "CARDINAL NUMBER (numerals that do not fall under another type)",
+    "EVENT": "EVENT (named hurricanes, battles, sports events, etc.)",
+}
+
+
+class Preprocessing:
+    """
+    Lazily computed, memoized preprocessing stages of a single text.
+
+    Each stage is built on first use from the stages it depends on (see
+    STAGES) and then kept, so requesting several outputs of one document
+    tokenizes it once, filters its stopwords once, and so on.
+    """
+
+    # Stage -> stages it is computed from
+    STAGES = {
+        "tokens": (),
+        "words": ("tokens",),
+        "content_tokens": ("tokens",),
+        "content_words": ("content_tokens",),
+        "stems": ("content_words",),
+        "lemmas": ("content_words",),
+        "terms": ("content_words",),
+        "sentences": (),
+    }
+
+    def __init__(self, basic):
+        """
+        Args:
+            basic (Basic): Basic instance holding the extracted text.
+        """
+        self.basic = basic
+
+    @cached_property
+    def tokens(self):
+        """TokenSpans: Word tokens of the original text, as offsets."""
+        return self.basic.token_spans()
+
+    @cached_property
+    def words(self):
+        """list: Lowercase word tokens."""
+        return self.tokens.to_list(lowercase=True)
+
+    @cached_property
+    def content_tokens(self):
+        """TokenSpans: Word tokens that are not stopwords."""
+        return self.tokens.without(get_stopwords())
+
+    @cached_property
+    def content_words(self):
+        """list: Lowercase word tokens without stopwords."""
+        return self.content_tokens.to_list(lowercase=True)
+
+    @cached_property
+    def stems(self):
+        """list: Porter stem of every content word (once per word type)."""
+        return stem_words(self.content_words)
+
+    @cached_property
+    def lemmas(self):
+        """list: WordNet lemma of every content word (once per word type)."""
+        return lemmatize_words(self.content_words)
+
+    @cached_property
+    def terms(self):
+        """list: TF-IDF terms (content words of two or more characters)."""
+        return [word for word in self.content_words if len(word) > 1]
+
+    @cached_property
+    def sentences(self):
+        """list: Sentences with their terminating punctuation."""
+        return split_sentences(self.basic.text, keep_terminators=True)
+
+    def computed(self):
+        """
+        List the stages computed so far.
+
+        Returns:
+            list: Stage names, in STAGES order.
+        """
+        return [stage for stage in self.STAGES if stage in self.__dict__]
 
 
 class Advanced:
@@ -45,28 +151,23 @@ class Advanced:
     Provides NLP capabilities like tokenization, stemming, lemmatization,
     TF-IDF analysis, and text summarization.
 
-    This class works with both file paths and raw text inputs.
+    This class works with file paths, in-memory documents and raw text inputs.
     """
 
-    def __init__(self, input_data):
+    def __init__(self, input_data, file_type=None):
         """
-        Initialize the Advanced class with either a file path or raw text.
+        Initialize the Advanced class with a file path, an in-memory document
+        or raw text.
 
         Args:
-            input_data (str): A file path (PDF, DOCX, TXT) or raw text.
+            input_data (str, bytes, memoryview or file-like): A file path
+                (PDF, DOCX, TXT), the document's bytes / binary stream, or
+                raw text.
+            file_type (str, optional): Declared document type ("pdf",
+                ".docx", "notes.txt"). Required for in-memory documents.
         """
-        # Initialize basic spaCy model for NER
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Download the model if not already downloaded
-            import subprocess
-
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-
         # Initialize the Basic class which handles text extraction
-        self.basic = Basic(input_data)  # Supports both file and raw text
+        self.basic = Basic(input_data, file_type=file_type)  # File, bytes or text
 
         # Import basic functions to maintain interface compatibility
         self.count_words = self.basic.count_words
@@ -77,30 +178,67 @@ class Advanced:
         self.convert_to_uppercase = self.basic.convert_to_uppercase
         self.remove_punctuation = self.basic.remove_punctuation
 
-        # Pre-process the text for advanced operations (lowercase and no punctuation)
+        # Tokens are offsets into the original text; every preprocessing
+        # stage is computed once, on first use, and shared by all methods
         self.text = self.basic.text
-        self.processed_text = self.remove_punctuation(
-            self.convert_to_lowercase(self.text)
-        )
+        self.stages = Preprocessing(self.basic)
+
+    @property
+    def nlp(self):
+        """Language: Shared spaCy pipeline (loaded once per process, on first use)."""
+        return get_nlp()
+
+    @cached_property
+    def processed_text(self):
+        """str: Lowercased, punctuation-free copy of the text (built on first use)."""
+        return self.remove_punctuation(self.convert_to_lowercase(self.text))
+
+    @property
+    def tokens(self):
+        """TokenSpans: Word tokens of the original text, as offsets."""
+        return self.stages.tokens
+
+    def content_tokens(self):
+        """
+        Word tokens that are not stopwords, as offsets into the text.
+
+        Returns:
+            TokenSpans: Spans of the remaining tokens.
+        """
+        return self.stages.content_tokens
 
     def word_tokenizer(self):
         """
-        Split text into individual words using NLTK word tokenizer.
+        Split text into individual words using the script-aware tokenizer
+        (keeps Devanagari, Bengali, Tamil, ... words and their matras intact).
+
+        Returns:
+            list: List of individual (lowercase) word tokens
+        """
+        return list(self.stages.words)
+
+    def word_spans(self):
+        """
+        Locate every word token in the original text (e.g. for highlighting).
 
         Returns:
-            list: List of individual word tokens
+            list: Dicts with the token and its start / end character offsets
         """
-        return word_tokenize(self.processed_text)
+        return [
+            {"token": token, "start": start, "end": end}
+            for token, (start, end) in zip(self.tokens, self.tokens.spans())
+        ]
 
     def sentence_tokenizer(self):
         """
-        Split text into sentences using NLTK sentence tokenizer.
+        Split text into sentences at ., !, ?, the danda (।) and other
+        sentence terminators.
 
         Returns:
             list: List of sentences
         """
         # Use original text to maintain sentence structure with punctuation
-        return sent_tokenize(self.text)
+        return list(self.stages.sentences)
 
     def remove_stopwords(self):
         """
@@ -109,9 +247,7 @@ class Advanced:
         Returns:
             list: List of tokens with stopwords removed
         """
-        tokens = word_tokenize(self.processed_text)
-        stop_words = set(stopwords.words("english"))
-        return [word for word in tokens if word not in stop_words]
+        return list(self.stages.content_words)
 
     def perform_stemming(self):
         """
@@ -121,9 +257,7 @@ class Advanced:
         Returns:
             list: List of stemmed words
         """
-        tokens = self.remove_stopwords()
-        stemmer = PorterStemmer()
-        return [stemmer.stem(word) for word in tokens]
+        return list(self.stages.stems)
 
     def perform_lemmatization(self):
         """
@@ -134,9 +268,7 @@ class Advanced:
         Returns:
             list: List of lemmatized words
         """
-        tokens = self.remove_stopwords()
-        lemmatizer = WordNetLemmatizer()
-        return [lemmatizer.lemmatize(word) for word in tokens]
+        return list(self.stages.lemmas)
 
     def pos_tagging(self):
         """
@@ -146,7 +278,7 @@ class Advanced:
         Returns:
             list: List of (word, tag) tuples
         """
-        tokens = word_tokenize(self.processed_text)
+        tokens = self.stages.words
         if not tokens:
             return ["No tokens available for POS tagging."]
 
@@ -170,30 +302,45 @@ class Advanced:
             tagged_words.append((word, tag))
         return tagged_words
 
-    def tfidf_vectorization(self):
+    def tfidf_vectorization(self, top_k=10):
         """
         Calculate TF-IDF (Term Frequency-Inverse Document Frequency) scores.
         Identifies most important words in the text based on their frequency
-        and uniqueness.
+        in the text and their rarity in the document corpus (see
+        add_to_tfidf_corpus). With an empty corpus every IDF is equal.
+
+        Args:
+            top_k (int): Number of words to return
 
         Returns:
             dict: Dictionary containing top words and their TF-IDF scores
         """
-        tokens = self.remove_stopwords()
-        if not tokens:
+        terms = self.stages.terms
+        if not terms:
             return "No valid words available for TF-IDF vectorization."
 
-        preprocessed_text = " ".join(tokens)
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform([preprocessed_text])
-        df = pd.DataFrame(
-            tfidf_matrix.toarray(), columns=vectorizer.get_feature_names_out()
-        )
-        top_words = df.T.sort_values(by=0, ascending=False).head(10)
+        top_words = corpus_model.score(terms, top_k)
+        return {
+            "Top TF-IDF Words": [word for word, _ in top_words],
+            "TF-IDF Scores": [score for _, score in top_words],
+        }
+
+    def add_to_tfidf_corpus(self):
+        """
+        Add the text to the process-wide TF-IDF corpus (updates document
+        frequencies in place, no refitting).
+
+        Returns:
+            dict: Distinct terms added and the corpus size afterwards
 
+        Raises:
+            ValueError: If the text has no terms (e.g. only stopwords).
+        """
+        terms = corpus_model.add_document(self.stages.terms)
         return {
-            "Top TF-IDF Words": top_words.index.tolist(),
-            "TF-IDF Scores": top_words[0].tolist(),
+            "terms": terms,
+            "documents": corpus_model.documents,
+            "vocabulary": corpus_model.vocabulary_size,
         }
 
     def text_summarization(self):
@@ -323,35 +470,13 @@ class Advanced:
             list: List of (entity_text, entity_type) tuples with full entity type names
         """
         try:
-            # Define mapping from spaCy's abbreviated tags to full forms
-            entity_type_mapping = {
-                "PERSON": "PERSON",
-                "NORP": "NATIONALITY, RELIGIOUS, OR POLITICAL GROUP",
-                "FAC": "FACILITY (buildings, airports, highways, bridges, etc.)",
-                "ORG": "ORGANIZATION (companies, agencies, institutions, etc.)",
-                "GPE": "GEOPOLITICAL ENTITY (countries, cities, states)",
-                "LOC": "LOCATION (non-GPE locations, mountain ranges, bodies of water)",
-                "PRODUCT": "PRODUCT (objects, vehicles, foods, etc. - not services)",
-                "EVENT": "EVENT (named hurricanes, battles, wars, sports events, etc.)",
-                "WORK_OF_ART": "WORK OF ART (titles of books, songs, etc.)",
-                "LAW": "LAW (named documents made into laws)",
-                "LANGUAGE": "LANGUAGE (any named language)",
-                "DATE": "DATE (absolute or relative dates or periods)",
-                "TIME": "TIME (times smaller than a day)",
-                "PERCENT": "PERCENT (percentage, including “%”)",
-                "MONEY": "MONEY (monetary values, including unit)",
-                "QUANTITY": "QUANTITY (measurements, as of weight or distance)",
-                "ORDINAL": "ORDINAL NUMBER (first, second, etc.)",
-                "CARDINAL": "CARDINAL NUMBER (numerals that do not fall under another type)",
-                "EVENT": "EVENT (named hurricanes, battles, sports events, etc.)",
-            }
-
-            # Use original text for better entity recognition
-            doc = self.nlp(self.text)
+            # Use original text for better entity recognition; only the NER
+            # component of the shared pipeline runs
+            doc = process(self.text, "ner")
 
             # Extract entities with their full type names
             entities = [
-                (ent.text, entity_type_mapping.get(ent.label_, ent.label_))
+                (ent.text, ENTITY_TYPE_NAMES.get(ent.label_, ent.label_))
                 for ent in doc.ents
             ]
 
@@ -375,7 +500,7 @@ class Advanced:
         """
         try:
             # Create cleaned text without stopwords for better topic modeling
-            tokens = self.remove_stopwords()
+            tokens = self.stages.content_words
             cleaned_text = " ".join(tokens)
 
             # Check if there's enough text for topic modeling
@@ -436,5 +561,43 @@ class Advanced:
             "9": self.spell_check_and_grammar,
             "10": self.named_entity_recognition,
             "11": self.topic_modeling,
+            "12": self.word_spans,
         }
         return options.get(choice, lambda: "Invalid choice")()
+
+
+def iter_named_entities(texts, batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS):
+    """
+    Extract named entities from many texts with batched spaCy processing.
+
+    The pipeline is loaded and the arguments are checked right away; the
+    texts themselves are processed lazily, batch by batch. With n_process
+    > 1 batches run in the shared process pool (see iter_entity_spans).
+
+    Args:
+        texts (iterable): Texts to analyze.
+        batch_size (int): Texts per nlp.pipe batch.
+        n_process (int): Worker processes running the pipeline.
+
+    Returns:
+        iterator: For each text, in input order, a list of dicts with the
+            entity text, its label, the label's full name and its
+            character offsets.
+
+    Raises:
+        ValueError: If batch_size or n_process is smaller than 1.
+    """
+    documents = iter_entity_spans(texts, batch_size=batch_size, n_process=n_process)
+    return (
+        [
+            {
+                "text": text,
+                "label": label,
+                "type": ENTITY_TYPE_NAMES.get(label, label),
+                "start": start,
+                "end": end,
+            }
+            for text, label, start, end in entities
+        ]
+        for entities in documents
+    )
@@ -0,0 +1,215 @@
+import os
+import sys
+from collections import Counter
+from textblob import TextBlob
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from basic import count_syllables, flesch_reading_ease
+from tokenizer import (
+    count_punctuation_marks,
+    find_proper_nouns,
+    last_sentence_end,
+    split_sentences,
+    tokenize,
+)
+
+
+def sentiment_category(polarity):
+    """
+    Map a polarity score to a sentiment label.
+
+    Args:
+        polarity (float): Score from -1 (negative) to 1 (positive).
+
+    Returns:
+        str: 'Positive', 'Negative', or 'Neutral'.
+    """
+    return "Positive" if polarity > 0 else "Negative" if polarity < 0 else "Neutral"
+
+
+class AnalysisSession:
+    """
+    Appendable analysis of a growing text (live transcripts, chat logs).
+
+    Only running totals are kept: word counters, sentence and syllable
+    totals and sentiment sums over the completed sentences. Appending text
+    costs O(size of the appended text plus the pending sentence), and the
+    metrics match what Basic reports for the concatenated text.
+
+    Text after the last sentence terminator is held as a pending tail. It
+    counts towards the metrics but is only committed (and scored for
+    sentiment) once a later append completes the sentence.
+    """
+
+    def __init__(self, text=""):
+        """
+        Args:
+            text (str, optional): Initial text of the session.
+        """
+        self.word_counts = Counter()
+        self.first_seen = {}  # word -> order of first appearance
+        self.total_word_length = 0
+        self.total_syllables = 0
+        self.sentence_word_total = 0
+        self.punctuation_count = 0
+        self.characters = 0
+        self.proper_nouns = set()
+        self.most_repeated = ("None", 0)
+        self.completed_sentences = 0
+        self.polarity_total = 0.0
+        self.subjectivity_total = 0.0
+        self.sentiment_counts = Counter()
+        self.tail = ""
+        if text:
+            self.append(text)
+
+    def append(self, text):
+        """
+        Append text to the session.
+
+        Args:
+            text (str): Text to append, exactly as it continues the
+                transcript (include the separating space or newline).
+
+        Returns:
+            dict: Refreshed metrics (see metrics()), with the sentences
+                completed by this append under "new_sentences".
+        """
+        self.characters += len(text)
+        self.punctuation_count += count_punctuation_marks(text)
+
+        # Split off everything up to the last terminator; the rest stays pending
+        buffer = self.tail + text
+        end = last_sentence_end(buffer)
+        complete, self.tail = buffer[:end], buffer[end:]
+        new_sentences = self._commit(complete) if complete else []
+        return self.metrics(new_sentences)
+
+    def _outranks(self, word, count, best):
+        """
+        Whether a word beats the current most repeated one. Ties go to the
+        word seen first, as with Counter.most_common on the whole text.
+        """
+        if count != best[1]:
+            return count > best[1]
+        order = self.first_seen.get(word, len(self.first_seen))
+        return order < self.first_seen.get(best[0], len(self.first_seen))
+
+    def _commit(self, text):
+        """Fold completed sentences into the running totals."""
+        words = tokenize(text)
+        self.word_counts.update(words)
+        distinct_words = dict.fromkeys(words)
+        for word in distinct_words:
+            self.first_seen.setdefault(word, len(self.first_seen))
+        self.total_word_length += sum(map(len, words))
+        self.total_syllables += sum(count_syllables(word) for word in words)
+        self.proper_nouns.update(find_proper_nouns(text))
+
+        # Counts only grow, so the most repeated word can only be a touched one
+        for word in distinct_words:
+            count = self.word_counts[word]
+            if self._outranks(word, count, self.most_repeated):
+                self.most_repeated = (word, count)
+
+        new_sentences = []
+        for sentence in split_sentences(text):
+            analysis = TextBlob(sentence).sentiment
+            record = {
+                "text": sentence,
+                "sentiment": sentiment_category(analysis.polarity),
+                "polarity": analysis.polarity,
+                "subjectivity": analysis.subjectivity,
+            }
+            self.sentence_word_total += len(sentence.split())
+            self.polarity_total += analysis.polarity
+            self.subjectivity_total += analysis.subjectivity
+            self.sentiment_counts[record["sentiment"]] += 1
+            self.completed_sentences += 1
+            new_sentences.append(record)
+        return new_sentences
+
+    def metrics(self, new_sentences=None):
+        """
+        Report the current metrics of the session.
+
+        Args:
+            new_sentences (list, optional): Sentence records to report as
+                newly completed.
+
+        Returns:
+            dict: Word, sentence, readability and sentiment metrics. The
+                sentiment is averaged over completed sentences.
+        """
+        # 🔹 The pending tail is counted on the fly, never merged
+        tail_counts = Counter(tokenize(self.tail))
+        total_words = sum(self.word_counts.values()) + sum(tail_counts.values())
+        total_word_length = self.total_word_length + sum(
+            len(word) * count for word, count in tail_counts.items()
+        )
+        total_syllables = self.total_syllables + sum(
+            count_syllables(word) * count for word, count in tail_counts.items()
+        )
+        unique_words = len(self.word_counts) + sum(
+            1 for word in tail_counts if word not in self.word_counts
+        )
+        # Tail words not committed yet rank after every committed word, and
+        # tail_counts iterates them in their order of appearance
+        most_repeated = self.most_repeated
+        for word, count in tail_counts.items():
+            count += self.word_counts.get(word, 0)
+            if count > most_repeated[1] or (
+                count == most_repeated[1]
+                and word in self.first_seen
+                and self._outranks(word, count, most_repeated)
+            ):
+                most_repeated = (word, count)
+
+        sentence_count = self.completed_sentences
+        sentence_word_total = self.sentence_word_total
+        if self.tail.strip():
+            sentence_count += 1
+            sentence_word_total += len(self.tail.split())
+        proper_noun_count = len(self.proper_nouns) + len(
+            set(find_proper_nouns(self.tail)) - self.proper_nouns
+        )
+
+        completed = self.completed_sentences
+        polarity = self.polarity_total / completed if completed else 0.0
+        return {
+            "characters": self.characters,
+            "word_count": total_words,
+            "unique_words": unique_words,
+            "punctuation_count": self.punctuation_count,
+            "sentence_count": sentence_count,
+            "average_word_length": (
+                round(total_word_length / total_words, 2) if total_words else 0.0
+            ),
+            "average_sentence_length": (
+                round(sentence_word_total / sentence_count, 2)
+                if sentence_count
+                else 0.0
+            ),
+            "most_repeated_word": {
+                "word": most_repeated[0],
+                "count": most_repeated[1],
+            },
+            "proper_noun_count": proper_noun_count,
+            "readability": flesch_reading_ease(
+                total_words, sentence_count, total_syllables
+            ),
+            "sentiment": {
+                "sentiment": sentiment_category(polarity),
+                "polarity": polarity,
+                "subjectivity": (
+                    self.subjectivity_total / completed if completed else 0.0
+                ),
+                "positive_sentences": self.sentiment_counts["Positive"],
+                "negative_sentences": self.sentiment_counts["Negative"],
+                "neutral_sentences": self.sentiment_counts["Neutral"],
+            },
+            "pending_text": self.tail,
+            "new_sentences": new_sentences or [],
+        }
@@ -1,9 +1,1029 @@
 import os
-import PyPDF2
-import docx
+import io
+import sys
+import codecs
+import mmap
+import zipfile
+import chardet
+import numpy as np
+import math
 import string
 import re
+import regex
+import threading
+import multiprocessing
 from collections import Counter
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from xml.etree import ElementTree
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_backends import get_pdf_backend, open_source
+from near_duplicates import SHINGLE_SIZE, minhash_signature
+from replacement import compile_replacements
+from tokenizer import (
+    TokenSpans,
+    count_punctuation_marks,
+    ends_inside_word,
+    find_proper_nouns,
+    split_sentences,
+    strip_punctuation,
+    tokenize,
+)
+
+# Precompiled patterns shared by every Basic instance (word, sentence and
+# punctuation patterns live in tokenizer.py)
+DIGITS_PATTERN = re.compile(r"\d+")
+PUNCTUATION_AND_DIGITS_PATTERN = re.compile(rf"[\d{re.escape(string.punctuation)}]+")
+UNICODE_PUNCTUATION_AND_DIGITS_PATTERN = regex.compile(
+    rf"[\d\p{{P}}{regex.escape(string.punctuation)}]+"
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+VOWELS = "aeiouy"
+
+# Distinct words whose syllable counts are memoized (least recently used evicted)
+SYLLABLE_CACHE_SIZE = int(os.environ.get("SYLLABLE_CACHE_SIZE", 100_000))
+
+# Size of the chunks read when streaming TXT files
+TXT_CHUNK_SIZE = 1 << 20
+
+# WordprocessingML tags read when streaming DOCX files
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_BODY_TAG = f"{_W}body"
+DOCX_PARAGRAPH_TAG = f"{_W}p"
+DOCX_TEXT_TAG = f"{_W}t"
+DOCX_SPECIAL_CHARACTERS = {f"{_W}tab": "\t", f"{_W}br": "\n", f"{_W}cr": "\n"}
+DOCX_FALLBACK_TAG = (
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+)
+# Subtrees holding no document text: mc:Fallback duplicates mc:Choice and
+# w:pPr holds paragraph properties (its w:tabs/w:tab are tab-stop definitions)
+DOCX_SKIPPED_TAGS = (DOCX_FALLBACK_TAG, f"{_W}pPr")
+
+# Bytes sampled from the start of a TXT file to detect its encoding
+TXT_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# File types that can be extracted
+SUPPORTED_FILE_TYPES = (".pdf", ".docx", ".txt")
+
+
+def normalize_file_type(file_type):
+    """
+    Normalize a declared file type to a lowercase extension.
+
+    Args:
+        file_type (str): An extension ("pdf", ".PDF") or a filename
+            ("report.pdf").
+
+    Returns:
+        str: Extension with a leading dot, e.g. ".pdf".
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    file_type = (file_type or "").strip().lower()
+    ext = os.path.splitext(file_type)[1] or file_type
+    ext = ext if ext.startswith(".") else f".{ext}"
+    if ext not in SUPPORTED_FILE_TYPES:
+        raise ValueError(
+            "Invalid file type. Only PDF, DOCX, and TXT files are allowed."
+        )
+    return ext
+
+
+def is_binary_input(input_data):
+    """
+    Check whether the input is an in-memory document (bytes or file-like).
+
+    Args:
+        input_data: Value passed to one of the Functions classes.
+
+    Returns:
+        bool: True for bytes, bytearray, memoryview or binary file objects.
+    """
+    return isinstance(input_data, (bytes, bytearray, memoryview)) or hasattr(
+        input_data, "read"
+    )
+
+
+def as_binary_stream(input_data):
+    """
+    Wrap in-memory document data in a seekable binary stream.
+
+    Args:
+        input_data (bytes, memoryview or file-like): Document data.
+
+    Returns:
+        file-like: The original stream, or a BytesIO over the buffer.
+    """
+    if isinstance(input_data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(input_data)
+    return input_data
+
+
+# PDFs with at least this many pages are extracted by a process pool
+PDF_PARALLEL_PAGE_THRESHOLD = int(os.environ.get("PDF_PARALLEL_PAGE_THRESHOLD", 64))
+
+# Worker processes used for parallel PDF extraction (1 disables it)
+PDF_EXTRACTION_WORKERS = int(
+    os.environ.get("PDF_EXTRACTION_WORKERS", os.cpu_count() or 1)
+)
+
+# Texts per batch below which analyze_batch stays in the calling process
+BATCH_PARALLEL_THRESHOLD = int(os.environ.get("BATCH_PARALLEL_THRESHOLD", 2000))
+
+# Worker processes used by analyze_batch (1 disables parallelism)
+BATCH_WORKERS = int(os.environ.get("BATCH_WORKERS", os.cpu_count() or 1))
+
+# Start method of worker processes; forking a threaded server can copy held
+# locks into the child, so forkserver (or spawn where unavailable) is used
+PROCESS_START_METHOD = os.environ.get(
+    "PROCESS_START_METHOD",
+    (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    ),
+)
+
+# Process pools are expensive to start, so one is kept per worker count
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+
+
+def _get_process_pool(workers):
+    """Return the shared process pool for the given worker count."""
+    with _process_pools_lock:
+        pool = _process_pools.get(workers)
+        if pool is None:
+            pool = _process_pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+            )
+        return pool
+
+
+def _extract_pdf_page_range(source, start, stop, backend):
+    """
+    Extract the text of pages [start, stop) of a PDF.
+
+    Runs inside a worker process, so it opens its own document. `source`
+    is a file path or the raw bytes of an in-memory PDF.
+
+    Returns:
+        list: Extracted text of each page in the range.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return list(get_pdf_backend(backend).iter_pages(source, start, stop))
+
+
+def iter_pdf_pages(source, workers=None, threshold=None, backend=None):
+    """
+    Yield the text of a PDF one page at a time.
+
+    Documents with at least `threshold` pages are split into page ranges
+    that are extracted by a process pool; the ranges are yielded back in
+    page order as they complete. Smaller documents are read serially.
+
+    Args:
+        source (str or file-like): Path to the PDF file or a seekable
+            binary stream holding it.
+        workers (int, optional): Worker processes. Defaults to
+            PDF_EXTRACTION_WORKERS.
+        threshold (int, optional): Minimum page count for parallel
+            extraction. Defaults to PDF_PARALLEL_PAGE_THRESHOLD.
+        backend (str, optional): Name of the PDF backend to use (see
+            pdf_backends). Defaults to the configured PDF_BACKEND.
+
+    Yields:
+        str: Extracted text of each page ("" for pages without text).
+    """
+    workers = workers or PDF_EXTRACTION_WORKERS
+    threshold = threshold or PDF_PARALLEL_PAGE_THRESHOLD
+    pdf_backend = get_pdf_backend(backend)
+
+    page_count = pdf_backend.count_pages(source) if workers > 1 else 0
+    if page_count < threshold:
+        yield from pdf_backend.iter_pages(source)
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        # A few ranges per worker keeps the pool busy when page costs vary
+        range_size = -(-page_count // (workers * 4))
+    else:
+        # In-memory PDFs are copied to every task, so keep one range per worker
+        with open_source(source) as file:
+            source = file.read()
+        range_size = -(-page_count // workers)
+    starts = range(0, page_count, range_size)
+    stops = [min(start + range_size, page_count) for start in starts]
+    pool = _get_process_pool(workers)
+    for pages in pool.map(
+        _extract_pdf_page_range,
+        [source] * len(starts),
+        starts,
+        stops,
+        [pdf_backend.name] * len(starts),
+    ):
+        yield from pages
+
+
+def iter_docx_paragraphs(source):
+    """
+    Yield the text of a DOCX file one paragraph at a time.
+
+    word/document.xml is streamed out of the archive with an incremental
+    parser and every paragraph is discarded once yielded, so memory stays
+    bounded by the largest paragraph. Paragraphs inside tables, text boxes
+    and content controls are included, in document order.
+
+    Args:
+        source (str or file-like): Path to the DOCX file or a seekable
+            binary stream holding it.
+
+    Yields:
+        str: Text of each paragraph.
+    """
+    with open_source(source) as file, zipfile.ZipFile(file) as archive:
+        with archive.open("word/document.xml") as xml:
+            paragraphs = []  # text parts of the open (possibly nested) paragraphs
+            skip_depth = 0  # > 0 inside DOCX_SKIPPED_TAGS subtrees
+            body = None
+            for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag in DOCX_SKIPPED_TAGS:
+                        skip_depth += 1
+                    elif tag == DOCX_BODY_TAG:
+                        body = elem
+                    elif tag == DOCX_PARAGRAPH_TAG and not skip_depth:
+                        paragraphs.append([])
+                    continue
+
+                if tag in DOCX_SKIPPED_TAGS:
+                    skip_depth -= 1
+                elif skip_depth or not paragraphs:
+                    pass
+                elif tag == DOCX_TEXT_TAG:
+                    paragraphs[-1].append(elem.text or "")
+                elif tag in DOCX_SPECIAL_CHARACTERS:
+                    paragraphs[-1].append(DOCX_SPECIAL_CHARACTERS[tag])
+                elif tag == DOCX_PARAGRAPH_TAG:
+                    yield "".join(paragraphs.pop())
+                    elem.clear()
+                if body is not None and elem in body:
+                    # Drop finished top-level blocks (paragraphs, tables)
+                    body.clear()
+
+
+def detect_encoding(sample):
+    """
+    Detect the text encoding of a byte sample.
+
+    Args:
+        sample (bytes): The first bytes of a document.
+
+    Returns:
+        str: A codec name; UTF-8 when the sample is valid UTF-8 or
+            detection is inconclusive.
+    """
+    sample = bytes(sample)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # Valid UTF-8 (ASCII included) needs no guessing; a multi-byte
+        # character cut at the end of the sample is tolerated
+        codecs.getincrementaldecoder("utf-8")().decode(sample)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    encoding = chardet.detect(sample).get("encoding")
+    try:
+        return codecs.lookup(encoding).name if encoding else "utf-8"
+    except LookupError:
+        return "utf-8"
+
+
+@contextmanager
+def map_binary_source(source):
+    """
+    Expose a binary source as a read-only buffer without reading it.
+
+    Files are memory-mapped and in-memory streams are viewed in place, so
+    slicing the buffer only copies the bytes of that slice.
+
+    Args:
+        source (str or file-like): A file path or a seekable binary stream.
+
+    Yields:
+        mmap, memoryview or None: The buffer, or None if the stream can
+            only be read sequentially.
+    """
+    with open_source(source) as file:
+        # Spooled uploads still held in memory roll over to disk on fileno(),
+        # which is bounded by the spool size and then mapped like any file
+        try:
+            fileno = file.fileno()
+            size = os.fstat(fileno).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            if isinstance(file, io.BytesIO):
+                view = file.getbuffer()
+                try:
+                    yield view
+                finally:
+                    view.release()
+            else:
+                yield None
+            return
+        if not size:
+            yield b""
+            return
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_txt_chunks(source, chunk_size=TXT_CHUNK_SIZE, encoding=None):
+    """
+    Yield the text of a TXT file in decoded chunks.
+
+    The file is memory-mapped (or read sequentially if it cannot be) and
+    decoded incrementally, so the whole document never exists as one
+    string. The encoding is detected from the first TXT_ENCODING_SAMPLE_SIZE
+    bytes; undecodable bytes are replaced rather than failing the file.
+
+    Args:
+        source (str or file-like): Path to the TXT file or a binary stream
+            holding it.
+        chunk_size (int): Number of bytes decoded per chunk.
+        encoding (str, optional): Known encoding, skipping detection.
+
+    Yields:
+        str: Consecutive chunks of the file.
+    """
+    with map_binary_source(source) as data:
+        if data is None:
+            yield from _iter_sequential_txt_chunks(source, chunk_size, encoding)
+            return
+        encoding = encoding or detect_encoding(data[:TXT_ENCODING_SAMPLE_SIZE])
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        for start in range(0, len(data), chunk_size):
+            yield decoder.decode(data[start : start + chunk_size])
+        yield decoder.decode(b"", final=True)
+
+
+def _iter_sequential_txt_chunks(source, chunk_size, encoding):
+    with open_source(source) as file:
+        data = file.read(chunk_size)
+        encoding = encoding or detect_encoding(data[:TXT_ENCODING_SAMPLE_SIZE])
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        while data:
+            yield decoder.decode(data)
+            data = file.read(chunk_size)
+    yield decoder.decode(b"", final=True)
+
+
+def iter_document_chunks(source, file_type=None, pdf_backend=None, pdf_workers=None):
+    """
+    Stream a document as text chunks (pages, paragraphs or TXT blocks).
+
+    Concatenating the chunks gives the same text as Basic's extraction
+    (before stripping), so the streaming metrics below agree with the
+    in-memory ones.
+
+    Args:
+        source (str, bytes or file-like): Path to a PDF, DOCX or TXT file,
+            or the document itself in memory.
+        file_type (str, optional): Declared type ("pdf", ".docx",
+            "notes.txt"). Required for in-memory documents; defaults to
+            the extension of a file path.
+        pdf_backend (str, optional): PDF backend name for PDF files.
+        pdf_workers (int, optional): Processes used to extract large PDFs
+            (see iter_pdf_pages). Pass 1 when already running in a worker.
+
+    Yields:
+        str: Consecutive chunks of the document text.
+
+    Raises:
+        ValueError: If file type is not supported.
+    """
+    if is_binary_input(source):
+        if not file_type:
+            raise ValueError("file_type is required for in-memory documents.")
+        source = as_binary_stream(source)
+    ext = normalize_file_type(file_type or source)
+
+    if ext == ".pdf":
+        yield from iter_pdf_pages(source, workers=pdf_workers, backend=pdf_backend)
+    elif ext == ".docx":
+        for index, paragraph in enumerate(iter_docx_paragraphs(source)):
+            if index:
+                yield " "
+            yield paragraph
+    else:
+        yield from iter_txt_chunks(source)
+
+
+def iter_words(chunks):
+    """
+    Yield word tokens from a stream of text chunks.
+
+    A word cut by a chunk boundary is carried over and joined with the
+    start of the next chunk, so tokens match those of the joined text.
+
+    Args:
+        chunks (iterable): Text chunks, e.g. from iter_document_chunks.
+
+    Yields:
+        str: Word tokens in order.
+    """
+    tail = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        chunk = tail + chunk
+        words = tokenize(chunk)
+        if words and ends_inside_word(chunk):
+            tail = words.pop()
+        else:
+            tail = ""
+        yield from words
+    if tail:
+        yield tail
+
+
+def stream_count_words(chunks):
+    """
+    Count words over a stream of text chunks.
+
+    Args:
+        chunks (iterable): Text chunks.
+
+    Returns:
+        int: Number of words.
+    """
+    return sum(1 for _ in iter_words(chunks))
+
+
+def stream_count_punctuation(chunks):
+    """
+    Count punctuation marks over a stream of text chunks.
+
+    Args:
+        chunks (iterable): Text chunks.
+
+    Returns:
+        int: Count of punctuation marks.
+    """
+    return sum(count_punctuation_marks(chunk) for chunk in chunks)
+
+
+def stream_count_unique_words(chunks):
+    """
+    Count unique words over a stream of text chunks.
+
+    Memory grows with the vocabulary, not with the document length.
+
+    Args:
+        chunks (iterable): Text chunks.
+
+    Returns:
+        int: Count of unique words.
+    """
+    return len(set(iter_words(chunks)))
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word):
+    """
+    Estimate the number of syllables in a word (simplified approach).
+
+    Results are memoized per word type, since most tokens of a text repeat.
+
+    Args:
+        word (str): Word to analyze.
+
+    Returns:
+        int: Estimated syllable count (at least 1).
+    """
+    word = word.lower()
+    # Special cases
+    if len(word) <= 3:
+        return 1
+
+    # Count vowel groups
+    count = 0
+    prev_is_vowel = False
+    for char in word:
+        is_vowel = char in VOWELS
+        if is_vowel and not prev_is_vowel:
+            count += 1
+        prev_is_vowel = is_vowel
+
+    # Adjust for common patterns
+    if word.endswith("e"):
+        count -= 1
+    if word.endswith("le") and len(word) > 2 and word[-3] not in VOWELS:
+        count += 1
+    if count == 0:  # Every word has at least one syllable
+        count = 1
+
+    return count
+
+
+def flesch_reading_ease(total_words, total_sentences, total_syllables):
+    """
+    Compute the Flesch Reading Ease score from aggregate counts.
+
+    Args:
+        total_words (int): Number of words.
+        total_sentences (int): Number of sentences.
+        total_syllables (int): Estimated syllables over all words.
+
+    Returns:
+        dict: Contains the score (clamped to 0-100) and its interpretation.
+    """
+    if not total_words:
+        return {"score": 0, "interpretation": "N/A - No words found"}
+
+    total_sentences = total_sentences or 1  # Avoid division by zero
+
+    # Calculate Flesch Reading Ease score
+    score = (
+        206.835
+        - 1.015 * (total_words / total_sentences)
+        - 84.6 * (total_syllables / total_words)
+    )
+
+    # Clamp the score between 0 and 100
+    score = max(0, min(100, round(score, 2)))
+
+    # Determine interpretation
+    if score >= 90:
+        interpretation = "Very Easy"
+    elif score >= 80:
+        interpretation = "Easy"
+    elif score >= 70:
+        interpretation = "Fairly Easy"
+    elif score >= 60:
+        interpretation = "Standard"
+    elif score >= 50:
+        interpretation = "Fairly Difficult"
+    elif score >= 30:
+        interpretation = "Difficult"
+    else:
+        interpretation = "Very Confusing"
+
+    return {"score": score, "interpretation": interpretation}
+
+
+# Suffixes that do not make a word complex for the Gunning Fog index
+FOG_IGNORED_SUFFIXES = ("es", "ed", "ing")
+
+
+def _is_complex_word(word, syllables):
+    """Gunning Fog "complex" word (3+ syllables, not a proper noun)."""
+    # Words reaching 3 syllables only through an -es/-ed/-ing ending don't count
+    if syllables < 3 or word[0].isupper():
+        return False
+    lowered = word.lower()
+    return not any(
+        lowered.endswith(suffix) and count_syllables(lowered[: -len(suffix)]) < 3
+        for suffix in FOG_IGNORED_SUFFIXES
+    )
+
+
+def readability_counts(word_counts, sentence_count):
+    """
+    Collect every count the readability formulas need in one pass.
+
+    Each distinct word is examined once and weighted by its frequency, so
+    the cost grows with the vocabulary rather than the text length.
+
+    Args:
+        word_counts (Counter): Occurrences of every word token.
+        sentence_count (int): Number of sentences.
+
+    Returns:
+        dict: words, sentences, syllables, polysyllables (3+ syllables),
+            complex_words (Gunning Fog), letters and characters.
+    """
+    counts = dict.fromkeys(
+        ("syllables", "polysyllables", "complex_words", "letters", "characters"), 0
+    )
+    for word, count in word_counts.items():
+        syllables = count_syllables(word)
+        counts["syllables"] += syllables * count
+        counts["characters"] += len(word) * count
+        counts["letters"] += sum(char.isalpha() for char in word) * count
+        if syllables >= 3:
+            counts["polysyllables"] += count
+            if _is_complex_word(word, syllables):
+                counts["complex_words"] += count
+    return {
+        "words": sum(word_counts.values()),
+        "sentences": sentence_count,
+        **counts,
+    }
+
+
+# Grade-level formulas reported by readability_scores
+READABILITY_GRADES = (
+    "flesch_kincaid_grade",
+    "gunning_fog",
+    "smog_index",
+    "coleman_liau_index",
+    "automated_readability_index",
+)
+
+
+def readability_scores(counts):
+    """
+    Compute the standard readability formulas from aggregate counts.
+
+    Args:
+        counts (dict): Output of readability_counts (counts of several
+            documents may be summed first).
+
+    Returns:
+        dict: flesch_reading_ease (score and interpretation) and the
+            flesch_kincaid_grade, gunning_fog, smog_index,
+            coleman_liau_index and automated_readability_index grade levels,
+            plus the counts they were computed from.
+    """
+    words = counts["words"]
+    sentences = counts["sentences"] or 1  # Avoid division by zero
+    scores = {
+        "flesch_reading_ease": flesch_reading_ease(
+            words, counts["sentences"], counts["syllables"]
+        )
+    }
+    if not words:
+        grades = dict.fromkeys(READABILITY_GRADES, 0.0)
+    else:
+        words_per_sentence = words / sentences
+        syllables_per_word = counts["syllables"] / words
+        grades = {
+            "flesch_kincaid_grade": (
+                0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+            ),
+            "gunning_fog": (
+                0.4 * (words_per_sentence + 100 * counts["complex_words"] / words)
+            ),
+            "smog_index": (
+                1.043 * math.sqrt(counts["polysyllables"] * 30 / sentences) + 3.1291
+            ),
+            "coleman_liau_index": (
+                0.0588 * (100 * counts["letters"] / words)
+                - 0.296 * (100 * sentences / words)
+                - 15.8
+            ),
+            "automated_readability_index": (
+                4.71 * counts["characters"] / words + 0.5 * words_per_sentence - 21.43
+            ),
+        }
+    scores.update({name: round(value, 2) for name, value in grades.items()})
+    scores["counts"] = counts
+    return scores
+
+
+class TextStats:
+    """
+    Lazily computed, memoized statistics for a single text.
+
+    The text is tokenized once into a word Counter and split into sentences
+    once; every metric exposed by Basic is derived from these cached values,
+    so asking for several metrics never rescans the document.
+    """
+
+    def __init__(self, text):
+        """
+        Args:
+            text (str): Text to analyze.
+        """
+        self.text = text
+
+    @cached_property
+    def word_counts(self):
+        """Counter: Occurrences of every word, in first-seen order."""
+        return Counter(tokenize(self.text))
+
+    @cached_property
+    def token_spans(self):
+        """TokenSpans: Offsets of every word token in the text."""
+        return TokenSpans.from_text(self.text)
+
+    @cached_property
+    def total_words(self):
+        """int: Total number of word tokens."""
+        return sum(self.word_counts.values())
+
+    @cached_property
+    def total_word_length(self):
+        """int: Sum of the lengths of all word tokens."""
+        return sum(len(word) * count for word, count in self.word_counts.items())
+
+    @cached_property
+    def total_syllables(self):
+        """int: Estimated syllables over all word tokens."""
+        return sum(
+            count_syllables(word) * count for word, count in self.word_counts.items()
+        )
+
+    @cached_property
+    def sentences(self):
+        """list: Non-empty, stripped sentences."""
+        return split_sentences(self.text)
+
+    @cached_property
+    def sentence_word_total(self):
+        """int: Whitespace-separated words summed over all sentences."""
+        return sum(len(s.split()) for s in self.sentences)
+
+    @cached_property
+    def proper_nouns(self):
+        """list: Unique capitalized words."""
+        return list(set(find_proper_nouns(self.text)))
+
+
+def _delete_punctuation(text):
+    return strip_punctuation(text)
+
+
+def _delete_digits(text):
+    return DIGITS_PATTERN.sub("", text)
+
+
+def _delete_punctuation_and_digits(text):
+    if text.isascii():
+        return PUNCTUATION_AND_DIGITS_PATTERN.sub("", text)
+    return UNICODE_PUNCTUATION_AND_DIGITS_PATTERN.sub("", text)
+
+
+def _collapse_whitespace(text):
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+# Transform name -> (kind, implementation). "delete" transforms only remove
+# characters that no case mapping creates or destroys, so they commute with
+# "case" transforms and adjacent ones are fused into a single pass.
+TRANSFORMS = {
+    "lowercase": ("case", str.lower),
+    "uppercase": ("case", str.upper),
+    "remove_punctuation": ("delete", "punctuation"),
+    "remove_numbers": ("delete", "digits"),
+    "remove_extra_whitespace": ("whitespace", _collapse_whitespace),
+}
+
+# Set of fused deletions -> the single pass that performs them
+_DELETION_PASSES = {
+    frozenset({"punctuation"}): _delete_punctuation,
+    frozenset({"digits"}): _delete_digits,
+    frozenset({"punctuation", "digits"}): _delete_punctuation_and_digits,
+}
+
+
+class TransformPipeline:
+    """
+    An ordered list of text transforms compiled into as few passes as
+    possible.
+
+    Deletions are merged into one translate/regex pass and run before the
+    case mappings they commute with, so the case pass sees less text. Only
+    whitespace collapsing acts as a barrier, since deleting characters can
+    create new runs of whitespace.
+    """
+
+    def __init__(self, steps):
+        """
+        Args:
+            steps (iterable): Transform names (see TRANSFORMS), in order.
+
+        Raises:
+            ValueError: If a step is not a known transform.
+        """
+        self.steps = tuple(steps)
+        self.passes = []
+        deletions = set()
+        case_passes = []
+        for step in self.steps:
+            if step not in TRANSFORMS:
+                raise ValueError(
+                    f"Unknown transform '{step}'. Available transforms: {', '.join(TRANSFORMS)}"
+                )
+            kind, implementation = TRANSFORMS[step]
+            if kind == "delete":
+                deletions.add(implementation)
+            elif kind == "case":
+                # Repeating the same case mapping is a no-op
+                if not case_passes or case_passes[-1] is not implementation:
+                    case_passes.append(implementation)
+            else:
+                self._flush(deletions, case_passes)
+                if not self.passes or self.passes[-1] is not implementation:
+                    self.passes.append(implementation)
+        self._flush(deletions, case_passes)
+
+    def _flush(self, deletions, case_passes):
+        """Emit the pending fused deletion followed by the pending case passes."""
+        if deletions:
+            self.passes.append(_DELETION_PASSES[frozenset(deletions)])
+            deletions.clear()
+        self.passes.extend(case_passes)
+        case_passes.clear()
+
+    def __call__(self, text):
+        """
+        Apply the pipeline to a text.
+
+        Args:
+            text (str): Text to transform.
+
+        Returns:
+            str: The transformed text.
+        """
+        for transform in self.passes:
+            text = transform(text)
+        return text
+
+
+@lru_cache(maxsize=128)
+def _compile_transforms(steps):
+    return TransformPipeline(steps)
+
+
+def compile_transforms(steps):
+    """
+    Compile an ordered list of transforms, reusing previously compiled
+    pipelines.
+
+    Args:
+        steps (iterable): Transform names (see TRANSFORMS), in order.
+
+    Returns:
+        TransformPipeline: Callable applying every step to a text.
+
+    Raises:
+        ValueError: If a step is not a known transform.
+    """
+    return _compile_transforms(tuple(steps))
+
+
+@lru_cache(maxsize=None)
+def get_stopwords(language="english"):
+    """
+    Load the NLTK stopword list of a language once per process.
+
+    Args:
+        language (str): NLTK stopwords language.
+
+    Returns:
+        frozenset: Lowercase stopwords.
+    """
+    import nltk
+    from nltk.corpus import stopwords
+
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError:
+        nltk.download("stopwords")
+    return frozenset(stopwords.words(language))
+
+
+class NgramCounts:
+    """
+    N-gram frequencies keyed by integers over an interned vocabulary.
+
+    Each n-gram of token ids (t1, ..., tn) is stored as the mixed-radix
+    integer t1 * V**(n-1) + ... + tn (V = vocabulary size), so counting is a
+    vectorized sort of one integer per window and no tuple is ever built.
+    """
+
+    def __init__(self, n, vocabulary, keys, counts):
+        """
+        Args:
+            n (int): N-gram size.
+            vocabulary (list): Token for each id.
+            keys (numpy.ndarray): Distinct n-gram keys.
+            counts (numpy.ndarray): Occurrences of each key.
+        """
+        self.n = n
+        self.vocabulary = vocabulary
+        self.keys = keys
+        self.counts = counts
+
+    @property
+    def total(self):
+        """int: Number of counted n-gram windows."""
+        return int(self.counts.sum())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def decode(self, key):
+        """
+        Turn an n-gram key back into its tokens.
+
+        Args:
+            key (int): Mixed-radix n-gram key.
+
+        Returns:
+            tuple: The n tokens.
+        """
+        size = len(self.vocabulary)
+        ids = []
+        key = int(key)
+        for _ in range(self.n):
+            key, token_id = divmod(key, size)
+            ids.append(token_id)
+        return tuple(self.vocabulary[token_id] for token_id in reversed(ids))
+
+    def top(self, k=10):
+        """
+        Return the k most frequent n-grams.
+
+        Args:
+            k (int): Number of n-grams.
+
+        Returns:
+            list: (phrase, count) tuples, most frequent first.
+
+        Raises:
+            ValueError: If k is negative.
+        """
+        if k < 0:
+            raise ValueError("top_k must not be negative.")
+        if not k or not len(self.keys):
+            return []
+        k = min(k, len(self.keys))
+        # Partition first so only the k candidates are fully sorted
+        candidates = np.argpartition(-self.counts, k - 1)[:k]
+        order = candidates[
+            np.lexsort((self.keys[candidates], -self.counts[candidates]))
+        ]
+        return [
+            (" ".join(self.decode(self.keys[i])), int(self.counts[i])) for i in order
+        ]
+
+
+def count_ngrams(words, n=2, stop_words=None, lowercase=True):
+    """
+    Count the n-grams of a token stream.
+
+    Tokens are interned into an integer array as they arrive, so streamed
+    documents are never materialized as strings or tuples.
+
+    Args:
+        words (iterable): Word tokens (e.g. iter_words(chunks)).
+        n (int): N-gram size.
+        stop_words (collection, optional): Words that may not appear in a
+            counted n-gram (windows containing one are skipped).
+        lowercase (bool): Count case-insensitively.
+
+    Returns:
+        NgramCounts: The n-gram frequencies.
+
+    Raises:
+        ValueError: If n is smaller than 1.
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1.")
+
+    vocabulary = {}
+    ids = array("q")
+    for word in words:
+        if lowercase:
+            word = word.lower()
+        ids.append(vocabulary.setdefault(word, len(vocabulary)))
+    ids = np.frombuffer(ids, dtype=np.int64) if ids else np.empty(0, np.int64)
+    windows = len(ids) - n + 1
+    size = len(vocabulary)
+    if windows <= 0:
+        empty = np.empty(0, np.int64)
+        return NgramCounts(n, list(vocabulary), empty, empty)
+
+    # Keys stay int64 while V**n fits; huge vocabularies fall back to Python ints
+    if size**n >= 2**63:
+        ids = ids.astype(object)
+    keys = ids[:windows].copy()
+    for offset in range(1, n):
+        keys = keys * size + ids[offset : offset + windows]
+
+    if stop_words:
+        stop_ids = [vocabulary[word] for word in stop_words if word in vocabulary]
+        if stop_ids:
+            is_stop = np.isin(ids, stop_ids).astype(np.int64)
+            stops_before = np.concatenate(([0], np.cumsum(is_stop)))
+            keys = keys[stops_before[n:] - stops_before[:windows] == 0]
+
+    keys, counts = np.unique(keys, return_counts=True)
+    return NgramCounts(n, list(vocabulary), keys, counts)
 
 
 class Basic:
@@ -11,31 +1031,86 @@ class Basic:
     Basic text processing class that handles text extraction from files
     and provides fundamental text analysis functions.
 
-    This class works with both file paths and raw text inputs.
+    This class works with file paths, in-memory documents (bytes or binary
+    file-like objects) and raw text inputs.
     """
 
-    def __init__(self, input_data):
+    def __init__(self, input_data, file_type=None, pdf_backend=None):
         """
-        Initialize the Basic class with either a file path or raw text.
+        Initialize the Basic class with a file path, an in-memory document
+        or raw text.
 
         Args:
-            input_data (str): A file path (PDF, DOCX, TXT) or raw text.
+            input_data (str, bytes, memoryview or file-like): A file path
+                (PDF, DOCX, TXT), the document's bytes / binary stream, or
+                raw text.
+            file_type (str, optional): Declared document type ("pdf",
+                ".docx", "notes.txt"). Required for in-memory documents.
+            pdf_backend (str, optional): PDF extraction backend name (see
+                pdf_backends). Defaults to the configured PDF_BACKEND.
 
         Raises:
-            ValueError: If input is not a string or a valid file path.
+            ValueError: If input is not a string, a valid file path or an
+                in-memory document with a supported file type.
         """
+        self.pdf_backend = pdf_backend
         if isinstance(input_data, str) and os.path.exists(input_data):
             # Input is a file path
             self.file_path = input_data
+            self.source = input_data
+            self.file_type = os.path.splitext(input_data)[1].lower()
             self.is_file = True
             self.text = self.extract_text()
         elif isinstance(input_data, str):
             # Input is raw text
             self.file_path = None
+            self.source = None
+            self.file_type = None
             self.is_file = False
             self.text = input_data.strip()
+        elif is_binary_input(input_data):
+            # Input is an in-memory document (e.g. an upload's bytes)
+            if not file_type:
+                raise ValueError("file_type is required for in-memory documents.")
+            self.file_path = None
+            self.source = as_binary_stream(input_data)
+            self.file_type = normalize_file_type(file_type)
+            self.is_file = True
+            self.text = self.extract_text()
         else:
-            raise ValueError("Input must be a file path or raw text string.")
+            raise ValueError(
+                "Input must be a file path, raw text string, bytes or a binary file object."
+            )
+
+    @classmethod
+    def from_text(cls, text):
+        """
+        Create a Basic instance from raw text without file-path detection.
+
+        Args:
+            text (str): Raw text (never interpreted as a path).
+
+        Returns:
+            Basic: Instance holding the stripped text.
+        """
+        instance = cls.__new__(cls)
+        instance.pdf_backend = None
+        instance.file_path = None
+        instance.source = None
+        instance.file_type = None
+        instance.is_file = False
+        instance.text = text.strip()
+        return instance
+
+    @cached_property
+    def stats(self):
+        """
+        Cached statistics for the stored text, computed on first use.
+
+        Returns:
+            TextStats: Memoized word, sentence and syllable statistics.
+        """
+        return TextStats(self.text)
 
     def extract_text(self):
         """
@@ -47,11 +1122,11 @@ class Basic:
         Raises:
             ValueError: If file type is not supported.
         """
-        if not self.file_path:
+        if not self.is_file:
             return self.text
 
-        # Determine file extension and use appropriate extraction method
-        ext = os.path.splitext(self.file_path)[1].lower()
+        # Use the extraction method matching the file's declared type
+        ext = self.file_type
         if ext == ".pdf":
             return self.extract_text_from_pdf()
         elif ext == ".docx":
@@ -69,15 +1144,16 @@ class Basic:
 
         Returns:
             str: Extracted text from the PDF.
+
+        Raises:
+            ValueError: If the requested PDF backend is not registered.
         """
-        text = ""
+        # An unknown backend is the caller's mistake, not an unreadable PDF
+        get_pdf_backend(self.pdf_backend)
         try:
-            with open(self.file_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    extracted = page.extract_text()
-                    text += extracted if extracted else ""
-            return text.strip()
+            return "".join(
+                iter_pdf_pages(self.source, backend=self.pdf_backend)
+            ).strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
@@ -90,8 +1166,7 @@ class Basic:
             str: Extracted text from the DOCX.
         """
         try:
-            doc = docx.Document(self.file_path)
-            return " ".join([para.text for para in doc.paragraphs]).strip()
+            return " ".join(iter_docx_paragraphs(self.source)).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
@@ -104,8 +1179,7 @@ class Basic:
             str: Extracted text from the TXT file.
         """
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                return file.read().strip()
+            return "".join(iter_txt_chunks(self.source)).strip()
         except Exception as e:
             print(f"Error extracting text from TXT: {e}")
             return ""
@@ -117,8 +1191,7 @@ class Basic:
         Returns:
             int: Number of words.
         """
-        words = re.findall(r"\b\w+\b", self.text)
-        return len(words)
+        return self.stats.total_words
 
     def count_punctuation(self):
         """
@@ -127,7 +1200,7 @@ class Basic:
         Returns:
             int: Count of punctuation marks.
         """
-        return sum(1 for char in self.text if char in string.punctuation)
+        return count_punctuation_marks(self.text)
 
     def show_most_repeated_word(self):
         """
@@ -136,8 +1209,7 @@ class Basic:
         Returns:
             tuple: (word, count) of the most repeated word.
         """
-        words = re.findall(r"\b\w+\b", self.text)
-        counter = Counter(words)
+        counter = self.stats.word_counts
         if not counter:
             return ("None", 0)
 
@@ -151,8 +1223,7 @@ class Basic:
         Returns:
             tuple: (word, count) of the least repeated word.
         """
-        words = re.findall(r"\b\w+\b", self.text)
-        counter = Counter(words)
+        counter = self.stats.word_counts
         return min(counter.items(), key=lambda x: x[1]) if counter else ("None", 0)
 
     def convert_to_lowercase(self, text=None):
@@ -189,7 +1260,7 @@ class Basic:
         Returns:
             str: Text with punctuation removed.
         """
-        return re.sub(f"[{string.punctuation}]", "", text or self.text)
+        return _delete_punctuation(text or self.text)
 
     def remove_numbers(self):
         """
@@ -198,7 +1269,7 @@ class Basic:
         Returns:
             str: Text with numbers removed.
         """
-        return re.sub(r"\d+", "", self.text)
+        return _delete_digits(self.text)
 
     def remove_extra_whitespace(self):
         """
@@ -207,7 +1278,25 @@ class Basic:
         Returns:
             str: Text with normalized whitespace.
         """
-        return re.sub(r"\s+", " ", self.text).strip()
+        return _collapse_whitespace(self.text)
+
+    def apply_transforms(self, steps, text=None):
+        """
+        Apply an ordered list of transforms in a single fused pipeline.
+
+        Args:
+            steps (list): Transform names, e.g. ["lowercase",
+                "remove_punctuation", "remove_numbers",
+                "remove_extra_whitespace"].
+            text (str, optional): Text to process. If None, uses the stored text.
+
+        Returns:
+            str: The transformed text.
+
+        Raises:
+            ValueError: If a step is not a known transform.
+        """
+        return compile_transforms(steps)(text or self.text)
 
     def find_average_word_length(self):
         """
@@ -219,13 +1308,11 @@ class Basic:
         Returns:
             float: Average word length or 0 if no words found.
         """
-        words = re.findall(r"\w+", self.text)  # Extract words (ignoring punctuation)
-
-        if not words:
+        stats = self.stats
+        if not stats.total_words:
             return 0.0  # Avoid division by zero
 
-        total_length = sum(len(word) for word in words)
-        avg_length = total_length / len(words)
+        avg_length = stats.total_word_length / stats.total_words
 
         return round(avg_length, 2)  # Rounded for better readability
 
@@ -236,13 +1323,11 @@ class Basic:
         Returns:
             float: Average sentence length in words or 0 if no sentences found.
         """
-        sentences = re.split(r"[.!?]", self.text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
+        sentences = self.stats.sentences
         if not sentences:
             return 0
 
-        avg_length = sum(len(s.split()) for s in sentences) / len(sentences)
+        avg_length = self.stats.sentence_word_total / len(sentences)
         return avg_length
 
     def replace_word(self, old_word, new_word):
@@ -258,6 +1343,24 @@ class Basic:
         """
         return self.text.replace(old_word, new_word)
 
+    def replace_words(self, mapping, whole_words=False, ignore_case=False):
+        """
+        Replace many words or phrases in a single pass over the text.
+
+        The mapping is compiled into an Aho-Corasick automaton (cached per
+        mapping); overlapping matches resolve leftmost-longest.
+
+        Args:
+            mapping (dict): Text to find -> replacement.
+            whole_words (bool): Only replace whole words.
+            ignore_case (bool): Match case-insensitively.
+
+        Returns:
+            str: Text with the replacements applied.
+        """
+        _, automaton = compile_replacements(mapping, whole_words, ignore_case)
+        return automaton.replace(self.text)[0]
+
     def reverse_text(self):
         """
         Reverse the entire text.
@@ -274,8 +1377,50 @@ class Basic:
         Returns:
             int: Count of unique words.
         """
-        words = re.findall(r"\b\w+\b", self.text)
-        return len(set(words))
+        return len(self.stats.word_counts)
+
+    def top_ngrams(self, n=2, top_k=10, remove_stopwords=False):
+        """
+        Find the most frequent n-grams (phrases) in the text.
+
+        Args:
+            n (int): N-gram size (2 for bigrams, 3 for trigrams, ...).
+            top_k (int): Number of n-grams to return.
+            remove_stopwords (bool): Skip n-grams containing a stopword.
+
+        Returns:
+            list: (phrase, count) tuples, most frequent first.
+
+        Raises:
+            ValueError: If n is smaller than 1 or top_k is negative.
+        """
+        stop_words = get_stopwords() if remove_stopwords else None
+        counts = count_ngrams(tokenize(self.text), n, stop_words)
+        return counts.top(top_k)
+
+    def minhash_signature(self, shingle_size=SHINGLE_SIZE):
+        """
+        Compute the MinHash signature of the text for near-duplicate search.
+
+        Args:
+            shingle_size (int): Words per shingle.
+
+        Returns:
+            numpy.ndarray: Signature comparable with near_duplicates indexes.
+
+        Raises:
+            ValueError: If the text contains no words.
+        """
+        return minhash_signature(self.text, shingle_size)
+
+    def token_spans(self):
+        """
+        Locate every word token without copying it out of the text.
+
+        Returns:
+            TokenSpans: Token offsets over the text (see tokenizer.TokenSpans).
+        """
+        return self.stats.token_spans
 
     def extract_proper_nouns(self):
         """
@@ -284,8 +1429,7 @@ class Basic:
         Returns:
             list: List of potential proper nouns.
         """
-        words = re.findall(r"\b[A-Z][a-z]*\b", self.text)
-        return list(set(words))
+        return list(self.stats.proper_nouns)
 
     def readability_score(self):
         """
@@ -309,74 +1453,23 @@ class Basic:
         if not self.text.strip():
             return {"score": 0, "interpretation": "N/A - No text provided"}
 
-        # Count words
-        words = re.findall(r"\b\w+\b", self.text)
-        if not words:
-            return {"score": 0, "interpretation": "N/A - No words found"}
-
-        total_words = len(words)
-
-        # Count sentences
-        sentences = re.split(r"[.!?]", self.text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        total_sentences = len(sentences) if sentences else 1  # Avoid division by zero
-
-        # Estimate syllables (simplified approach)
-        def count_syllables(word):
-            word = word.lower()
-            # Special cases
-            if len(word) <= 3:
-                return 1
-
-            # Count vowel groups
-            vowels = "aeiouy"
-            count = 0
-            prev_is_vowel = False
-            for char in word:
-                is_vowel = char in vowels
-                if is_vowel and not prev_is_vowel:
-                    count += 1
-                prev_is_vowel = is_vowel
-
-            # Adjust for common patterns
-            if word.endswith("e"):
-                count -= 1
-            if word.endswith("le") and len(word) > 2 and word[-3] not in vowels:
-                count += 1
-            if count == 0:  # Every word has at least one syllable
-                count = 1
-
-            return count
-
-        total_syllables = sum(count_syllables(word) for word in words)
-
-        # Calculate Flesch Reading Ease score
-        score = (
-            206.835
-            - 1.015 * (total_words / total_sentences)
-            - 84.6 * (total_syllables / total_words)
+        stats = self.stats
+        return flesch_reading_ease(
+            stats.total_words, len(stats.sentences), stats.total_syllables
         )
 
-        # Clamp the score between 0 and 100
-        score = max(0, min(100, round(score, 2)))
-
-        # Determine interpretation
-        if score >= 90:
-            interpretation = "Very Easy"
-        elif score >= 80:
-            interpretation = "Easy"
-        elif score >= 70:
-            interpretation = "Fairly Easy"
-        elif score >= 60:
-            interpretation = "Standard"
-        elif score >= 50:
-            interpretation = "Fairly Difficult"
-        elif score >= 30:
-            interpretation = "Difficult"
-        else:
-            interpretation = "Very Confusing"
+    def readability_report(self):
+        """
+        Calculate every readability formula from a single pass over the words.
 
-        return {"score": score, "interpretation": interpretation}
+        Returns:
+            dict: Flesch Reading Ease, Flesch-Kincaid grade, Gunning Fog,
+                SMOG, Coleman-Liau and ARI, with the underlying counts.
+        """
+        stats = self.stats
+        return readability_scores(
+            readability_counts(stats.word_counts, len(stats.sentences))
+        )
 
     def process(self, choice):
         """
@@ -413,3 +1506,98 @@ class Basic:
             return functions[choice]()
         else:
             return "Invalid choice"
+
+
+# Metrics available to analyze_batch, mapped to the Basic methods computing them
+BATCH_METRICS = {
+    "count_words": "count_words",
+    "count_punctuation": "count_punctuation",
+    "most_repeated_word": "show_most_repeated_word",
+    "least_repeated_word": "show_least_repeated_word",
+    "average_word_length": "find_average_word_length",
+    "average_sentence_length": "find_average_sentence_length",
+    "count_unique_words": "count_unique_words",
+    "proper_nouns": "extract_proper_nouns",
+    "readability_score": "readability_score",
+    "readability_report": "readability_report",
+}
+
+
+def _analyze_texts(texts, metrics):
+    """
+    Compute the requested metrics for each text.
+
+    Runs in the calling process or inside a batch worker process.
+
+    Returns:
+        dict: Metric name -> list of values, one per text.
+    """
+    columns = {metric: [] for metric in metrics}
+    for text in texts:
+        basic = Basic.from_text(text)
+        for metric in metrics:
+            columns[metric].append(getattr(basic, BATCH_METRICS[metric])())
+    return columns
+
+
+def analyze_batch(texts, metrics, workers=None, threshold=None):
+    """
+    Compute several Basic metrics for many short texts at once.
+
+    Batches with at least `threshold` texts are split into slices that are
+    analyzed by a process pool; smaller batches run in the calling process.
+
+    Args:
+        texts (list): Raw texts to analyze.
+        metrics (list): Metric names, keys of BATCH_METRICS.
+        workers (int, optional): Worker processes. Defaults to BATCH_WORKERS.
+        threshold (int, optional): Minimum batch size for parallel analysis.
+            Defaults to BATCH_PARALLEL_THRESHOLD.
+
+    Returns:
+        dict: Results in column form, metric name -> list of values in the
+            same order as `texts`.
+
+    Raises:
+        ValueError: If a metric name is unknown.
+    """
+    unknown = [metric for metric in metrics if metric not in BATCH_METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics: {', '.join(unknown)}. Available metrics: {', '.join(BATCH_METRICS)}"
+        )
+
+    workers = workers or BATCH_WORKERS
+    threshold = threshold or BATCH_PARALLEL_THRESHOLD
+    if workers <= 1 or len(texts) < threshold:
+        return _analyze_texts(texts, metrics)
+
+    # A few slices per worker keeps the pool busy when text lengths vary
+    slice_size = -(-len(texts) // (workers * 4))
+    slices = [texts[i : i + slice_size] for i in range(0, len(texts), slice_size)]
+    columns = {metric: [] for metric in metrics}
+    pool = _get_process_pool(workers)
+    for partial in pool.map(_analyze_texts, slices, [metrics] * len(slices)):
+        for metric in metrics:
+            columns[metric].extend(partial[metric])
+    return columns
+
+
+def readability_batch(texts, workers=None, threshold=None):
+    """
+    Compute the full readability report of many texts at once.
+
+    Large batches are spread across the batch process pool (see
+    analyze_batch); syllable counts are memoized in every worker.
+
+    Args:
+        texts (list): Raw texts to analyze.
+        workers (int, optional): Worker processes. Defaults to BATCH_WORKERS.
+        threshold (int, optional): Minimum batch size for parallel analysis.
+
+    Returns:
+        list: One report (see Basic.readability_report) per text, in order.
+    """
+    return analyze_batch(texts, ["readability_report"], workers, threshold)[
+        "readability_report"
+    ]
@@ -0,0 +1,210 @@
+import os
+import sys
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+import numpy as np
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tokenizer import iter_token_spans, tokenize
+
+# Number of document indexes kept for repeated queries (least recently used evicted)
+CONCORDANCE_CACHE_SIZE = int(os.environ.get("CONCORDANCE_CACHE_SIZE", 32))
+
+
+def _int64_array(values):
+    return np.frombuffer(values, dtype=np.int64) if values else np.empty(0, np.int64)
+
+
+class ConcordanceIndex:
+    """
+    Token-position index of a document for keyword-in-context (KWIC) search.
+
+    The text is tokenized once into token ids and character spans, and the
+    positions of every token are grouped into one sorted postings array. A
+    query only touches the postings of its rarest term, so lookups cost
+    O(occurrences) instead of a scan of the document.
+    """
+
+    def __init__(self, text):
+        """
+        Args:
+            text (str): Document text to index.
+        """
+        self.text = text
+        self.vocabulary = {}
+        starts, ends, ids = array("q"), array("q"), array("q")
+        for match in iter_token_spans(text):
+            starts.append(match.start())
+            ends.append(match.end())
+            ids.append(
+                self.vocabulary.setdefault(match.group().lower(), len(self.vocabulary))
+            )
+        self.starts = _int64_array(starts)
+        self.ends = _int64_array(ends)
+        self.ids = _int64_array(ids)
+
+        # Postings: positions sorted by token id, sliced per id via bounds
+        self._postings = np.argsort(self.ids, kind="stable")
+        self._bounds = np.searchsorted(
+            self.ids[self._postings], np.arange(len(self.vocabulary) + 1)
+        )
+
+    def positions(self, token):
+        """
+        Return the token positions of a (lowercase) token.
+
+        Args:
+            token (str): Token to look up.
+
+        Returns:
+            numpy.ndarray: Sorted token positions (empty if absent).
+        """
+        token_id = self.vocabulary.get(token)
+        if token_id is None:
+            return np.empty(0, np.int64)
+        return self._postings[self._bounds[token_id] : self._bounds[token_id + 1]]
+
+    def find(self, query):
+        """
+        Find every occurrence of a term or phrase (case-insensitive).
+
+        Args:
+            query (str): A word or a phrase of words.
+
+        Returns:
+            numpy.ndarray: Token positions where the phrase starts.
+
+        Raises:
+            ValueError: If the query contains no words.
+        """
+        terms = [term.lower() for term in tokenize(query)]
+        if not terms:
+            raise ValueError("Query must contain at least one word.")
+        term_ids = [self.vocabulary.get(term) for term in terms]
+        if None in term_ids:
+            return np.empty(0, np.int64)
+
+        # Anchor on the rarest term, then verify the others around it
+        postings = [self.positions(term) for term in terms]
+        anchor = min(range(len(terms)), key=lambda i: len(postings[i]))
+        starts = postings[anchor] - anchor
+        starts = starts[(starts >= 0) & (starts + len(terms) <= len(self.ids))]
+        for offset, token_id in enumerate(term_ids):
+            if offset != anchor:
+                starts = starts[self.ids[starts + offset] == token_id]
+        return starts
+
+    def search(self, query, window=5, limit=50):
+        """
+        Return keyword-in-context lines for a term or phrase.
+
+        Args:
+            query (str): A word or a phrase of words.
+            window (int): Context tokens shown on each side.
+            limit (int): Maximum number of lines returned.
+
+        Returns:
+            dict: Total number of occurrences and up to `limit` lines, each
+                with the token position, character offset, left context,
+                matched text and right context.
+
+        Raises:
+            ValueError: If window or limit is negative.
+        """
+        if window < 0 or limit < 0:
+            raise ValueError("window and limit must not be negative.")
+        starts = self.find(query)
+        length = len(tokenize(query))
+        last_token = len(self.ids) - 1
+        results = []
+        for start in starts[:limit].tolist():
+            stop = start + length - 1
+            left_start = self.starts[max(start - window, 0)]
+            right_end = self.ends[min(stop + window, last_token)]
+            match_start, match_end = self.starts[start], self.ends[stop]
+            results.append(
+                {
+                    "position": start,
+                    "offset": int(match_start),
+                    "left": self.text[left_start:match_start] if window else "",
+                    "match": self.text[match_start:match_end],
+                    "right": self.text[match_end:right_end] if window else "",
+                }
+            )
+        return {"total": len(starts), "results": results}
+
+
+def document_key(*parts):
+    """
+    Hash a document's content (and anything affecting its text) to a key.
+
+    Args:
+        *parts (bytes or str): Content and options such as the file type.
+
+    Returns:
+        str: Hex digest identifying the document.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+_index_cache = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_cached_index(key):
+    """
+    Return a cached index, marking it as recently used.
+
+    Args:
+        key (str): Document key (see document_key).
+
+    Returns:
+        ConcordanceIndex or None: The index, or None if not cached.
+    """
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+        return index
+
+
+def cache_index(key, index):
+    """
+    Cache an index, evicting the least recently used beyond the cache size.
+
+    Args:
+        key (str): Document key.
+        index (ConcordanceIndex): Index to cache.
+    """
+    with _index_cache_lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > CONCORDANCE_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+
+
+def get_or_build_index(key, load_text):
+    """
+    Return the cached index for a document, building it on a cache miss.
+
+    Args:
+        key (str): Document key.
+        load_text (callable): Returns the document text; only called when
+            the index is not cached.
+
+    Returns:
+        ConcordanceIndex: The document's index.
+    """
+    index = get_cached_index(key)
+    if index is None:
+        index = ConcordanceIndex(load_text())
+        cache_index(key, index)
+    return index
@@ -0,0 +1,187 @@
+import os
+import sys
+import zipfile
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, wait
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from basic import (
+    SUPPORTED_FILE_TYPES,
+    Basic,
+    _get_process_pool,
+    flesch_reading_ease,
+    iter_document_chunks,
+)
+
+# Worker processes used to analyze the documents of a corpus
+CORPUS_WORKERS = int(os.environ.get("CORPUS_WORKERS", os.cpu_count() or 1))
+
+# Largest uncompressed ZIP member accepted (guards against ZIP bombs)
+CORPUS_MAX_MEMBER_BYTES = int(
+    os.environ.get("CORPUS_MAX_MEMBER_BYTES", 200 * 1024 * 1024)
+)
+
+
+def iter_zip_documents(source):
+    """
+    Yield the supported documents of a ZIP archive, one at a time.
+
+    Directories, hidden files, macOS resource forks and unsupported file
+    types are skipped.
+
+    Args:
+        source (str or file-like): Path to the archive or a seekable binary
+            stream holding it.
+
+    Yields:
+        tuple: (name, content) where content is the member's bytes, or None
+            if it exceeds CORPUS_MAX_MEMBER_BYTES.
+    """
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            if (
+                info.is_dir()
+                or name.startswith("__MACOSX/")
+                or os.path.basename(name).startswith(".")
+                or os.path.splitext(name)[1].lower() not in SUPPORTED_FILE_TYPES
+            ):
+                continue
+            if info.file_size > CORPUS_MAX_MEMBER_BYTES:
+                yield name, None
+                continue
+            yield name, archive.read(info)
+
+
+def analyze_document(name, content, pdf_backend=None):
+    """
+    Analyze one document of a corpus (runs in a worker process).
+
+    Args:
+        name (str): Document name; its extension selects the extractor.
+        content (bytes): The document itself.
+        pdf_backend (str, optional): PDF extraction backend name.
+
+    Returns:
+        tuple: (result, totals) where result holds the document's metrics
+            and totals the raw counts merged into the corpus aggregates.
+    """
+    # PDF pages are extracted serially: the corpus already fans out per document
+    chunks = iter_document_chunks(
+        content, file_type=name, pdf_backend=pdf_backend, pdf_workers=1
+    )
+    basic = Basic.from_text("".join(chunks))
+    stats = basic.stats
+    word, count = basic.show_most_repeated_word()
+    result = {
+        "type": "document",
+        "filename": name,
+        "word_count": stats.total_words,
+        "unique_words": len(stats.word_counts),
+        "punctuation_count": basic.count_punctuation(),
+        "sentence_count": len(stats.sentences),
+        "average_word_length": basic.find_average_word_length(),
+        "average_sentence_length": round(basic.find_average_sentence_length(), 2),
+        "most_repeated_word": {"word": word, "count": count},
+        "readability": basic.readability_score(),
+    }
+    totals = {
+        "word_counts": stats.word_counts,
+        "total_word_length": stats.total_word_length,
+        "total_syllables": stats.total_syllables,
+        "sentence_count": len(stats.sentences),
+        "sentence_word_total": stats.sentence_word_total,
+        "punctuation_count": result["punctuation_count"],
+    }
+    return result, totals
+
+
+def _error_result(name, message):
+    return {"type": "document", "filename": name, "error": message}
+
+
+def analyze_corpus(documents, pdf_backend=None, workers=None, top_k=20):
+    """
+    Analyze many documents in parallel, yielding results as they finish.
+
+    At most two documents per worker are in flight, so only a bounded
+    number of documents is held in memory however large the corpus is.
+
+    Args:
+        documents (iterable): (name, content) pairs, e.g. from
+            iter_zip_documents(). A None content is reported as too large.
+        pdf_backend (str, optional): PDF extraction backend name.
+        workers (int, optional): Worker processes. Defaults to CORPUS_WORKERS.
+        top_k (int): Number of most frequent corpus words to report.
+
+    Yields:
+        dict: One result per document (in completion order, with an "error"
+            key if it failed), then the corpus-level aggregates.
+    """
+    workers = CORPUS_WORKERS if workers is None else workers
+    word_counts = Counter()
+    totals = Counter()
+    failed = 0
+
+    def collect(name, outcome):
+        nonlocal failed
+        try:
+            result, document_totals = outcome()
+        except Exception as e:
+            failed += 1
+            return _error_result(name, str(e))
+        word_counts.update(document_totals.pop("word_counts"))
+        totals.update(document_totals)
+        totals["documents"] += 1
+        return result
+
+    pending = {}
+    for name, content in documents:
+        if content is None:
+            failed += 1
+            yield _error_result(name, "Document exceeds the maximum allowed size.")
+            continue
+        if workers <= 1:
+            yield collect(name, lambda: analyze_document(name, content, pdf_backend))
+            continue
+        future = _get_process_pool(workers).submit(
+            analyze_document, name, content, pdf_backend
+        )
+        pending[future] = name
+        if len(pending) >= 2 * workers:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield collect(pending.pop(future), future.result)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield collect(pending.pop(future), future.result)
+
+    total_words = sum(word_counts.values())
+    sentence_count = totals["sentence_count"]
+    yield {
+        "type": "corpus",
+        "documents": totals["documents"],
+        "failed": failed,
+        "word_count": total_words,
+        "unique_words": len(word_counts),
+        "punctuation_count": totals["punctuation_count"],
+        "sentence_count": sentence_count,
+        "average_word_length": (
+            round(totals["total_word_length"] / total_words, 2) if total_words else 0.0
+        ),
+        "average_sentence_length": (
+            round(totals["sentence_word_total"] / sentence_count, 2)
+            if sentence_count
+            else 0.0
+        ),
+        "most_common_words": [
+            {"word": word, "count": count}
+            for word, count in word_counts.most_common(top_k)
+        ],
+        "readability": flesch_reading_ease(
+            total_words, sentence_count, totals["total_syllables"]
+        ),
+    }
@@ -0,0 +1,188 @@
+import os
+import sys
+from collections import Counter
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from basic import count_syllables, flesch_reading_ease, get_stopwords
+from tokenizer import tokenize
+
+# Tables that can be exported, and the media type / extension of each format
+EXPORT_TABLES = ("frequencies", "tokens", "sentences")
+EXPORT_FORMATS = {
+    "arrow": ("application/vnd.apache.arrow.file", ".arrow"),
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+}
+
+
+def frequency_table(basic, remove_stopwords=False, lowercase=False):
+    """
+    Build the word frequency table of a text, most frequent first.
+
+    Args:
+        basic (Basic): Basic instance holding the text.
+        remove_stopwords (bool): Leave stopwords out.
+        lowercase (bool): Count words case-insensitively.
+
+    Returns:
+        pyarrow.Table: Columns word (string) and count (int64).
+    """
+    counts = basic.stats.word_counts
+    if lowercase:
+        merged = Counter()
+        for word, count in counts.items():
+            merged[word.lower()] += count
+        counts = merged
+    if remove_stopwords:
+        stop_words = get_stopwords()
+        counts = {w: c for w, c in counts.items() if w.lower() not in stop_words}
+
+    words = list(counts)
+    frequencies = np.fromiter(counts.values(), dtype=np.int64, count=len(words))
+    order = np.argsort(-frequencies, kind="stable")
+    return pa.table(
+        {
+            "word": pa.array(words, type=pa.string()).take(order),
+            "count": frequencies[order],
+        }
+    )
+
+
+def token_table(basic, remove_stopwords=False, lowercase=False):
+    """
+    Build the token stream of a text with the offset of every token.
+
+    Tokens are dictionary-encoded: each distinct token is stored once and
+    the stream itself is an int32 index column.
+
+    Args:
+        basic (Basic): Basic instance holding the text.
+        remove_stopwords (bool): Leave stopwords out.
+        lowercase (bool): Lowercase the tokens.
+
+    Returns:
+        pyarrow.Table: Columns token (dictionary<int32, string>), start and
+            end (character offsets in the text, end exclusive).
+    """
+    spans = basic.token_spans()
+    if remove_stopwords:
+        spans = spans.without(get_stopwords())
+
+    vocabulary = {}
+    indices = np.fromiter(
+        (
+            vocabulary.setdefault(token, len(vocabulary))
+            for token in spans.iter_tokens(lowercase)
+        ),
+        dtype=np.int32,
+        count=len(spans),
+    )
+    tokens = pa.DictionaryArray.from_arrays(
+        indices, pa.array(list(vocabulary), type=pa.string())
+    )
+    return pa.table(
+        {
+            "token": tokens,
+            "start": np.ascontiguousarray(spans.starts),
+            "end": np.ascontiguousarray(spans.ends),
+        }
+    )
+
+
+def sentence_table(basic):
+    """
+    Build per-sentence metrics of a text.
+
+    Args:
+        basic (Basic): Basic instance holding the text.
+
+    Returns:
+        pyarrow.Table: Columns sentence, words, characters, syllables and
+            flesch_reading_ease (one row per sentence, in order).
+    """
+    sentences = basic.stats.sentences
+    words, syllables, scores = [], [], []
+    for sentence in sentences:
+        tokens = tokenize(sentence)
+        total_syllables = sum(count_syllables(token) for token in tokens)
+        words.append(len(tokens))
+        syllables.append(total_syllables)
+        scores.append(flesch_reading_ease(len(tokens), 1, total_syllables)["score"])
+
+    return pa.table(
+        {
+            "sentence": pa.array(sentences, type=pa.string()),
+            "words": pa.array(words, type=pa.int32()),
+            "characters": pa.array([len(s) for s in sentences], type=pa.int32()),
+            "syllables": pa.array(syllables, type=pa.int32()),
+            "flesch_reading_ease": pa.array(scores, type=pa.float64()),
+        }
+    )
+
+
+def write_table(table, export_format):
+    """
+    Serialize a table as an Arrow IPC file or a Parquet file.
+
+    Args:
+        table (pyarrow.Table): Table to serialize.
+        export_format (str): "arrow" or "parquet".
+
+    Returns:
+        pyarrow.Buffer: The serialized file.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    sink = pa.BufferOutputStream()
+    if export_format == "arrow":
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif export_format == "parquet":
+        pq.write_table(table, sink, compression="zstd")
+    else:
+        raise ValueError(
+            f"Unsupported export format '{export_format}'. "
+            f"Choose one of: {', '.join(EXPORT_FORMATS)}."
+        )
+    return sink.getvalue()
+
+
+def export_table(basic, table, export_format, remove_stopwords=False, lowercase=False):
+    """
+    Build one of the export tables of a text and serialize it.
+
+    Args:
+        basic (Basic): Basic instance holding the text.
+        table (str): "frequencies", "tokens" or "sentences".
+        export_format (str): "arrow" or "parquet".
+        remove_stopwords (bool): Leave stopwords out (frequencies, tokens).
+        lowercase (bool): Lowercase the words (frequencies, tokens).
+
+    Returns:
+        pyarrow.Buffer: The serialized file.
+
+    Raises:
+        ValueError: If the table or the format is not supported.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{export_format}'. "
+            f"Choose one of: {', '.join(EXPORT_FORMATS)}."
+        )
+    if table == "frequencies":
+        result = frequency_table(basic, remove_stopwords, lowercase)
+    elif table == "tokens":
+        result = token_table(basic, remove_stopwords, lowercase)
+    elif table == "sentences":
+        result = sentence_table(basic)
+    else:
+        raise ValueError(
+            f"Unsupported export table '{table}'. "
+            f"Choose one of: {', '.join(EXPORT_TABLES)}."
+        )
+    return write_table(result, export_format)
@@ -0,0 +1,176 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from nltk.stem import PorterStemmer, WordNetLemmatizer
+
+# Distinct words whose stem / lemma is remembered (least recently used evicted)
+MORPHOLOGY_CACHE_SIZE = int(os.environ.get("MORPHOLOGY_CACHE_SIZE", 200_000))
+
+# File the caches are saved to on shutdown and reloaded from on startup
+MORPHOLOGY_CACHE_PATH = os.environ.get(
+    "MORPHOLOGY_CACHE_PATH",
+    os.path.abspath(
+        os.path.join(
+            os.path.dirname(__file__), "../BackEnd/cache/morphology_cache.json"
+        )
+    ),
+)
+
+
+class WordFormCache:
+    """
+    Bounded, thread-safe memo of a word -> word form function (a stemmer or
+    a lemmatizer).
+
+    Token lists are mapped once per distinct word type: known types are read
+    from the cache and only the new ones are passed to the function.
+    """
+
+    def __init__(self, function, capacity=MORPHOLOGY_CACHE_SIZE):
+        """
+        Args:
+            function (callable): Computes the form of one word.
+            capacity (int): Maximum number of words remembered.
+        """
+        self.function = function
+        self.capacity = capacity
+        self._forms = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._forms)
+
+    def map(self, words):
+        """
+        Compute the form of every token.
+
+        Args:
+            words (list): Tokens (with repeats).
+
+        Returns:
+            list: The form of each token, in order.
+        """
+        forms = dict.fromkeys(words)
+        missing = []
+        with self._lock:
+            for word in forms:
+                form = self._forms.get(word)
+                if form is None:
+                    missing.append(word)
+                else:
+                    self._forms.move_to_end(word)
+                    forms[word] = form
+
+        # Compute outside the lock; concurrent requests may both compute a
+        # new word, which is harmless
+        computed = {word: self.function(word) for word in missing}
+        forms.update(computed)
+        self._store(computed)
+        return [forms[word] for word in words]
+
+    def _store(self, forms):
+        with self._lock:
+            self._forms.update(forms)
+            while len(self._forms) > self.capacity:
+                self._forms.popitem(last=False)
+
+    def to_dict(self):
+        """
+        Return the remembered forms, least recently used first.
+
+        Returns:
+            dict: Word -> form.
+        """
+        with self._lock:
+            return dict(self._forms)
+
+    def update(self, forms):
+        """
+        Remember forms computed elsewhere (e.g. loaded from disk).
+
+        Args:
+            forms (dict): Word -> form.
+        """
+        self._store(forms)
+
+
+# 🔹 Process-wide caches shared by every Advanced instance
+stem_cache = WordFormCache(PorterStemmer().stem)
+lemma_cache = WordFormCache(WordNetLemmatizer().lemmatize)
+_CACHES = {"stems": stem_cache, "lemmas": lemma_cache}
+
+
+def stem_words(words):
+    """
+    Porter-stem a token list, once per distinct word.
+
+    Args:
+        words (list): Lowercase tokens.
+
+    Returns:
+        list: Stem of each token.
+    """
+    return stem_cache.map(words)
+
+
+def lemmatize_words(words):
+    """
+    WordNet-lemmatize a token list, once per distinct word.
+
+    Args:
+        words (list): Lowercase tokens.
+
+    Returns:
+        list: Lemma of each token.
+    """
+    return lemma_cache.map(words)
+
+
+def save_caches(path=MORPHOLOGY_CACHE_PATH):
+    """
+    Save the stem and lemma caches to a JSON file.
+
+    The file is written next to its destination and then moved into place,
+    so a crash never leaves a truncated cache behind.
+
+    Args:
+        path (str): Destination file.
+
+    Returns:
+        int: Number of entries saved.
+    """
+    payload = {name: cache.to_dict() for name, cache in _CACHES.items()}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(temporary, path)
+    return sum(len(forms) for forms in payload.values())
+
+
+def load_caches(path=MORPHOLOGY_CACHE_PATH):
+    """
+    Reload the stem and lemma caches saved by save_caches.
+
+    A missing or unreadable file leaves the caches empty.
+
+    Args:
+        path (str): Cache file.
+
+    Returns:
+        int: Number of entries loaded.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    loaded = 0
+    for name, cache in _CACHES.items():
+        forms = payload.get(name)
+        if isinstance(forms, dict):
+            cache.update(forms)
+            loaded += len(forms)
+    return loaded
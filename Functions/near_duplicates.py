@@ -0,0 +1,324 @@
+import os
+import sys
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tokenizer import tokenize
+
+# MinHash signature length, words per shingle and the Jaccard similarity
+# from which two documents count as near-duplicates
+MINHASH_PERMUTATIONS = int(os.environ.get("MINHASH_PERMUTATIONS", 128))
+SHINGLE_SIZE = int(os.environ.get("SHINGLE_SIZE", 5))
+NEAR_DUPLICATE_THRESHOLD = float(os.environ.get("NEAR_DUPLICATE_THRESHOLD", 0.8))
+
+# Documents kept per index (least recently added evicted)
+NEAR_DUPLICATE_INDEX_SIZE = int(os.environ.get("NEAR_DUPLICATE_INDEX_SIZE", 10000))
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_SHINGLE_BASE = np.uint64(1_000_003)
+_MINHASH_CHUNK_SIZE = 4096
+
+
+def _token_hash(token):
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def shingle_hashes(words, size=SHINGLE_SIZE):
+    """
+    Hash the distinct word shingles (runs of `size` words) of a document.
+
+    Hashes are deterministic across processes, so signatures computed by
+    different workers or before a restart stay comparable.
+
+    Args:
+        words (list): Word tokens in document order (already normalized).
+        size (int): Words per shingle. Documents shorter than that form a
+            single shingle.
+
+    Returns:
+        numpy.ndarray: Sorted unique 32-bit shingle hashes (uint64).
+    """
+    vocabulary = {}
+    ids = np.fromiter(
+        (vocabulary.setdefault(word, len(vocabulary)) for word in words),
+        dtype=np.int64,
+        count=len(words),
+    )
+    token_hashes = np.fromiter(
+        (_token_hash(token) for token in vocabulary), dtype=np.uint64
+    )
+    hashes = token_hashes[ids]
+    size = max(1, min(size, len(hashes)))
+
+    # Polynomial rolling hash over each window (uint64 arithmetic wraps)
+    shingles = np.zeros(len(hashes) - size + 1, dtype=np.uint64)
+    for offset in range(size):
+        shingles = shingles * _SHINGLE_BASE + hashes[offset : offset + len(shingles)]
+    return np.unique(shingles >> np.uint64(32))
+
+
+class MinHasher:
+    """
+    MinHash signatures from fixed random permutations (a * x + b) mod p.
+
+    The permutations are seeded, so the same text always yields the same
+    signature and signatures from separate instances can be compared.
+    """
+
+    def __init__(self, num_perm=MINHASH_PERMUTATIONS, seed=1):
+        """
+        Args:
+            num_perm (int): Signature length (more = better estimates).
+            seed (int): Seed of the permutations.
+        """
+        rng = np.random.default_rng(seed)
+        # a < 2**31 and x < 2**32 keep a * x + b below 2**64
+        self.a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, shingles):
+        """
+        Compute the MinHash signature of a set of shingle hashes.
+
+        Args:
+            shingles (numpy.ndarray): 32-bit shingle hashes.
+
+        Returns:
+            numpy.ndarray: Signature of length num_perm (uint64).
+
+        Raises:
+            ValueError: If there are no shingles.
+        """
+        if not len(shingles):
+            raise ValueError("Text must contain at least one word.")
+        signature = np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint64)
+        for start in range(0, len(shingles), _MINHASH_CHUNK_SIZE):
+            chunk = shingles[start : start + _MINHASH_CHUNK_SIZE, None]
+            permuted = (chunk * self.a + self.b) % _MERSENNE_PRIME
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature
+
+
+_default_hasher = MinHasher()
+
+
+def minhash_signature(text, shingle_size=SHINGLE_SIZE):
+    """
+    Compute the MinHash signature of a text (case-insensitive word shingles).
+
+    Args:
+        text (str): Document text.
+        shingle_size (int): Words per shingle.
+
+    Returns:
+        numpy.ndarray: Signature of length MINHASH_PERMUTATIONS.
+
+    Raises:
+        ValueError: If the text contains no words.
+    """
+    words = [word.lower() for word in tokenize(text)]
+    return _default_hasher.signature(shingle_hashes(words, shingle_size))
+
+
+def estimate_similarity(first, second):
+    """
+    Estimate the Jaccard similarity of two documents from their signatures.
+
+    Args:
+        first (numpy.ndarray): MinHash signature.
+        second (numpy.ndarray): MinHash signature of the same length.
+
+    Returns:
+        float: Fraction of matching signature positions (0 to 1).
+    """
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+def lsh_parameters(threshold, num_perm=MINHASH_PERMUTATIONS):
+    """
+    Pick the LSH banding (bands x rows = num_perm) for a similarity threshold.
+
+    The banding whose S-curve midpoint (1 / bands) ** (1 / rows) is the
+    largest one not above the threshold is chosen, so pairs at the
+    threshold are found with high probability.
+
+    Args:
+        threshold (float): Jaccard similarity of interest (0 to 1).
+        num_perm (int): Signature length.
+
+    Returns:
+        tuple: (bands, rows).
+    """
+    options = [
+        (num_perm // rows, rows)
+        for rows in range(1, num_perm + 1)
+        if num_perm % rows == 0
+    ]
+    below = [
+        option for option in options if (1 / option[0]) ** (1 / option[1]) <= threshold
+    ]
+    return max(
+        below or options[:1], key=lambda option: (1 / option[0]) ** (1 / option[1])
+    )
+
+
+class NearDuplicateIndex:
+    """
+    Locality-sensitive hashing (LSH) index of MinHash signatures.
+
+    Signatures are cut into bands and every band is hashed into its own
+    table, so a query only compares the documents sharing at least one band
+    with it instead of scanning the whole index.
+    """
+
+    def __init__(
+        self,
+        threshold=NEAR_DUPLICATE_THRESHOLD,
+        num_perm=MINHASH_PERMUTATIONS,
+        capacity=NEAR_DUPLICATE_INDEX_SIZE,
+    ):
+        """
+        Args:
+            threshold (float): Default similarity for matches (0 to 1).
+            num_perm (int): Signature length of the indexed documents.
+            capacity (int): Maximum number of documents kept; the oldest
+                are evicted first.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.capacity = capacity
+        self.bands, self.rows = lsh_parameters(threshold, num_perm)
+        self._tables = [{} for _ in range(self.bands)]
+        self._documents = OrderedDict()  # id -> (signature, metadata)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, document_id):
+        return document_id in self._documents
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [
+            signature[band * rows : (band + 1) * rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, document_id, signature, metadata=None):
+        """
+        Index a document (replacing any entry with the same id).
+
+        Args:
+            document_id (str): Document identifier.
+            signature (numpy.ndarray): Its MinHash signature.
+            metadata (dict, optional): Data returned with matches.
+        """
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Signature must have {self.num_perm} values.")
+        with self._lock:
+            self._remove(document_id)
+            self._documents[document_id] = (signature, metadata or {})
+            for table, key in zip(self._tables, self._band_keys(signature)):
+                table.setdefault(key, set()).add(document_id)
+            while len(self._documents) > self.capacity:
+                self._remove(next(iter(self._documents)))
+
+    def remove(self, document_id):
+        """
+        Remove a document from the index.
+
+        Args:
+            document_id (str): Document identifier.
+
+        Returns:
+            bool: True if the document was indexed.
+        """
+        with self._lock:
+            return self._remove(document_id)
+
+    def _remove(self, document_id):
+        entry = self._documents.pop(document_id, None)
+        if entry is None:
+            return False
+        for table, key in zip(self._tables, self._band_keys(entry[0])):
+            bucket = table[key]
+            bucket.discard(document_id)
+            if not bucket:
+                del table[key]
+        return True
+
+    def get_metadata(self, document_id):
+        """
+        Return the metadata stored with a document.
+
+        Raises:
+            KeyError: If the document is not indexed.
+        """
+        with self._lock:
+            return self._documents[document_id][1]
+
+    def query(self, signature, threshold=None, limit=10, exclude=None):
+        """
+        Find indexed documents similar to a signature.
+
+        Args:
+            signature (numpy.ndarray): MinHash signature of the query.
+            threshold (float, optional): Minimum estimated similarity.
+                Defaults to the index threshold; documents much less
+                similar than the index threshold are rarely candidates.
+            limit (int): Maximum number of matches.
+            exclude (str, optional): Document id left out of the results.
+
+        Returns:
+            list: Dicts with document_id, similarity and metadata, most
+                similar first.
+
+        Raises:
+            ValueError: If limit is negative.
+        """
+        if limit < 0:
+            raise ValueError("limit must not be negative.")
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            candidates = set()
+            for table, key in zip(self._tables, self._band_keys(signature)):
+                candidates.update(table.get(key, ()))
+            candidates.discard(exclude)
+            matches = []
+            for document_id in candidates:
+                indexed, metadata = self._documents[document_id]
+                similarity = estimate_similarity(signature, indexed)
+                if similarity >= threshold:
+                    matches.append(
+                        {
+                            "document_id": document_id,
+                            "similarity": round(similarity, 4),
+                            "metadata": metadata,
+                        }
+                    )
+        matches.sort(key=lambda match: match["similarity"], reverse=True)
+        return matches[:limit]
+
+    def find_duplicate(self, signature, exclude=None):
+        """
+        Return the most similar indexed document above the threshold.
+
+        Args:
+            signature (numpy.ndarray): MinHash signature of the query.
+            exclude (str, optional): Document id left out of the results.
+
+        Returns:
+            dict or None: Best match (see query), or None.
+        """
+        matches = self.query(signature, limit=1, exclude=exclude)
+        return matches[0] if matches else None
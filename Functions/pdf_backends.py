@@ -0,0 +1,226 @@
+import os
+from contextlib import contextmanager
+from importlib.util import find_spec
+
+# Backend used when none is requested explicitly (overridable per call)
+DEFAULT_PDF_BACKEND = os.environ.get("PDF_BACKEND", "pypdf2")
+
+# Registry of backend name -> backend instance
+PDF_BACKENDS = {}
+
+
+def register_pdf_backend(name):
+    """
+    Class decorator that registers a PDF extraction backend under a name.
+
+    Args:
+        name (str): Name used to select the backend (config or per request).
+
+    Returns:
+        callable: Decorator registering an instance of the decorated class.
+    """
+
+    def decorator(cls):
+        cls.name = name
+        PDF_BACKENDS[name] = cls()
+        return cls
+
+    return decorator
+
+
+def get_pdf_backend(name=None):
+    """
+    Look up a registered PDF backend.
+
+    Args:
+        name (str, optional): Backend name. Defaults to DEFAULT_PDF_BACKEND.
+
+    Returns:
+        PDFBackend: The registered backend.
+
+    Raises:
+        ValueError: If no backend is registered under that name.
+    """
+    name = (name or DEFAULT_PDF_BACKEND).lower()
+    if name not in PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend '{name}'. Available backends: {', '.join(PDF_BACKENDS)}"
+        )
+    return PDF_BACKENDS[name]
+
+
+def available_pdf_backends():
+    """
+    List the registered backends whose library is installed.
+
+    Returns:
+        list: Names of usable backends.
+    """
+    return [name for name, backend in PDF_BACKENDS.items() if find_spec(backend.module)]
+
+
+@contextmanager
+def open_source(source):
+    """
+    Open a PDF source as a binary file object.
+
+    Args:
+        source (str or file-like): A file path or a seekable binary stream.
+
+    Yields:
+        file-like: The opened file, or the stream rewound to its start.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield file
+    else:
+        source.seek(0)
+        yield source
+
+
+class PDFBackend:
+    """
+    Base class for PDF text-extraction backends.
+
+    Backends import their library lazily so that a missing optional
+    dependency only fails when that backend is actually selected.
+    """
+
+    name = None
+    module = None
+
+    def count_pages(self, source):
+        """
+        Count the pages of a PDF.
+
+        Args:
+            source (str or file-like): Path to the PDF file or a seekable
+                binary stream holding it.
+
+        Returns:
+            int: Number of pages.
+        """
+        raise NotImplementedError
+
+    def iter_pages(self, source, start=0, stop=None):
+        """
+        Yield the text of pages [start, stop) of a PDF.
+
+        Args:
+            source (str or file-like): Path to the PDF file or a seekable
+                binary stream holding it.
+            start (int): First page index.
+            stop (int, optional): Page index to stop before. Defaults to the
+                page count.
+
+        Yields:
+            str: Extracted text of each page ("" for pages without text).
+        """
+        raise NotImplementedError
+
+
+@register_pdf_backend("pypdf2")
+class PyPDF2Backend(PDFBackend):
+    """Pure-Python extraction with PyPDF2 (the historical default)."""
+
+    module = "PyPDF2"
+
+    def count_pages(self, source):
+        import PyPDF2
+
+        with open_source(source) as file:
+            return len(PyPDF2.PdfReader(file).pages)
+
+    def iter_pages(self, source, start=0, stop=None):
+        import PyPDF2
+
+        with open_source(source) as file:
+            reader = PyPDF2.PdfReader(file)
+            stop = len(reader.pages) if stop is None else stop
+            for index in range(start, stop):
+                yield reader.pages[index].extract_text() or ""
+
+
+@register_pdf_backend("pypdfium2")
+class PdfiumBackend(PDFBackend):
+    """Extraction with pypdfium2 (PDFium bindings, usually the fastest)."""
+
+    module = "pypdfium2"
+
+    def count_pages(self, source):
+        import pypdfium2 as pdfium
+
+        with open_source(source) as file:
+            pdf = pdfium.PdfDocument(file)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+
+    def iter_pages(self, source, start=0, stop=None):
+        import pypdfium2 as pdfium
+
+        with open_source(source) as file:
+            pdf = pdfium.PdfDocument(file)
+            try:
+                stop = len(pdf) if stop is None else stop
+                for index in range(start, stop):
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    try:
+                        yield textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+            finally:
+                pdf.close()
+
+
+@register_pdf_backend("pdfminer")
+class PdfminerBackend(PDFBackend):
+    """Layout-aware extraction with pdfminer.six."""
+
+    module = "pdfminer"
+
+    def count_pages(self, source):
+        from pdfminer.pdfpage import PDFPage
+
+        with open_source(source) as file:
+            return sum(1 for _ in PDFPage.get_pages(file))
+
+    def iter_pages(self, source, start=0, stop=None):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+
+        stop = self.count_pages(source) if stop is None else stop
+        with open_source(source) as file:
+            for page_layout in extract_pages(file, page_numbers=range(start, stop)):
+                yield "".join(
+                    element.get_text()
+                    for element in page_layout
+                    if isinstance(element, LTTextContainer)
+                )
+
+
+@register_pdf_backend("pdfplumber")
+class PdfplumberBackend(PDFBackend):
+    """Extraction with pdfplumber (pdfminer-based, better spacing)."""
+
+    module = "pdfplumber"
+
+    def count_pages(self, source):
+        import pdfplumber
+
+        with open_source(source) as file, pdfplumber.open(file) as pdf:
+            return len(pdf.pages)
+
+    def iter_pages(self, source, start=0, stop=None):
+        import pdfplumber
+
+        with open_source(source) as file, pdfplumber.open(file) as pdf:
+            stop = len(pdf.pages) if stop is None else stop
+            for index in range(start, stop):
+                page = pdf.pages[index]
+                yield page.extract_text() or ""
+                # Drop cached layout objects so memory stays per-page
+                page.close()
@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import hashlib
+import threading
+from collections import OrderedDict, deque
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tokenizer import WORD_CHAR_PATTERN
+
+# Number of compiled automata kept for reuse (least recently used evicted)
+REPLACEMENT_CACHE_SIZE = int(os.environ.get("REPLACEMENT_CACHE_SIZE", 16))
+
+
+def _lower_per_character(text):
+    """Lowercase without changing the length (offsets must stay valid)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _is_word_character(char):
+    # Same word characters as the tokenizer: matras, viramas and zero-width
+    # joiners belong to the word, so they are not word boundaries
+    return WORD_CHAR_PATTERN.match(char) is not None
+
+
+class ReplacementAutomaton:
+    """
+    Aho-Corasick automaton replacing many words or phrases in one pass.
+
+    Matches are resolved leftmost-longest: among overlapping matches the one
+    starting first wins, and among those the longest.
+    """
+
+    def __init__(self, mapping, whole_words=False, ignore_case=False):
+        """
+        Args:
+            mapping (dict): Text to find -> replacement.
+            whole_words (bool): Only replace matches delimited by non-word
+                characters (like regex \\b).
+            ignore_case (bool): Match case-insensitively.
+
+        Raises:
+            ValueError: If the mapping is empty or has an empty key.
+        """
+        if not mapping:
+            raise ValueError("Replacement mapping cannot be empty.")
+        self.whole_words = whole_words
+        self.ignore_case = ignore_case
+        self.replacements = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [()]  # (length, replacement index) ending at each node
+
+        for pattern, replacement in mapping.items():
+            if not pattern:
+                raise ValueError("Replacement mapping cannot contain empty keys.")
+            if ignore_case:
+                pattern = _lower_per_character(pattern)
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                node = next_node
+            self.replacements.append(replacement)
+            # A later duplicate key (e.g. differing only in case) wins
+            self._outputs[node] = ((len(pattern), len(self.replacements) - 1),)
+
+        # Breadth-first: failure links and inherited outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._outputs[child] += self._outputs[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text):
+        """
+        Find the non-overlapping, leftmost-longest matches in a text.
+
+        Args:
+            text (str): Text to search.
+
+        Returns:
+            list: (start, end, replacement index) tuples in text order.
+        """
+        haystack = _lower_per_character(text) if self.ignore_case else text
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        candidates = []
+        node = 0
+        for end, char in enumerate(haystack, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, index in outputs[node]:
+                candidates.append((end - length, end, index))
+
+        if self.whole_words:
+            size = len(text)
+            candidates = [
+                (start, end, index)
+                for start, end, index in candidates
+                if (start == 0 or not _is_word_character(text[start - 1]))
+                and (end == size or not _is_word_character(text[end]))
+            ]
+
+        # Leftmost first, longest first among matches starting together
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+        matches = []
+        last_end = 0
+        for start, end, index in candidates:
+            if start >= last_end:
+                matches.append((start, end, index))
+                last_end = end
+        return matches
+
+    def replace(self, text):
+        """
+        Apply every replacement to a text in a single pass.
+
+        Args:
+            text (str): Text to process.
+
+        Returns:
+            tuple: (new text, number of replacements made).
+        """
+        matches = self.find(text)
+        parts = []
+        position = 0
+        for start, end, index in matches:
+            parts.append(text[position:start])
+            parts.append(self.replacements[index])
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), len(matches)
+
+
+def mapping_key(mapping, whole_words=False, ignore_case=False):
+    """
+    Hash a replacement mapping and its options to a cache key.
+
+    Args:
+        mapping (dict): Text to find -> replacement.
+        whole_words (bool): Word-boundary mode.
+        ignore_case (bool): Case-insensitive mode.
+
+    Returns:
+        str: Hex digest identifying the compiled automaton.
+    """
+    payload = json.dumps(
+        [sorted(mapping.items()), whole_words, ignore_case], ensure_ascii=False
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+_automaton_cache = OrderedDict()
+_automaton_cache_lock = threading.Lock()
+
+
+def get_cached_automaton(key):
+    """
+    Return a cached automaton, marking it as recently used.
+
+    Args:
+        key (str): Automaton key (see mapping_key).
+
+    Returns:
+        ReplacementAutomaton or None: The automaton, or None if not cached.
+    """
+    with _automaton_cache_lock:
+        automaton = _automaton_cache.get(key)
+        if automaton is not None:
+            _automaton_cache.move_to_end(key)
+        return automaton
+
+
+def compile_replacements(mapping, whole_words=False, ignore_case=False):
+    """
+    Compile a mapping into an automaton, reusing a cached one if possible.
+
+    Args:
+        mapping (dict): Text to find -> replacement.
+        whole_words (bool): Only replace whole words.
+        ignore_case (bool): Match case-insensitively.
+
+    Returns:
+        tuple: (key, ReplacementAutomaton).
+    """
+    key = mapping_key(mapping, whole_words, ignore_case)
+    automaton = get_cached_automaton(key)
+    if automaton is None:
+        automaton = ReplacementAutomaton(mapping, whole_words, ignore_case)
+        with _automaton_cache_lock:
+            _automaton_cache[key] = automaton
+            while len(_automaton_cache) > REPLACEMENT_CACHE_SIZE:
+                _automaton_cache.popitem(last=False)
+    return key, automaton
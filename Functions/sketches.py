@@ -0,0 +1,349 @@
+import hashlib
+import heapq
+import math
+from array import array
+from collections import Counter
+from itertools import islice
+
+try:
+    import mmh3
+except ImportError:  # Fall back to hashlib (slower, same guarantees)
+    mmh3 = None
+
+# Default sketch sizes (≈ 0.8% distinct-count error, top-1000 heavy hitters,
+# frequency error ≤ 0.01% of the total with 99% confidence)
+HLL_PRECISION = 14
+HEAVY_HITTER_CAPACITY = 1000
+COUNT_MIN_EPSILON = 1e-4
+COUNT_MIN_DELTA = 0.01
+RARE_WORD_SAMPLE_SIZE = 256
+
+# Words counted together before being folded into the sketches
+SKETCH_BATCH_SIZE = 100_000
+
+_MASK_64 = (1 << 64) - 1
+
+
+def hash_word(word):
+    """
+    Hash a word to two independent 64-bit integers.
+
+    The hash is deterministic across processes (unlike hash()), so sketches
+    built in different workers can be compared and merged.
+
+    Args:
+        word (str): Word to hash.
+
+    Returns:
+        tuple: (h1, h2) unsigned 64-bit hashes.
+    """
+    if mmh3 is not None:
+        return mmh3.hash64(word, signed=False)
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class HyperLogLog:
+    """
+    Fixed-memory distinct counter (2**precision one-byte registers).
+    """
+
+    def __init__(self, precision=HLL_PRECISION):
+        """
+        Args:
+            precision (int): Number of index bits (4-18). Memory is
+                2**precision bytes; relative error is 1.04 / sqrt(2**precision).
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18.")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+        self._rank_bits = 64 - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+
+    def add_hash(self, hashed):
+        """Record a 64-bit hash value."""
+        index = hashed >> self._rank_bits
+        rank = self._rank_bits - (hashed & self._rank_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    @property
+    def relative_error(self):
+        """float: Standard error of the estimate, relative to the count."""
+        return 1.04 / math.sqrt(self.size)
+
+    def estimate(self):
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            int: Estimated distinct count.
+        """
+        m = self.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+class SpaceSaving:
+    """
+    Heavy-hitters (top-k) summary keeping at most `capacity` counters.
+
+    Every reported count overestimates the true count by at most its
+    `error`, and any word occurring more than total / capacity times is
+    guaranteed to be monitored.
+    """
+
+    def __init__(self, capacity=HEAVY_HITTER_CAPACITY):
+        """
+        Args:
+            capacity (int): Number of monitored words.
+        """
+        if capacity < 1:
+            raise ValueError("SpaceSaving capacity must be at least 1.")
+        self.capacity = capacity
+        self.counters = {}  # word -> [count, error]
+        self._heap = []  # (count, word) entries; stale ones are skipped lazily
+
+    def add(self, word, count=1):
+        """Record `count` occurrences of a word."""
+        counter = self.counters.get(word)
+        if counter is None:
+            if len(self.counters) < self.capacity:
+                counter = self.counters[word] = [0, 0]
+            else:
+                # Replace the minimum counter; the new word inherits its count
+                minimum, evicted = self._pop_minimum()
+                del self.counters[evicted]
+                counter = self.counters[word] = [minimum, minimum]
+        counter[0] += count
+        heapq.heappush(self._heap, (counter[0], word))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, w) for w, (c, _) in self.counters.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_minimum(self):
+        while True:
+            count, word = heapq.heappop(self._heap)
+            counter = self.counters.get(word)
+            if counter is not None and counter[0] == count:
+                return count, word
+
+    def top(self, k):
+        """
+        Return the k words with the highest estimated counts.
+
+        Args:
+            k (int): Number of words.
+
+        Returns:
+            list: (word, estimated_count, error) tuples, highest first.
+
+        Raises:
+            ValueError: If k is negative.
+        """
+        if k < 0:
+            raise ValueError("top_k must not be negative.")
+        items = heapq.nlargest(k, self.counters.items(), key=lambda item: item[1][0])
+        return [(word, count, error) for word, (count, error) in items]
+
+
+class CountMinSketch:
+    """
+    Fixed-memory frequency table. Estimates never undercount and exceed
+    the true count by at most epsilon * total with probability 1 - delta.
+    """
+
+    def __init__(self, epsilon=COUNT_MIN_EPSILON, delta=COUNT_MIN_DELTA):
+        """
+        Args:
+            epsilon (float): Error bound as a fraction of the total count.
+            delta (float): Probability that an estimate exceeds the bound.
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1.")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("q", bytes(8 * self.width)) for _ in range(self.depth)]
+        self.total = 0
+
+    def _columns(self, hashes):
+        h1, h2 = hashes
+        return [((h1 + row * h2) & _MASK_64) % self.width for row in range(self.depth)]
+
+    def add_hashes(self, hashes, count=1):
+        """Record `count` occurrences of a pre-hashed word."""
+        for row, column in zip(self.rows, self._columns(hashes)):
+            row[column] += count
+        self.total += count
+
+    def estimate_hashes(self, hashes):
+        """Estimate the count of a pre-hashed word."""
+        return min(row[column] for row, column in zip(self.rows, self._columns(hashes)))
+
+    def estimate(self, word):
+        """
+        Estimate how often a word occurred.
+
+        Args:
+            word (str): Word to look up.
+
+        Returns:
+            int: Estimated count (never below the true count).
+        """
+        return self.estimate_hashes(hash_word(word))
+
+    @property
+    def error_bound(self):
+        """int: Maximum overcount (with probability 1 - delta)."""
+        return math.ceil(self.epsilon * self.total)
+
+
+class WordStatsSketch:
+    """
+    Approximate word statistics over a stream in fixed memory.
+
+    Combines HyperLogLog (distinct words), SpaceSaving (most repeated
+    words), Count-Min (frequency lookups) and a bottom-k hash sample of the
+    vocabulary, scored with Count-Min, for the least repeated word.
+    """
+
+    def __init__(
+        self,
+        precision=HLL_PRECISION,
+        capacity=HEAVY_HITTER_CAPACITY,
+        epsilon=COUNT_MIN_EPSILON,
+        delta=COUNT_MIN_DELTA,
+        sample_size=RARE_WORD_SAMPLE_SIZE,
+    ):
+        """
+        Args:
+            precision (int): HyperLogLog precision.
+            capacity (int): Number of words monitored as heavy hitters.
+            epsilon (float): Count-Min error as a fraction of the total.
+            delta (float): Count-Min failure probability.
+            sample_size (int): Vocabulary sample used for the least
+                repeated word.
+        """
+        self.distinct = HyperLogLog(precision)
+        self.heavy_hitters = SpaceSaving(capacity)
+        self.frequencies = CountMinSketch(epsilon, delta)
+        self.sample_size = sample_size
+        self._sample = []  # max-heap (negated hash) of the smallest word hashes
+        self._sampled = set()
+        self.total_words = 0
+
+    def update(self, words):
+        """
+        Add a batch of words (e.g. one chunk of a document).
+
+        Words are counted per batch first, so each distinct word of the batch
+        is hashed and sketched once.
+
+        Args:
+            words (iterable): Word tokens.
+        """
+        for word, count in Counter(words).items():
+            hashes = hash_word(word)
+            self.total_words += count
+            self.distinct.add_hash(hashes[0])
+            self.frequencies.add_hashes(hashes, count)
+            self.heavy_hitters.add(word, count)
+            self._sample_word(word, hashes[0])
+
+    def _sample_word(self, word, hashed):
+        if word in self._sampled:
+            return
+        if len(self._sample) < self.sample_size:
+            heapq.heappush(self._sample, (-hashed, word))
+            self._sampled.add(word)
+        elif hashed < -self._sample[0][0]:
+            _, evicted = heapq.heapreplace(self._sample, (-hashed, word))
+            self._sampled.discard(evicted)
+            self._sampled.add(word)
+
+    def least_repeated(self):
+        """
+        Return a least repeated word among a uniform sample of the vocabulary.
+
+        Returns:
+            tuple: (word, estimated_count), or ("None", 0) when empty.
+        """
+        if not self._sample:
+            return ("None", 0)
+        return min(
+            ((word, self.frequencies.estimate(word)) for _, word in self._sample),
+            key=lambda item: item[1],
+        )
+
+    def report(self, top_k=10, words=None):
+        """
+        Summarize the stream with error bounds.
+
+        Args:
+            top_k (int): Number of most repeated words to report.
+            words (list, optional): Words whose frequency to estimate.
+
+        Returns:
+            dict: Estimates and their error bounds.
+
+        Raises:
+            ValueError: If top_k is negative.
+        """
+        bound = self.frequencies.error_bound
+        confidence = 1 - self.frequencies.delta
+        least_word, least_count = self.least_repeated()
+        return {
+            "total_words": self.total_words,
+            "unique_words": {
+                "estimate": self.distinct.estimate(),
+                "relative_error": round(self.distinct.relative_error, 4),
+            },
+            "most_repeated_words": [
+                {"word": word, "count": count, "max_overcount": error}
+                for word, count, error in self.heavy_hitters.top(top_k)
+            ],
+            "least_repeated_word": {
+                "word": least_word,
+                "count": least_count,
+                "max_overcount": bound,
+                "confidence": confidence,
+            },
+            "frequencies": {
+                word: {
+                    "count": self.frequencies.estimate(word),
+                    "max_overcount": bound,
+                    "confidence": confidence,
+                }
+                for word in words or []
+            },
+        }
+
+
+def sketch_words(words, batch_size=SKETCH_BATCH_SIZE, **options):
+    """
+    Build a WordStatsSketch from a stream of words in fixed memory.
+
+    Args:
+        words (iterable): Word tokens, e.g. basic.iter_words(chunks).
+        batch_size (int): Words folded into the sketches at a time.
+        **options: Sketch sizes passed to WordStatsSketch.
+
+    Returns:
+        WordStatsSketch: The populated sketch.
+    """
+    sketch = WordStatsSketch(**options)
+    words = iter(words)
+    while True:
+        batch = list(islice(words, batch_size))
+        if not batch:
+            return sketch
+        sketch.update(batch)
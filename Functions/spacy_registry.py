@@ -0,0 +1,260 @@
+import os
+import sys
+import subprocess
+import threading
+from collections import deque
+import spacy
+
+# 🔹 Make sibling modules in Functions/ importable however this module is loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from basic import _get_process_pool
+
+# spaCy model used when none is requested
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+
+# Comma-separated models loaded at application startup (empty = load lazily)
+SPACY_WARMUP_MODELS = [
+    name.strip()
+    for name in os.environ.get("SPACY_WARMUP_MODELS", "").split(",")
+    if name.strip()
+]
+
+# Texts per nlp.pipe batch and worker processes used by batch processing
+SPACY_BATCH_SIZE = int(os.environ.get("SPACY_BATCH_SIZE", 64))
+SPACY_N_PROCESS = int(os.environ.get("SPACY_N_PROCESS", 1))
+
+# 🔹 Pipeline components each task reads its results from. The shared
+# embedding layers they listen to (tok2vec, transformer) are added per model
+# (see needed_components); every other component is skipped.
+TASK_COMPONENTS = {
+    "ner": ("ner",),
+    "pos": ("tagger", "attribute_ruler"),
+    "lemma": ("tagger", "attribute_ruler", "lemmatizer"),
+    "parse": ("parser",),
+}
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def _load(model):
+    try:
+        return spacy.load(model)
+    except OSError:
+        # Download the model if not already downloaded
+        subprocess.run([sys.executable, "-m", "spacy", "download", model])
+        return spacy.load(model)
+
+
+def get_nlp(model=SPACY_MODEL):
+    """
+    Return the shared pipeline of a spaCy model, loading it on first use.
+
+    Every caller in the process gets the same instance, so a model is
+    loaded (and held in memory) only once.
+
+    Args:
+        model (str): spaCy model name.
+
+    Returns:
+        spacy.language.Language: The loaded pipeline.
+    """
+    nlp = _models.get(model)
+    if nlp is None:
+        with _models_lock:
+            nlp = _models.get(model)
+            if nlp is None:
+                nlp = _models[model] = _load(model)
+    return nlp
+
+
+def needed_components(nlp, task):
+    """
+    List the components of a pipeline that a task needs.
+
+    These are the task's own components plus every shared embedding
+    component one of them listens to. en_core_web_sm's NER has its own
+    embedding layer and needs nothing else, while en_core_web_trf's NER
+    listens to the transformer, which must then run too.
+
+    Args:
+        nlp (spacy.language.Language): Loaded pipeline.
+        task (str): Task name (see TASK_COMPONENTS).
+
+    Returns:
+        set: Component names to keep enabled.
+
+    Raises:
+        ValueError: If the task is unknown.
+    """
+    if task not in TASK_COMPONENTS:
+        raise ValueError(
+            f"Unknown spaCy task '{task}'. Choose one of: {', '.join(TASK_COMPONENTS)}."
+        )
+    needed = set(TASK_COMPONENTS[task])
+    # Upstream components come before their listeners, so walking the
+    # pipeline backwards also resolves chained embedding layers
+    for name, component in reversed(nlp.pipeline):
+        if needed.intersection(getattr(component, "listener_map", ())):
+            needed.add(name)
+    return needed
+
+
+def disabled_components(nlp, task):
+    """
+    List the components of a pipeline that a task does not need.
+
+    Args:
+        nlp (spacy.language.Language): Loaded pipeline.
+        task (str): Task name (see TASK_COMPONENTS).
+
+    Returns:
+        list: Component names to disable.
+
+    Raises:
+        ValueError: If the task is unknown.
+    """
+    needed = needed_components(nlp, task)
+    return [name for name in nlp.pipe_names if name not in needed]
+
+
+def process(text, task, model=SPACY_MODEL):
+    """
+    Run a text through the shared pipeline with only a task's components.
+
+    Components are disabled per call, so the shared pipeline is never
+    modified and concurrent requests can use it safely.
+
+    Args:
+        text (str): Text to analyze.
+        task (str): Task name (see TASK_COMPONENTS).
+        model (str): spaCy model name.
+
+    Returns:
+        spacy.tokens.Doc: The processed document.
+    """
+    nlp = get_nlp(model)
+    return nlp(text, disable=disabled_components(nlp, task))
+
+
+def pipe(texts, task, model=SPACY_MODEL, batch_size=SPACY_BATCH_SIZE):
+    """
+    Run many texts through the shared pipeline with only a task's components.
+
+    Texts are processed in this process in batches by nlp.pipe, and
+    documents are yielded in input order as soon as their batch is done.
+
+    Args:
+        texts (iterable): Texts to analyze.
+        task (str): Task name (see TASK_COMPONENTS).
+        model (str): spaCy model name.
+        batch_size (int): Texts per batch.
+
+    Yields:
+        spacy.tokens.Doc: One processed document per text.
+
+    Raises:
+        ValueError: If the task is unknown or batch_size is smaller than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    nlp = get_nlp(model)
+    disable = disabled_components(nlp, task)
+    return nlp.pipe(texts, batch_size=batch_size, disable=disable)
+
+
+def _entity_spans(docs):
+    """(text, label, start, end) of the entities of each document."""
+    return [
+        [(ent.text, ent.label_, ent.start_char, ent.end_char) for ent in doc.ents]
+        for doc in docs
+    ]
+
+
+def _entity_spans_of_batch(texts, model):
+    """
+    Run NER over one batch. Runs inside a worker process of the shared pool,
+    which loads the model on its first batch and keeps it for later ones.
+    """
+    return _entity_spans(pipe(texts, "ner", model, batch_size=len(texts)))
+
+
+def _batches(texts, batch_size):
+    batch = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _iter_entity_spans(texts, model, batch_size, n_process):
+    if n_process == 1:
+        for batch in _batches(texts, batch_size):
+            yield from _entity_spans(pipe(batch, "ner", model, batch_size))
+        return
+
+    # Batches go to the shared process pool (started with an explicit start
+    # method, never forked per request); a few are kept in flight per worker
+    # and results are yielded in input order
+    pool = _get_process_pool(n_process)
+    pending = deque()
+    for batch in _batches(texts, batch_size):
+        pending.append(pool.submit(_entity_spans_of_batch, batch, model))
+        if len(pending) >= 2 * n_process:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def iter_entity_spans(
+    texts,
+    model=SPACY_MODEL,
+    batch_size=SPACY_BATCH_SIZE,
+    n_process=SPACY_N_PROCESS,
+):
+    """
+    Extract the named entities of many texts in batches.
+
+    With n_process > 1 the batches are spread over the shared process pool
+    of basic.py, whose workers keep the model loaded between requests.
+    The model is loaded and the arguments are checked right away; the texts
+    are processed lazily.
+
+    Args:
+        texts (iterable): Texts to analyze.
+        model (str): spaCy model name.
+        batch_size (int): Texts per batch.
+        n_process (int): Worker processes (1 = in this process).
+
+    Returns:
+        iterator: For each text, in input order, a list of
+            (text, label, start, end) tuples.
+
+    Raises:
+        ValueError: If batch_size or n_process is smaller than 1.
+    """
+    if batch_size < 1 or n_process < 1:
+        raise ValueError("batch_size and n_process must be at least 1.")
+    disabled_components(get_nlp(model), "ner")
+    return _iter_entity_spans(texts, model, batch_size, n_process)
+
+
+def warmup(models=None):
+    """
+    Load spaCy models ahead of the first request and run a short text
+    through them.
+
+    Args:
+        models (list, optional): Model names. Defaults to SPACY_WARMUP_MODELS.
+
+    Returns:
+        list: Names of the models loaded.
+    """
+    models = SPACY_WARMUP_MODELS if models is None else models
+    for model in models:
+        get_nlp(model)("Warm up.")
+    return list(models)
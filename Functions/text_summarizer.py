@@ -24,18 +24,26 @@ class TextSummarizer:
     summary = summarizer.summarize(level='brief')
     """
 
-    def __init__(self, input_data):
+    def __init__(self, input_data, file_type=None):
         """
-        Initialize the TextSummarizer class with either a file path or raw text.
+        Initialize the TextSummarizer class with a file path, an in-memory
+        document or raw text.
 
         Args:
-            input_data (str): A file path (PDF, DOCX, TXT) or raw text.
+            input_data (Basic, str, bytes, memoryview or file-like): An
+                already extracted Basic instance, a file path (PDF, DOCX,
+                TXT), the document's bytes / binary stream, or raw text.
+            file_type (str, optional): Declared document type ("pdf",
+                ".docx", "notes.txt"). Required for in-memory documents.
         """
         # Import here to avoid circular imports
         from Functions.basic import Basic
 
         # Initialize Basic class for text extraction and preprocessing
-        self.basic = Basic(input_data)
+        if isinstance(input_data, Basic):
+            self.basic = input_data
+        else:
+            self.basic = Basic(input_data, file_type=file_type)
 
         # Get the processed text - works for both file and raw text
         self.text = self.basic.text
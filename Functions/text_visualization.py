@@ -10,7 +10,7 @@ from collections import Counter
 import numpy as np
 import pandas as pd
 import re
-from Functions.basic import Basic
+from Functions.basic import Basic, is_binary_input
 from Functions.advanced import Advanced
 from Functions.Sentiment_analysis import Sentiment
 
@@ -23,33 +23,46 @@ class TextVisualization:
     - Sentiment Distribution
     - TF-IDF Heatmaps
 
-    **This class only supports file-based input (TXT, DOCX, PDF).**
+    **This class only supports file-based input (TXT, DOCX, PDF)**, given
+    either as a file path or as the document's bytes / binary stream plus
+    its filename.
     """
 
-    def __init__(self, file_path):
+    def __init__(self, input_data, filename=None):
         """
-        Initialize with a file path and extract text from it.
+        Initialize with a document and extract text from it.
 
         Args:
-            file_path (str): Path to the input file (TXT, DOCX, PDF).
+            input_data (str, bytes, memoryview or file-like): Path to the
+                input file (TXT, DOCX, PDF) or its content in memory.
+            filename (str, optional): Original filename. Required for
+                in-memory documents; it names the output files and
+                declares the document type.
 
         Raises:
             ValueError: If the input is not a valid file.
         """
-        if not isinstance(file_path, str) or not os.path.exists(file_path):
+        if is_binary_input(input_data):
+            if not filename:
+                raise ValueError(
+                    "Error: A filename is required for in-memory documents."
+                )
+        elif not isinstance(input_data, str) or not os.path.exists(input_data):
             raise ValueError(
                 "Error: Text visualization only supports file-based input. Provide a valid file path."
             )
+        else:
+            filename = filename or input_data
 
-        # Initialize processing classes
-        self.basic = Basic(file_path)
-        self.advanced = Advanced(file_path)
+        # Initialize processing classes (the document is extracted only once)
+        self.basic = Basic(input_data, file_type=filename)
+        self.advanced = Advanced(self.basic.text)
         self.sentiment = Sentiment(
             self.basic.text
         )  # Sentiment analysis on extracted text
 
         # Extract filename without extension for naming output files
-        self.filename = os.path.splitext(os.path.basename(file_path))[0]
+        self.filename = os.path.splitext(os.path.basename(filename))[0]
 
         # Define output directories for different visualizations
         self.output_dirs = {
@@ -0,0 +1,279 @@
+import os
+import json
+import math
+import time
+import heapq
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Serializes saves of several worker processes (POSIX only)
+except ImportError:
+    fcntl = None
+
+# File the corpus model is saved to on shutdown and reloaded from on startup
+TFIDF_MODEL_PATH = os.environ.get(
+    "TFIDF_MODEL_PATH",
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "../BackEnd/cache/tfidf_model.json")
+    ),
+)
+
+# Minimum seconds between two saves triggered by corpus updates (0 = every time)
+TFIDF_SAVE_INTERVAL = float(os.environ.get("TFIDF_SAVE_INTERVAL", 30))
+
+
+class TfidfModel:
+    """
+    Corpus TF-IDF model with online document-frequency counts.
+
+    Documents are added one at a time (no refitting) and only update the
+    counts of their own terms. Scoring a document touches only the terms it
+    contains, so it stays fast however large the corpus grows. IDF uses the
+    smoothed formula of scikit-learn's TfidfVectorizer:
+    ln((1 + N) / (1 + df)) + 1.
+
+    Counts added since the last save are also kept apart as a pending delta,
+    so several processes can merge their additions into one saved model
+    (see save_corpus_model).
+    """
+
+    def __init__(self):
+        self.documents = 0
+        self.document_frequency = Counter()
+        self._pending_documents = 0
+        self._pending_frequency = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def vocabulary_size(self):
+        """int: Number of distinct terms seen in the corpus."""
+        return len(self.document_frequency)
+
+    def add_document(self, words):
+        """
+        Add a document to the corpus.
+
+        Args:
+            words (iterable): Terms of the document (with repeats).
+
+        Returns:
+            int: Number of distinct terms in the document.
+
+        Raises:
+            ValueError: If the document has no terms (it would only skew
+                every IDF).
+        """
+        terms = set(words)
+        if not terms:
+            raise ValueError("The document has no terms to add to the corpus.")
+        with self._lock:
+            self.document_frequency.update(terms)
+            self.documents += 1
+            self._pending_frequency.update(terms)
+            self._pending_documents += 1
+        return len(terms)
+
+    def idf(self, term):
+        """
+        Inverse document frequency of a term (unseen terms get the maximum).
+
+        Args:
+            term (str): Term.
+
+        Returns:
+            float: Smoothed IDF.
+        """
+        return math.log((1 + self.documents) / (1 + self.document_frequency[term])) + 1
+
+    def score(self, words, top_k=10):
+        """
+        Score the terms of a document against the corpus.
+
+        Args:
+            words (iterable): Terms of the document (with repeats).
+            top_k (int): Number of terms returned.
+
+        Returns:
+            list: (term, score) tuples with L2-normalized TF-IDF scores,
+                highest first (ties in first-seen order).
+        """
+        counts = Counter(words)
+        if not counts:
+            return []
+        with self._lock:
+            documents = self.documents
+            frequency = self.document_frequency
+            weights = {
+                term: count * (math.log((1 + documents) / (1 + frequency[term])) + 1)
+                for term, count in counts.items()
+            }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        top = heapq.nlargest(top_k, weights.items(), key=lambda item: item[1])
+        return [(term, weight / norm) for term, weight in top]
+
+    def to_dict(self):
+        """
+        Return the model state.
+
+        Returns:
+            dict: documents and document_frequency.
+        """
+        with self._lock:
+            return {
+                "documents": self.documents,
+                "document_frequency": dict(self.document_frequency),
+            }
+
+    def load_dict(self, state):
+        """
+        Replace the model state with one returned by to_dict.
+
+        Args:
+            state (dict): documents and document_frequency.
+        """
+        with self._lock:
+            self.documents = int(state["documents"])
+            self.document_frequency = Counter(state["document_frequency"])
+            self._pending_documents = 0
+            self._pending_frequency = Counter()
+
+    def merge_pending(self, state):
+        """
+        Merge the counts added since the last merge into a saved state and
+        adopt the result (which includes other processes' additions).
+
+        Args:
+            state (dict): State as returned by to_dict (updated in place).
+
+        Returns:
+            tuple: The merged state and the merged delta (documents,
+                document_frequency), to restore_pending if saving fails.
+        """
+        with self._lock:
+            delta = (self._pending_documents, self._pending_frequency)
+            frequency = Counter(state["document_frequency"])
+            frequency.update(self._pending_frequency)
+            state["documents"] = int(state["documents"]) + self._pending_documents
+            state["document_frequency"] = dict(frequency)
+            self.documents = state["documents"]
+            self.document_frequency = frequency.copy()
+            self._pending_documents = 0
+            self._pending_frequency = Counter()
+        return state, delta
+
+    def restore_pending(self, delta):
+        """
+        Mark a delta returned by merge_pending as unsaved again.
+
+        Args:
+            delta (tuple): (documents, document_frequency).
+        """
+        documents, frequency = delta
+        with self._lock:
+            self._pending_documents += documents
+            self._pending_frequency.update(frequency)
+
+
+# 🔹 Process-wide corpus model shared by every Advanced instance
+corpus_model = TfidfModel()
+
+_save_lock = threading.Lock()
+_last_save = time.monotonic()
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive lock on `path` across processes (where supported)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_state(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        return {
+            "documents": int(state["documents"]),
+            "document_frequency": dict(state["document_frequency"]),
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"documents": 0, "document_frequency": {}}
+
+
+def save_corpus_model(path=TFIDF_MODEL_PATH):
+    """
+    Merge the documents added since the last save into the saved model.
+
+    The file is re-read under a lock and only this process's additions are
+    added to it, so several worker processes sharing the file never
+    overwrite each other's documents; the in-memory model then picks up
+    theirs. The file is written aside and moved into place.
+
+    Args:
+        path (str): Destination file.
+
+    Returns:
+        int: Number of documents in the saved model.
+    """
+    global _last_save
+    with _save_lock, _locked(path):
+        state, delta = corpus_model.merge_pending(_read_state(path))
+        try:
+            temporary = f"{path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temporary, path)
+        except OSError:
+            corpus_model.restore_pending(delta)
+            raise
+        _last_save = time.monotonic()
+    return state["documents"]
+
+
+def save_corpus_model_throttled(path=TFIDF_MODEL_PATH, interval=None):
+    """
+    Save the corpus model unless it was saved less than `interval` seconds
+    ago (or another thread is saving it), so a crash loses at most the
+    documents of the last interval.
+
+    Args:
+        path (str): Destination file.
+        interval (float, optional): Defaults to TFIDF_SAVE_INTERVAL.
+
+    Returns:
+        bool: Whether the model was saved.
+    """
+    interval = TFIDF_SAVE_INTERVAL if interval is None else interval
+    if time.monotonic() - _last_save < interval or _save_lock.locked():
+        return False
+    save_corpus_model(path)
+    return True
+
+
+def load_corpus_model(path=TFIDF_MODEL_PATH):
+    """
+    Reload the corpus model saved by save_corpus_model.
+
+    A missing or unreadable file leaves the model empty.
+
+    Args:
+        path (str): Model file.
+
+    Returns:
+        int: Number of documents loaded.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            corpus_model.load_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0
+    return corpus_model.documents
@@ -0,0 +1,306 @@
+import re
+import string
+from array import array
+import numpy as np
+import regex
+
+# Scripts whose words keep their combining marks (matras, viramas, nuktas)
+# and zero-width joiners, and are split from adjacent words in other scripts
+INDIC_SCRIPTS = (
+    "Devanagari",
+    "Bengali",
+    "Gurmukhi",
+    "Gujarati",
+    "Oriya",
+    "Tamil",
+    "Telugu",
+    "Kannada",
+    "Malayalam",
+    "Sinhala",
+)
+_INDIC = "".join(rf"\p{{{script}}}" for script in INDIC_SCRIPTS)
+_ASCII_PUNCTUATION = regex.escape(string.punctuation)
+
+# 🔹 Unicode patterns: words are runs of letters, digits and marks of one
+# script family; punctuation is every Unicode P* character plus the ASCII
+# symbols of string.punctuation; sentences end at any Sentence_Terminal
+# (., !, ?, the danda । and double danda ॥, ؟, ۔, 。 ...)
+WORD_PATTERN = regex.compile(rf"(?V1)[\w--[{_INDIC}]]+|[{_INDIC}\p{{M}}\u200c\u200d]+")
+WORD_CHAR_PATTERN = regex.compile(r"[\w\u200c\u200d]")  # \w includes marks (matras)
+PUNCTUATION_PATTERN = regex.compile(rf"[\p{{P}}{_ASCII_PUNCTUATION}]+")
+SENTENCE_SPLIT_PATTERN = regex.compile(r"\p{Sentence_Terminal}")
+SENTENCE_PATTERN = regex.compile(
+    r"[^\p{Sentence_Terminal}]*\p{Sentence_Terminal}+|[^\p{Sentence_Terminal}]+"
+)
+PROPER_NOUN_PATTERN = regex.compile(r"\b\p{Lu}\p{Ll}*\b")
+
+# 🔹 ASCII fast paths, used whenever a text is pure ASCII (same results)
+ASCII_WORD_PATTERN = re.compile(r"\w+")
+ASCII_SENTENCE_SPLIT_PATTERN = re.compile(r"[.!?]")
+ASCII_PROPER_NOUN_PATTERN = re.compile(r"\b[A-Z][a-z]*\b")
+ASCII_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def tokenize(text):
+    """
+    Split text into word tokens.
+
+    Args:
+        text (str): Text in any script.
+
+    Returns:
+        list: Word tokens, in order.
+    """
+    return (ASCII_WORD_PATTERN if text.isascii() else WORD_PATTERN).findall(text)
+
+
+def iter_token_spans(text):
+    """
+    Yield the word tokens of a text with their positions.
+
+    Args:
+        text (str): Text in any script.
+
+    Yields:
+        Match: One match per token (group(), start() and end()).
+    """
+    return (ASCII_WORD_PATTERN if text.isascii() else WORD_PATTERN).finditer(text)
+
+
+def ends_inside_word(text):
+    """
+    Check whether a text ends with a word character (a token may continue).
+
+    Args:
+        text (str): Text chunk.
+
+    Returns:
+        bool: True if the last character belongs to a word.
+    """
+    return bool(text) and WORD_CHAR_PATTERN.match(text[-1]) is not None
+
+
+def split_sentences(text, keep_terminators=False):
+    """
+    Split text into sentences at ., !, ?, danda and other terminators.
+
+    Args:
+        text (str): Text in any script.
+        keep_terminators (bool): Keep the terminating punctuation on each
+            sentence.
+
+    Returns:
+        list: Non-empty, stripped sentences.
+    """
+    if keep_terminators:
+        sentences = SENTENCE_PATTERN.findall(text)
+    elif text.isascii():
+        sentences = ASCII_SENTENCE_SPLIT_PATTERN.split(text)
+    else:
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
+    return [s.strip() for s in sentences if s.strip()]
+
+
+def last_sentence_end(text):
+    """
+    Find where the last complete sentence of a text ends.
+
+    Args:
+        text (str): Text in any script.
+
+    Returns:
+        int: Index just after the last terminator, or 0 if there is none.
+    """
+    if text.isascii():
+        return max(text.rfind(terminator) for terminator in ".!?") + 1
+    end = 0
+    for match in SENTENCE_SPLIT_PATTERN.finditer(text):
+        end = match.end()
+    return end
+
+
+def strip_punctuation(text):
+    """
+    Remove punctuation (Unicode P* and ASCII symbols) from text.
+
+    Args:
+        text (str): Text in any script.
+
+    Returns:
+        str: Text without punctuation.
+    """
+    if text.isascii():
+        return text.translate(ASCII_PUNCTUATION_TABLE)
+    return PUNCTUATION_PATTERN.sub("", text)
+
+
+def count_punctuation_marks(text):
+    """
+    Count punctuation characters (Unicode P* and ASCII symbols).
+
+    Args:
+        text (str): Text in any script.
+
+    Returns:
+        int: Number of punctuation characters.
+    """
+    return len(text) - len(strip_punctuation(text))
+
+
+def find_proper_nouns(text):
+    """
+    Find capitalized words (likely proper nouns) in cased scripts.
+
+    Args:
+        text (str): Text in any script.
+
+    Returns:
+        list: Capitalized words, in order (with repeats).
+    """
+    pattern = ASCII_PROPER_NOUN_PATTERN if text.isascii() else PROPER_NOUN_PATTERN
+    return pattern.findall(text)
+
+
+# Rows of offsets turned into strings at a time when iterating tokens
+_SPAN_BATCH_SIZE = 1 << 16
+
+
+class TokenSpans:
+    """
+    Word tokens of a text stored as (start, end) offsets into the text.
+
+    The offsets live in one compact integer array (two int32 per token
+    instead of a Python str per token), so large documents are tokenized
+    without copying them. Substrings are only created when tokens are
+    iterated or serialized, and every token maps back to its position in
+    the original text.
+    """
+
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, text, offsets):
+        """
+        Args:
+            text (str): Text the offsets point into.
+            offsets (numpy.ndarray): (n, 2) array of token start/end offsets.
+        """
+        self.text = text
+        self.offsets = offsets
+
+    @classmethod
+    def from_text(cls, text):
+        """
+        Tokenize a text into spans.
+
+        Args:
+            text (str): Text in any script.
+
+        Returns:
+            TokenSpans: Spans of its word tokens, in order.
+        """
+        positions = array("q")
+        for match in iter_token_spans(text):
+            positions.extend(match.span())
+        dtype = np.int32 if len(text) < 2**31 else np.int64
+        if not positions:
+            return cls(text, np.empty((0, 2), dtype=dtype))
+        offsets = np.frombuffer(positions, dtype=np.int64).astype(dtype)
+        return cls(text, offsets.reshape(-1, 2))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenSpans(self.text, self.offsets[index])
+        start, end = self.offsets[index]
+        return self.text[start:end]
+
+    def __iter__(self):
+        return self.iter_tokens()
+
+    @property
+    def starts(self):
+        """numpy.ndarray: Start offset of every token."""
+        return self.offsets[:, 0]
+
+    @property
+    def ends(self):
+        """numpy.ndarray: End offset (exclusive) of every token."""
+        return self.offsets[:, 1]
+
+    @property
+    def nbytes(self):
+        """int: Memory used by the offsets."""
+        return self.offsets.nbytes
+
+    def iter_tokens(self, lowercase=False):
+        """
+        Yield the tokens as strings, one at a time.
+
+        Args:
+            lowercase (bool): Lowercase every token.
+
+        Yields:
+            str: Token text.
+        """
+        text = self.text
+        for batch in range(0, len(self.offsets), _SPAN_BATCH_SIZE):
+            rows = self.offsets[batch : batch + _SPAN_BATCH_SIZE].tolist()
+            if lowercase:
+                for start, end in rows:
+                    yield text[start:end].lower()
+            else:
+                for start, end in rows:
+                    yield text[start:end]
+
+    def to_list(self, lowercase=False):
+        """
+        Materialize the tokens (for serialization).
+
+        Args:
+            lowercase (bool): Lowercase every token.
+
+        Returns:
+            list: Token strings, in order.
+        """
+        return list(self.iter_tokens(lowercase))
+
+    def spans(self):
+        """
+        Return the token positions.
+
+        Returns:
+            list: [start, end] offsets of every token, in order.
+        """
+        return self.offsets.tolist()
+
+    def select(self, mask):
+        """
+        Keep a subset of the tokens.
+
+        Args:
+            mask (numpy.ndarray): Boolean mask (or indices) over the tokens.
+
+        Returns:
+            TokenSpans: The selected spans over the same text.
+        """
+        return TokenSpans(self.text, self.offsets[mask])
+
+    def without(self, words, lowercase=True):
+        """
+        Drop the tokens found in a word collection (e.g. stopwords).
+
+        Args:
+            words (collection): Words to drop.
+            lowercase (bool): Compare tokens lowercased.
+
+        Returns:
+            TokenSpans: The remaining spans.
+        """
+        keep = np.fromiter(
+            (token not in words for token in self.iter_tokens(lowercase)),
+            dtype=bool,
+            count=len(self),
+        )
+        return self.select(keep)
@@ -0,0 +1,133 @@
+"""
+Benchmark the registered PDF text-extraction backends on a local corpus.
+
+For every backend, all PDFs in the corpus are extracted in a fresh worker
+process so that the reported peak RSS belongs to that backend alone.
+
+Usage:
+    python benchmark_pdf_backends.py path/to/pdfs [--backends pypdf2 pypdfium2]
+                                                  [--repeat 3]
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+# Ensure the Functions directory is in the module search path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Functions"))
+
+from pdf_backends import available_pdf_backends, get_pdf_backend
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of the current process in MB."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in KB elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        import psutil
+
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+
+def run_backend(backend_name, pdf_paths, repeat, results):
+    """Extract every PDF `repeat` times with one backend (worker process)."""
+    backend = get_pdf_backend(backend_name)
+    baseline_rss = peak_rss_mb()
+    pages = 0
+    characters = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in pdf_paths:
+            for text in backend.iter_pages(path):
+                pages += 1
+                characters += len(text)
+    elapsed = time.perf_counter() - start
+    results.put(
+        {
+            "backend": backend_name,
+            "pages": pages,
+            "characters": characters,
+            "seconds": elapsed,
+            "peak_rss_mb": peak_rss_mb(),
+            "baseline_rss_mb": baseline_rss,
+        }
+    )
+
+
+def benchmark(pdf_paths, backends, repeat):
+    """Benchmark each backend in its own process and return the results."""
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for backend_name in backends:
+        results = context.Queue()
+        worker = context.Process(
+            target=run_backend, args=(backend_name, pdf_paths, repeat, results)
+        )
+        worker.start()
+        # Drain the queue before joining: a worker that has put its result
+        # cannot exit until the result is read
+        row = None
+        while row is None and (worker.is_alive() or not results.empty()):
+            try:
+                row = results.get(timeout=1)
+            except queue.Empty:
+                pass
+        worker.join()
+        if row is None or worker.exitcode != 0:
+            print(f"⚠ Backend {backend_name} failed (exit code {worker.exitcode})")
+            continue
+        rows.append(row)
+    return rows
+
+
+def print_report(rows):
+    """Print the benchmark results as a table, fastest backend first."""
+    header = f"{'backend':<12}{'pages':>8}{'seconds':>10}{'pages/s':>10}{'chars':>12}{'peak RSS MB':>14}{'Δ RSS MB':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in sorted(rows, key=lambda r: r["seconds"]):
+        pages_per_second = row["pages"] / row["seconds"] if row["seconds"] else 0.0
+        print(
+            f"{row['backend']:<12}{row['pages']:>8}{row['seconds']:>10.2f}"
+            f"{pages_per_second:>10.1f}{row['characters']:>12}"
+            f"{row['peak_rss_mb']:>14.1f}"
+            f"{row['peak_rss_mb'] - row['baseline_rss_mb']:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("corpus", help="Directory containing PDF files")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=None,
+        help="Backends to compare (default: every installed backend)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Extraction passes over the corpus"
+    )
+    args = parser.parse_args()
+
+    pdf_paths = sorted(
+        glob.glob(os.path.join(args.corpus, "**", "*.pdf"), recursive=True)
+    )
+    if not pdf_paths:
+        print(f"❌ No PDF files found in {args.corpus}")
+        sys.exit(1)
+
+    backends = args.backends or available_pdf_backends()
+    print(f"📄 {len(pdf_paths)} PDF files, backends: {', '.join(backends)}\n")
+    print_report(benchmark(pdf_paths, backends, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark word tokenization and sentence splitting on Hindi and English text.
+
+Compares the previous ASCII regex path (\\b\\w+\\b words, [.!?] sentences),
+NLTK's word_tokenize / sent_tokenize and the script-aware tokenizer in
+Functions/tokenizer.py. Without corpus files, built-in sample paragraphs are
+repeated to the requested size.
+
+Usage:
+    python benchmark_tokenizers.py [--hindi hi.txt] [--english en.txt]
+                                   [--size 2000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Ensure the Functions directory is in the module search path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Functions"))
+
+from tokenizer import split_sentences, tokenize
+
+HINDI_SAMPLE = (
+    "भारत एक विशाल देश है। यहाँ अनेक भाषाएँ बोली जाती हैं, जैसे हिंदी, बंगाली, "
+    "तमिल और तेलुगु। क्षत्रिय राजाओं ने ज़्यादातर उत्तर भारत पर शासन किया॥ "
+    "क्या आप कल दिल्ली जाएँगे? हाँ, मैं सुबह की ट्रेन से जाऊँगा! "
+)
+ENGLISH_SAMPLE = (
+    "India is a vast country. Many languages are spoken here, such as Hindi, "
+    "Bengali, Tamil and Telugu. Dr. Rao's report (2nd ed.) wasn't published "
+    "until 2021! Will you travel to Delhi tomorrow? Yes, by the morning train. "
+)
+
+LEGACY_WORD_PATTERN = re.compile(r"\b\w+\b")
+LEGACY_SENTENCE_PATTERN = re.compile(r"[.!?]")
+
+
+def legacy_tokenizer(text):
+    """Previous Basic tokenization: ASCII-centric regexes."""
+    sentences = [s.strip() for s in LEGACY_SENTENCE_PATTERN.split(text) if s.strip()]
+    return LEGACY_WORD_PATTERN.findall(text), sentences
+
+
+def nltk_tokenizer(text):
+    """Previous Advanced tokenization: NLTK punkt and Treebank tokenizers."""
+    from nltk.tokenize import sent_tokenize, word_tokenize
+
+    return word_tokenize(text), sent_tokenize(text)
+
+
+def script_aware_tokenizer(text):
+    """Current tokenization shared by Basic and Advanced."""
+    return tokenize(text), split_sentences(text)
+
+
+TOKENIZERS = {
+    "regex": legacy_tokenizer,
+    "nltk": nltk_tokenizer,
+    "script-aware": script_aware_tokenizer,
+}
+
+
+def nltk_available():
+    """Return True if NLTK and its punkt models are installed."""
+    try:
+        import nltk
+
+        nltk.data.find("tokenizers/punkt")
+        return True
+    except (ImportError, LookupError):
+        return False
+
+
+def load_corpus(path, sample, size):
+    """Read a corpus file, or repeat a sample paragraph to `size` characters."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    return sample * (size // len(sample) + 1)
+
+
+def benchmark(text, tokenizers, repeat):
+    """Time each tokenizer on a text (best of `repeat` runs)."""
+    rows = []
+    for name in tokenizers:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            words, sentences = TOKENIZERS[name](text)
+            best = min(best, time.perf_counter() - start)
+        rows.append(
+            {
+                "tokenizer": name,
+                "tokens": len(words),
+                "sentences": len(sentences),
+                "seconds": best,
+                "sample": " | ".join(words[:6]),
+            }
+        )
+    return rows
+
+
+def print_report(corpus_name, rows):
+    """Print the benchmark results as a table, fastest tokenizer first."""
+    print(f"\n📄 {corpus_name}")
+    header = f"{'tokenizer':<14}{'tokens':>10}{'sentences':>11}{'seconds':>10}{'tokens/s':>13}  first tokens"
+    print(header)
+    print("-" * len(header))
+    for row in sorted(rows, key=lambda r: r["seconds"]):
+        tokens_per_second = row["tokens"] / row["seconds"] if row["seconds"] else 0.0
+        print(
+            f"{row['tokenizer']:<14}{row['tokens']:>10}{row['sentences']:>11}"
+            f"{row['seconds']:>10.3f}{tokens_per_second:>13.0f}  {row['sample']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hindi", help="UTF-8 Hindi corpus file")
+    parser.add_argument("--english", help="UTF-8 English corpus file")
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=2_000_000,
+        help="Characters of built-in sample text per language",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per tokenizer"
+    )
+    args = parser.parse_args()
+
+    tokenizers = list(TOKENIZERS)
+    if not nltk_available():
+        print("⚠ NLTK punkt models not installed, skipping the nltk tokenizer")
+        tokenizers.remove("nltk")
+
+    for corpus_name, path, sample in (
+        ("Hindi", args.hindi, HINDI_SAMPLE),
+        ("English", args.english, ENGLISH_SAMPLE),
+    ):
+        text = load_corpus(path, sample, args.size)
+        print_report(
+            f"{corpus_name}: {len(text)} characters",
+            benchmark(text, tokenizers, args.repeat),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from collections import Counter
+
+from analysis_session import AnalysisSession
+from tokenizer import tokenize
+
+
+def most_repeated(session):
+    word = session.metrics()["most_repeated_word"]
+    return word["word"], word["count"]
+
+
+def test_most_repeated_word_ties_match_counter_across_appends():
+    chunks = ["Beta alpha. ", "Gamma alpha beta. ", "Delta gamma", " gamma delta."]
+    session = AnalysisSession()
+    text = ""
+    for chunk in chunks:
+        session.append(chunk)
+        text += chunk
+        assert most_repeated(session) == Counter(tokenize(text)).most_common(1)[0]
+
+
+def test_completed_sentences_are_counted_not_kept():
+    session = AnalysisSession("Good day. Bad")
+    assert session.completed_sentences == 1
+    metrics = session.append(" night! Still going")
+    assert [s["text"] for s in metrics["new_sentences"]] == ["Bad night"]
+    assert session.completed_sentences == 2
+    assert metrics["sentence_count"] == 3  # plus the pending tail
+    assert not hasattr(session, "sentences")
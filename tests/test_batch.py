@@ -0,0 +1,42 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from basic import analyze_batch
+from BackEnd.src.api.endpoints.basic import router
+from BackEnd.src.schemas.basic import BATCH_MAX_TEXTS
+
+TEXTS = ["Hello world. Hello again!", "One", "", "Two words. Two more words."]
+METRICS = ["count_words", "count_punctuation", "most_repeated_word"]
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_parallel_batch_matches_sequential():
+    texts = TEXTS * 5
+    sequential = analyze_batch(texts, METRICS, workers=1)
+    parallel = analyze_batch(texts, METRICS, workers=2, threshold=1)
+    assert parallel == sequential
+    assert sequential["count_words"][:2] == [4, 1]
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError):
+        analyze_batch(TEXTS, ["no_such_metric"])
+
+
+@pytest.mark.parametrize("path", ["/basic/batch", "/basic/readability/batch"])
+@pytest.mark.parametrize("texts", [[], ["x"] * (BATCH_MAX_TEXTS + 1)])
+def test_batch_endpoints_bound_the_number_of_texts(path, texts):
+    response = client.post(path, json={"texts": texts, "metrics": ["count_words"]})
+    assert response.status_code == 422
+
+
+def test_batch_endpoint_returns_one_column_per_metric():
+    response = client.post("/basic/batch", json={"texts": TEXTS, "metrics": METRICS})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == len(TEXTS)
+    assert set(body["results"]) == set(METRICS)
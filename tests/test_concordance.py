@@ -0,0 +1,55 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from concordance import ConcordanceIndex
+from BackEnd.src.api.endpoints.basic import router
+
+TEXT = "The cat sat. The cat ran away, and the dog sat with the cat."
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_search_finds_phrases_with_context():
+    result = ConcordanceIndex(TEXT).search("the cat", window=1, limit=10)
+    assert result["total"] == 3
+    first = result["results"][0]
+    assert first["match"] == "The cat"
+    assert first["offset"] == 0
+    assert first["right"] == " sat"
+    assert [line["position"] for line in result["results"]] == sorted(
+        line["position"] for line in result["results"]
+    )
+
+
+def test_limit_caps_lines_but_not_total():
+    result = ConcordanceIndex(TEXT).search("cat", window=0, limit=2)
+    assert result["total"] == 3
+    assert len(result["results"]) == 2
+    assert result["results"][0]["left"] == result["results"][0]["right"] == ""
+
+
+@pytest.mark.parametrize("window, limit", [(-1, 10), (2, -1)])
+def test_negative_window_or_limit_is_rejected(window, limit):
+    with pytest.raises(ValueError):
+        ConcordanceIndex(TEXT).search("cat", window=window, limit=limit)
+
+
+@pytest.mark.parametrize("bounds", [{"window": -1}, {"limit": -1}])
+def test_endpoint_rejects_negative_bounds(bounds):
+    body = {"text": TEXT, "query": "cat", **bounds}
+    assert client.post("/basic/concordance/text", json=body).status_code == 422
+
+
+def test_cached_index_is_reused_by_lookup():
+    body = {"text": TEXT, "query": "cat", "window": 1}
+    created = client.post("/basic/concordance/text", json=body).json()
+    response = client.get(
+        f"/basic/concordance/{created['document_id']}",
+        params={"query": "dog", "window": 1},
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert response.json()["results"][0]["left"] == "the "
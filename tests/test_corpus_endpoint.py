@@ -0,0 +1,48 @@
+import io
+import json
+import zipfile
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from BackEnd.src.api.endpoints.basic import router
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_corpus_streams_one_line_per_document_then_aggregates():
+    files = [
+        ("files", ("one.txt", b"Apple banana apple. Cherry apple.", "text/plain")),
+        (
+            "files",
+            (
+                "more.zip",
+                make_zip({"two.txt": "Banana cherry. Banana!", "skip.png": "x"}),
+                "application/zip",
+            ),
+        ),
+    ]
+    response = client.post("/basic/corpus", files=files)
+    assert response.status_code == 200
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    documents, corpus = lines[:-1], lines[-1]
+    assert sorted(document["filename"] for document in documents) == [
+        "one.txt",
+        "two.txt",
+    ]
+    assert not any("error" in document for document in documents)
+    assert corpus["type"] == "corpus"
+    assert corpus["documents"] == 2
+    assert corpus["failed"] == 0
+    assert corpus["word_count"] == sum(d["word_count"] for d in documents)
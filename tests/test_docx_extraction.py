@@ -0,0 +1,37 @@
+import io
+import zipfile
+
+from basic import iter_docx_paragraphs
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p>
+      <w:pPr>
+        <w:tabs>
+          <w:tab w:val="left" w:pos="2880"/>
+          <w:tab w:val="right" w:pos="8640"/>
+        </w:tabs>
+      </w:pPr>
+      <w:r><w:t>Name</w:t></w:r>
+      <w:r><w:tab/><w:t>Value</w:t></w:r>
+    </w:p>
+    <w:p>
+      <w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def make_docx(document_xml):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document_xml)
+    buffer.seek(0)
+    return buffer
+
+
+def test_tab_stop_definitions_are_not_text():
+    paragraphs = list(iter_docx_paragraphs(make_docx(DOCUMENT_XML)))
+    assert paragraphs == ["Name\tValue", "Line one\nLine two"]
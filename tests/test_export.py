@@ -0,0 +1,90 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from BackEnd.src.api.endpoints.basic import router
+from basic import Basic
+from export import export_table
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+TEXT = "Apple banana apple. Cherry apple banana!"
+
+
+def read_arrow(buffer):
+    return pa.ipc.open_file(pa.BufferReader(buffer)).read_all()
+
+
+def read_parquet(buffer):
+    return pq.read_table(pa.BufferReader(buffer))
+
+
+@pytest.mark.parametrize(
+    "reader, export_format", [(read_arrow, "arrow"), (read_parquet, "parquet")]
+)
+def test_frequencies_round_trip_most_frequent_first(reader, export_format):
+    table = reader(export_table(Basic(TEXT), "frequencies", export_format))
+    assert table.to_pydict() == {
+        # Ties keep first-seen order
+        "word": ["banana", "apple", "Apple", "Cherry"],
+        "count": [2, 2, 1, 1],
+    }
+
+
+def test_lowercase_frequencies_merge_words():
+    table = read_arrow(
+        export_table(Basic(TEXT), "frequencies", "arrow", lowercase=True)
+    )
+    assert table.to_pydict() == {
+        "word": ["apple", "banana", "cherry"],
+        "count": [3, 2, 1],
+    }
+
+
+def test_tokens_are_dictionary_encoded_with_offsets():
+    table = read_arrow(export_table(Basic(TEXT), "tokens", "arrow"))
+    token = table.column("token").combine_chunks()
+    assert pa.types.is_dictionary(token.type)
+    assert len(token.dictionary) == 4
+    tokens = token.to_pylist()
+    assert tokens[:3] == ["Apple", "banana", "apple"]
+    starts = table.column("start").to_pylist()
+    ends = table.column("end").to_pylist()
+    assert [TEXT[s:e] for s, e in zip(starts, ends)] == tokens
+
+
+def test_sentences_table():
+    table = read_parquet(export_table(Basic(TEXT), "sentences", "parquet"))
+    assert table.column("sentence").to_pylist() == [
+        "Apple banana apple",
+        "Cherry apple banana",
+    ]
+    assert table.column("words").to_pylist() == [3, 3]
+    assert table.schema.field("flesch_reading_ease").type == pa.float64()
+
+
+def test_unknown_table_or_format_is_rejected():
+    with pytest.raises(ValueError):
+        export_table(Basic(TEXT), "paragraphs", "arrow")
+    with pytest.raises(ValueError):
+        export_table(Basic(TEXT), "tokens", "csv")
+
+
+def test_export_endpoint_downloads_a_parquet_file():
+    response = client.post(
+        "/basic/export/text",
+        json={"text": TEXT, "table": "frequencies", "format": "parquet"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert (
+        'filename="text_frequencies.parquet"' in response.headers["content-disposition"]
+    )
+    assert read_parquet(response.content).column("word").to_pylist()[0] == "banana"
+
+    response = client.post("/basic/export/text", json={"text": TEXT, "format": "csv"})
+    assert response.status_code == 400
@@ -0,0 +1,46 @@
+import io
+import zipfile
+
+import pytest
+
+from basic import Basic
+from Sentiment_analysis import Sentiment
+
+TEXT = "Bytes are documents too. Great news!"
+
+
+def make_docx(paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            f'wordprocessingml/2006/main"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_txt_bytes_and_streams_match_the_file(tmp_path, wrap):
+    path = tmp_path / "notes.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    from_memory = Basic(wrap(TEXT.encode("utf-8")), file_type="notes.txt")
+    assert from_memory.text == Basic(str(path)).text == TEXT
+
+
+def test_pdf_and_docx_in_memory(make_pdf):
+    assert Basic(make_pdf([TEXT]), file_type="pdf").text == TEXT
+    assert Basic(make_docx([TEXT]), file_type=".docx").text == TEXT
+
+
+def test_in_memory_document_needs_a_file_type():
+    with pytest.raises(ValueError):
+        Basic(TEXT.encode("utf-8"))
+    with pytest.raises(ValueError):
+        Basic(TEXT.encode("utf-8"), file_type="image.png")
+
+
+def test_sentiment_accepts_in_memory_documents():
+    from_bytes = Sentiment(TEXT.encode("utf-8"), file_type="txt").analyze()
+    assert from_bytes == Sentiment(TEXT).analyze()
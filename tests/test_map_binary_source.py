@@ -0,0 +1,26 @@
+import io
+import tempfile
+
+from basic import map_binary_source
+
+DATA = b"hello world\n" * 100
+
+
+def test_maps_spooled_upload_held_in_memory():
+    spooled = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    spooled.write(DATA)
+    spooled.seek(0)
+    with map_binary_source(spooled) as buffer:
+        assert bytes(buffer[:]) == DATA
+
+
+def test_views_bytes_io_in_place():
+    with map_binary_source(io.BytesIO(DATA)) as buffer:
+        assert isinstance(buffer, memoryview)
+        assert bytes(buffer) == DATA
+
+
+def test_unmappable_stream_yields_none():
+    stream = io.BufferedReader(io.BytesIO(DATA))
+    with map_binary_source(stream) as buffer:
+        assert buffer is None
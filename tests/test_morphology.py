@@ -0,0 +1,65 @@
+import json
+
+import morphology
+from morphology import WordFormCache, load_caches, save_caches, stem_words
+
+
+class CountingUpper:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, word):
+        self.calls.append(word)
+        return word.upper()
+
+
+def test_map_computes_each_word_type_once():
+    function = CountingUpper()
+    cache = WordFormCache(function)
+    assert cache.map(["a", "b", "a", "a"]) == ["A", "B", "A", "A"]
+    assert cache.map(["b", "c", "a"]) == ["B", "C", "A"]
+    assert function.calls == ["a", "b", "c"]
+    assert len(cache) == 3
+
+
+def test_least_recently_used_words_are_evicted():
+    function = CountingUpper()
+    cache = WordFormCache(function, capacity=2)
+    cache.map(["a", "b"])
+    cache.map(["a"])  # b is now the least recently used
+    cache.map(["c"])
+    assert cache.to_dict() == {"a": "A", "c": "C"}
+    cache.map(["b"])
+    assert function.calls == ["a", "b", "c", "b"]
+
+
+def test_stem_words_uses_porter_stems():
+    assert stem_words(["running", "runs", "running"]) == ["run", "run", "run"]
+
+
+def test_caches_round_trip_through_a_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "morphology.json"
+    stems = WordFormCache(CountingUpper())
+    lemmas = WordFormCache(CountingUpper())
+    monkeypatch.setattr(morphology, "_CACHES", {"stems": stems, "lemmas": lemmas})
+    stems.map(["cats", "dogs"])
+    lemmas.map(["geese"])
+
+    assert save_caches(str(path)) == 3
+    assert json.loads(path.read_text(encoding="utf-8"))["lemmas"] == {"geese": "GEESE"}
+
+    reloaded = CountingUpper()
+    fresh = WordFormCache(reloaded)
+    monkeypatch.setattr(
+        morphology, "_CACHES", {"stems": fresh, "lemmas": WordFormCache(str)}
+    )
+    assert load_caches(str(path)) == 3
+    assert fresh.map(["dogs", "cats"]) == ["DOGS", "CATS"]
+    assert reloaded.calls == []
+
+
+def test_missing_or_corrupt_cache_file_loads_nothing(tmp_path):
+    assert load_caches(str(tmp_path / "missing.json")) == 0
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json", encoding="utf-8")
+    assert load_caches(str(corrupt)) == 0
@@ -0,0 +1,110 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from BackEnd.src.api.endpoints.basic import router
+from BackEnd.src.services import basic_service
+from near_duplicates import (
+    NearDuplicateIndex,
+    estimate_similarity,
+    lsh_parameters,
+    minhash_signature,
+)
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+ORIGINAL = " ".join(f"word{i}" for i in range(200))
+NEAR_COPY = ORIGINAL.replace("word100", "changed")
+UNRELATED = " ".join(f"other{i}" for i in range(200))
+
+
+def test_signature_is_deterministic_and_case_insensitive():
+    first = minhash_signature(ORIGINAL)
+    assert (first == minhash_signature(ORIGINAL.upper())).all()
+    assert estimate_similarity(first, minhash_signature(ORIGINAL)) == 1.0
+
+
+def test_signature_estimates_jaccard_similarity():
+    # One changed word alters 5 of 196 shingles: Jaccard = 191 / 201
+    similarity = estimate_similarity(
+        minhash_signature(ORIGINAL), minhash_signature(NEAR_COPY)
+    )
+    assert similarity == pytest.approx(191 / 201, abs=0.1)
+    assert (
+        estimate_similarity(minhash_signature(ORIGINAL), minhash_signature(UNRELATED))
+        < 0.1
+    )
+
+
+def test_text_without_words_is_rejected():
+    with pytest.raises(ValueError):
+        minhash_signature("... !!!")
+
+
+def test_lsh_parameters_cover_all_permutations():
+    bands, rows = lsh_parameters(0.8, 128)
+    assert bands * rows == 128
+    assert (1 / bands) ** (1 / rows) <= 0.8
+
+
+def test_index_finds_near_duplicates_only():
+    index = NearDuplicateIndex()
+    index.add("original", minhash_signature(ORIGINAL), {"filename": "a.txt"})
+    index.add("unrelated", minhash_signature(UNRELATED))
+
+    matches = index.query(minhash_signature(NEAR_COPY))
+    assert [match["document_id"] for match in matches] == ["original"]
+    assert matches[0]["metadata"] == {"filename": "a.txt"}
+    assert index.find_duplicate(minhash_signature(ORIGINAL), exclude="original") is None
+
+
+def test_index_evicts_oldest_documents():
+    index = NearDuplicateIndex(capacity=2)
+    for name in ("first", "second", "third"):
+        index.add(name, minhash_signature(f"{name} {UNRELATED}"))
+    assert len(index) == 2
+    assert "first" not in index
+    assert index.remove("second") and not index.remove("second")
+
+
+def test_query_rejects_negative_limit():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex().query(minhash_signature(ORIGINAL), limit=-1)
+
+
+def test_index_and_query_endpoints(monkeypatch):
+    monkeypatch.setattr(basic_service, "near_duplicate_index", NearDuplicateIndex())
+    files = [
+        ("files", ("a.txt", ORIGINAL.encode(), "text/plain")),
+        ("files", ("b.txt", NEAR_COPY.encode(), "text/plain")),
+    ]
+    response = client.post("/basic/near-duplicates/index", files=files)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["indexed"] == 2
+    first, second = result["documents"]
+    assert first["duplicates"] == []
+    assert [d["filename"] for d in second["duplicates"]] == ["a.txt"]
+
+    response = client.post(
+        "/basic/near-duplicates/query/text", json={"text": UNRELATED}
+    )
+    assert response.json() == {"similar": []}
+
+    response = client.post(
+        "/basic/near-duplicates/query/text", json={"text": NEAR_COPY, "limit": 1}
+    )
+    assert [d["filename"] for d in response.json()["similar"]] == ["b.txt"]
+
+
+def test_query_endpoint_validates_bounds():
+    response = client.post(
+        "/basic/near-duplicates/query/text", json={"text": "x", "limit": -1}
+    )
+    assert response.status_code == 422
+    response = client.post(
+        "/basic/near-duplicates/query/text", json={"text": "x", "threshold": 2}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,42 @@
+import pytest
+import spacy
+
+from spacy_registry import iter_entity_spans
+
+TEXTS = ["Alice met Bob.", "Nobody here.", "Bob visited Paris.", "Paris!", "Alice"]
+EXPECTED = [
+    [("Alice", "PERSON", 0, 5), ("Bob", "PERSON", 10, 13)],
+    [],
+    [("Bob", "PERSON", 0, 3), ("Paris", "GPE", 12, 17)],
+    [("Paris", "GPE", 0, 5)],
+    [("Alice", "PERSON", 0, 5)],
+]
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns(
+        [
+            {"label": "PERSON", "pattern": "Alice"},
+            {"label": "PERSON", "pattern": "Bob"},
+            {"label": "GPE", "pattern": "Paris"},
+        ]
+    )
+    path = tmp_path_factory.mktemp("model") / "ner"
+    nlp.to_disk(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_entities_come_back_in_input_order(model, n_process):
+    spans = iter_entity_spans(TEXTS, model, batch_size=2, n_process=n_process)
+    assert list(spans) == EXPECTED
+
+
+def test_invalid_arguments_are_rejected_before_processing(model):
+    with pytest.raises(ValueError):
+        iter_entity_spans(TEXTS, model, batch_size=0)
+    with pytest.raises(ValueError):
+        iter_entity_spans(TEXTS, model, n_process=0)
@@ -0,0 +1,48 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from basic import Basic, count_ngrams
+from BackEnd.src.api.endpoints.basic import router
+
+TEXT = "a b c a b c a b d e f g"
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_top_ngrams_most_frequent_first_ties_in_key_order():
+    assert Basic(TEXT).top_ngrams(2, 3) == [("a b", 3), ("b c", 2), ("c a", 2)]
+
+
+def test_top_k_larger_than_distinct_returns_everything():
+    counts = count_ngrams(TEXT.split(), 3)
+    assert counts.total == 10
+    assert len(counts.top(100)) == len(counts) == 7
+
+
+def test_top_zero_is_empty():
+    assert Basic(TEXT).top_ngrams(2, 0) == []
+
+
+def test_negative_top_k_is_rejected():
+    with pytest.raises(ValueError):
+        Basic(TEXT).top_ngrams(2, -1)
+
+
+def test_invalid_n_is_rejected():
+    with pytest.raises(ValueError):
+        Basic(TEXT).top_ngrams(0)
+
+
+@pytest.mark.parametrize("body", [{"top_k": -1}, {"n": 0}])
+def test_endpoint_rejects_invalid_bounds(body):
+    response = client.post("/basic/ngrams/text", json={"text": TEXT, **body})
+    assert response.status_code == 422
+
+
+def test_endpoint_returns_top_ngrams():
+    response = client.post("/basic/ngrams/text", json={"text": TEXT, "top_k": 1})
+    assert response.status_code == 200
+    assert response.json()["ngrams"] == [{"ngram": "a b", "count": 3}]
@@ -0,0 +1,23 @@
+import io
+
+import basic
+from basic import iter_pdf_pages
+
+PAGES = [f"Page number {index} text" for index in range(9)]
+
+
+def test_parallel_extraction_keeps_page_order(make_pdf, tmp_path):
+    pdf = make_pdf(PAGES)
+    path = tmp_path / "big.pdf"
+    path.write_bytes(pdf)
+    sequential = list(iter_pdf_pages(io.BytesIO(pdf), workers=1))
+    assert sequential == PAGES
+    # From a path (page ranges read by the workers) and from memory
+    assert list(iter_pdf_pages(str(path), workers=2, threshold=1)) == PAGES
+    assert list(iter_pdf_pages(io.BytesIO(pdf), workers=2, threshold=1)) == PAGES
+
+
+def test_small_documents_stay_in_process(make_pdf, monkeypatch):
+    monkeypatch.setattr(basic, "_get_process_pool", None)
+    pages = iter_pdf_pages(io.BytesIO(make_pdf(PAGES)), workers=2, threshold=100)
+    assert list(pages) == PAGES
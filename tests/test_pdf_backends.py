@@ -0,0 +1,46 @@
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from basic import Basic
+from pdf_backends import available_pdf_backends, get_pdf_backend
+from BackEnd.src.api.endpoints.basic import router
+
+PAGES = ["Alpha beta gamma.", "Delta epsilon!"]
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("name", available_pdf_backends())
+def test_every_installed_backend_extracts_the_same_pages(make_pdf, name):
+    backend = get_pdf_backend(name)
+    pdf = make_pdf(PAGES)
+    assert backend.count_pages(io.BytesIO(pdf)) == len(PAGES)
+    pages = [page.strip() for page in backend.iter_pages(io.BytesIO(pdf))]
+    assert pages == PAGES
+    assert [p.strip() for p in backend.iter_pages(io.BytesIO(pdf), 1, 2)] == PAGES[1:]
+
+
+def test_unknown_backend_raises(make_pdf):
+    with pytest.raises(ValueError):
+        get_pdf_backend("pdfium")
+    with pytest.raises(ValueError):
+        Basic(make_pdf(PAGES), file_type="pdf", pdf_backend="pdfium")
+
+
+def test_unknown_backend_is_a_client_error(make_pdf):
+    files = {"file": ("doc.pdf", make_pdf(PAGES), "application/pdf")}
+    response = client.post("/basic/count-words/file?pdf_backend=pdfium", files=files)
+    assert response.status_code == 400
+    assert "pdfium" in response.json()["detail"]
+
+
+def test_backend_is_selected_per_request(make_pdf):
+    files = {"file": ("doc.pdf", make_pdf(PAGES), "application/pdf")}
+    response = client.post("/basic/count-words/file?pdf_backend=pdfminer", files=files)
+    assert response.status_code == 200
+    assert response.json() == {"result": "The text contains 5 words."}
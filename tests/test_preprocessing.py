@@ -0,0 +1,67 @@
+import pytest
+
+nltk = pytest.importorskip("nltk")
+
+# Importing advanced downloads missing NLTK data; skip instead when offline
+for resource in ("tokenizers/punkt", "corpora/stopwords", "corpora/wordnet"):
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        pytest.skip(
+            f"NLTK resource {resource} is not installed", allow_module_level=True
+        )
+
+from advanced import Advanced, Preprocessing  # noqa: E402
+from basic import Basic  # noqa: E402
+
+TEXT = "The runners were running quickly. The runner won the races!"
+
+
+def test_stages_are_computed_on_demand():
+    stages = Preprocessing(Basic(TEXT))
+    assert stages.computed() == []
+    stages.stems
+    assert stages.computed() == ["tokens", "content_tokens", "content_words", "stems"]
+
+
+def test_every_stage_dependency_is_a_stage():
+    for stage, dependencies in Preprocessing.STAGES.items():
+        assert hasattr(Preprocessing, stage)
+        assert set(dependencies) <= set(Preprocessing.STAGES)
+
+
+def test_stages_are_memoized():
+    stages = Preprocessing(Basic(TEXT))
+    assert stages.content_words is stages.content_words
+    assert stages.tokens is stages.tokens
+
+
+def test_content_words_drop_stopwords():
+    stages = Preprocessing(Basic(TEXT))
+    assert stages.words[:3] == ["the", "runners", "were"]
+    assert stages.content_words == [
+        "runners",
+        "running",
+        "quickly",
+        "runner",
+        "races",
+    ]
+    assert stages.stems[:2] == ["runner", "run"]
+    assert len(stages.lemmas) == len(stages.content_words)
+
+
+def test_advanced_methods_share_the_stages():
+    advanced = Advanced(TEXT)
+    advanced.remove_stopwords()
+    advanced.perform_stemming()
+    advanced.perform_lemmatization()
+    assert advanced.stages.computed() == [
+        "tokens",
+        "content_tokens",
+        "content_words",
+        "stems",
+        "lemmas",
+    ]
+    # Callers get copies, so mutating a result leaves the stage intact
+    advanced.remove_stopwords().clear()
+    assert advanced.remove_stopwords()
@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from BackEnd.src.api.endpoints.basic import router
+from basic import (
+    Basic,
+    count_syllables,
+    readability_batch,
+    readability_counts,
+    readability_scores,
+)
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+WORD_COUNTS = Counter(
+    {"The": 2, "cat": 1, "beautiful": 1, "Organization": 1, "recreated": 1}
+)
+
+
+def test_counts_weight_each_word_by_frequency():
+    assert readability_counts(WORD_COUNTS, 2) == {
+        "words": 6,
+        "sentences": 2,
+        "syllables": 14,  # 1 + 1 + 1 + 3 + 5 + 3
+        "polysyllables": 3,
+        # Proper nouns and words complex only through -ed are not complex
+        "complex_words": 1,
+        "letters": 39,
+        "characters": 39,
+    }
+
+
+def test_scores_match_the_formulas():
+    scores = readability_scores(readability_counts(WORD_COUNTS, 2))
+    assert scores["flesch_reading_ease"] == {
+        "score": 6.39,
+        "interpretation": "Very Confusing",
+    }
+    assert scores["flesch_kincaid_grade"] == 13.11
+    assert scores["gunning_fog"] == 7.87
+    assert scores["smog_index"] == 10.13
+    assert scores["coleman_liau_index"] == 12.55
+    assert scores["automated_readability_index"] == pytest.approx(10.68, abs=0.01)
+
+
+def test_empty_text_scores_zero():
+    scores = readability_scores(readability_counts(Counter(), 0))
+    assert scores["flesch_reading_ease"]["score"] == 0
+    assert scores["gunning_fog"] == 0.0
+
+
+def test_syllable_counts_are_memoized():
+    count_syllables.cache_clear()
+    Basic("Banana banana banana. Banana!").readability_report()
+    Basic("Banana again.").readability_report()
+    info = count_syllables.cache_info()
+    assert info.hits >= 1
+    assert info.currsize == 3  # banana, Banana, again
+
+
+def test_report_agrees_with_flesch_score():
+    basic = Basic("The cat sat. The dog ran away!")
+    report = basic.readability_report()
+    assert report["counts"]["words"] == 7
+    assert report["counts"]["sentences"] == 2
+    assert report["flesch_reading_ease"] == basic.readability_score()
+
+
+def test_batch_keeps_input_order():
+    texts = ["The cat sat.", "An extraordinary organization communicates."]
+    reports = readability_batch(texts)
+    assert [report["counts"]["words"] for report in reports] == [3, 4]
+
+
+def test_readability_endpoint():
+    response = client.post(
+        "/basic/readability/text", json={"text": "The cat sat. The dog ran away!"}
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["flesch_reading_ease"]["interpretation"] == "Very Easy"
+    assert result["counts"]["syllables"] == 8
+
+    response = client.post("/basic/readability/text", json={"text": "  "})
+    assert response.status_code == 400
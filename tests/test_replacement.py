@@ -0,0 +1,16 @@
+from replacement import ReplacementAutomaton
+
+
+def test_whole_words_ascii():
+    automaton = ReplacementAutomaton({"cat": "dog"}, whole_words=True)
+    assert automaton.replace("cat concat cat_ cat.") == ("dog concat cat_ dog.", 2)
+
+
+def test_whole_words_keeps_devanagari_matras_inside_words():
+    automaton = ReplacementAutomaton({"राम": "X"}, whole_words=True)
+    assert automaton.replace("राम रामा सीताराम") == ("X रामा सीताराम", 1)
+
+
+def test_whole_words_treats_zero_width_joiners_as_word_characters():
+    automaton = ReplacementAutomaton({"क्ष": "X"}, whole_words=True)
+    assert automaton.replace("क्ष क्ष\u200d") == ("X क्ष\u200d", 1)
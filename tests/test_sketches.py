@@ -0,0 +1,67 @@
+import random
+from collections import Counter
+
+import pytest
+
+from sketches import CountMinSketch, HyperLogLog, SpaceSaving, hash_word, sketch_words
+
+
+@pytest.fixture(scope="module")
+def stream():
+    # Zipf-like stream: a few very frequent words and a long tail
+    rng = random.Random(7)
+    vocabulary = [f"w{index}" for index in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return rng.choices(vocabulary, weights, k=100_000)
+
+
+def test_hyperloglog_within_its_error_bound():
+    sketch = HyperLogLog(precision=12)
+    for index in range(50_000):
+        sketch.add_hash(hash_word(f"word{index}")[0])
+    error = abs(sketch.estimate() - 50_000) / 50_000
+    assert error <= 3 * sketch.relative_error
+
+
+def test_hyperloglog_small_counts_are_exact_enough():
+    sketch = HyperLogLog()
+    for word in ["a", "b", "c", "a"]:
+        sketch.add_hash(hash_word(word)[0])
+    assert sketch.estimate() == 3
+
+
+def test_space_saving_overestimates_by_at_most_its_error(stream):
+    true = Counter(stream)
+    summary = SpaceSaving(capacity=50)
+    for word in stream:
+        summary.add(word)
+    for word, count, error in summary.top(50):
+        assert true[word] <= count <= true[word] + error
+    # Every word above total / capacity is guaranteed to be monitored
+    frequent = {w for w, c in true.items() if c > len(stream) / summary.capacity}
+    assert frequent <= set(summary.counters)
+    assert [word for word, _, _ in summary.top(3)] == ["w0", "w1", "w2"]
+
+
+def test_count_min_never_undercounts_and_respects_its_bound(stream):
+    true = Counter(stream)
+    sketch = CountMinSketch(epsilon=1e-3, delta=0.01)
+    for word, count in true.items():
+        sketch.add_hashes(hash_word(word), count)
+    within = 0
+    for word, count in true.items():
+        estimate = sketch.estimate(word)
+        assert estimate >= count
+        within += estimate - count <= sketch.error_bound
+    assert within / len(true) >= 1 - sketch.delta
+
+
+def test_report_of_a_stream(stream):
+    report = sketch_words(stream, batch_size=10_000, capacity=100).report(
+        top_k=2, words=["w0"]
+    )
+    assert report["total_words"] == len(stream)
+    assert [entry["word"] for entry in report["most_repeated_words"]] == ["w0", "w1"]
+    assert report["frequencies"]["w0"]["count"] >= Counter(stream)["w0"]
+    with pytest.raises(ValueError):
+        sketch_words(stream[:10]).report(top_k=-1)
@@ -0,0 +1,64 @@
+import pytest
+import spacy
+
+from spacy_registry import disabled_components, needed_components
+
+LISTENER = {"@architectures": "spacy.Tok2VecListener.v1", "width": 96, "upstream": "*"}
+
+
+def listening(architecture, **config):
+    return {"model": {"@architectures": architecture, "tok2vec": LISTENER, **config}}
+
+
+@pytest.fixture(scope="module")
+def small_like():
+    # Like en_core_web_sm: the tagger listens to tok2vec, NER embeds itself
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("tagger", config=listening("spacy.Tagger.v2"))
+    nlp.add_pipe("attribute_ruler")
+    nlp.add_pipe("ner")
+    return nlp
+
+
+@pytest.fixture(scope="module")
+def shared_embedding():
+    # Like en_core_web_trf: NER listens to the shared embedding layer
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("tagger")
+    nlp.add_pipe(
+        "ner",
+        config=listening(
+            "spacy.TransitionBasedParser.v2",
+            state_type="ner",
+            extra_state_tokens=False,
+            hidden_width=64,
+            maxout_pieces=2,
+            use_upper=True,
+        ),
+    )
+    return nlp
+
+
+def test_self_contained_ner_runs_alone(small_like):
+    assert needed_components(small_like, "ner") == {"ner"}
+    assert disabled_components(small_like, "ner") == [
+        "tok2vec",
+        "tagger",
+        "attribute_ruler",
+    ]
+
+
+def test_listening_components_keep_their_embedding_layer(small_like, shared_embedding):
+    assert needed_components(small_like, "pos") == {
+        "tok2vec",
+        "tagger",
+        "attribute_ruler",
+    }
+    assert disabled_components(shared_embedding, "ner") == ["tagger"]
+
+
+def test_unknown_task_is_rejected(small_like):
+    with pytest.raises(ValueError):
+        disabled_components(small_like, "sentiment")
@@ -0,0 +1,42 @@
+import io
+
+from basic import (
+    Basic,
+    iter_document_chunks,
+    iter_pdf_pages,
+    iter_words,
+    stream_count_punctuation,
+    stream_count_unique_words,
+    stream_count_words,
+)
+
+PAGES = ["First page, with words.", "Second page: more words!", "Third"]
+
+
+def test_words_cut_by_chunk_boundaries_are_joined():
+    chunks = ["Hel", "lo wor", "ld. A", "", "gain"]
+    assert list(iter_words(chunks)) == ["Hello", "world", "Again"]
+
+
+def test_pdf_pages_are_yielded_one_at_a_time(make_pdf):
+    pages = iter_pdf_pages(io.BytesIO(make_pdf(PAGES)), workers=1)
+    assert next(pages) == PAGES[0]
+    assert list(pages) == PAGES[1:]
+
+
+def test_streaming_counts_match_in_memory_metrics(make_pdf):
+    pdf = make_pdf(PAGES)
+    text = Basic(pdf, file_type="pdf")
+
+    def chunks():
+        return iter_document_chunks(pdf, "report.pdf", pdf_workers=1)
+
+    assert stream_count_words(chunks()) == text.count_words()
+    assert stream_count_unique_words(chunks()) == text.count_unique_words()
+    assert stream_count_punctuation(chunks()) == text.count_punctuation()
+
+
+def test_txt_streams_in_chunks(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("alpha beta\ngamma " * 1000, encoding="utf-8")
+    assert stream_count_words(iter_document_chunks(str(path))) == 3000
@@ -0,0 +1,35 @@
+import basic
+from basic import Basic
+
+TEXT = "The cat sat on the mat. The dog sat too!"
+
+
+def test_metrics_from_cached_stats():
+    text = Basic(TEXT)
+    assert text.count_words() == 10
+    assert text.count_unique_words() == 8
+    assert text.show_most_repeated_word() == ("The", 2)
+    assert text.show_least_repeated_word() == ("cat", 1)
+    assert text.find_average_word_length() == 2.9
+    assert text.find_average_sentence_length() == 5
+    assert text.count_punctuation() == 2
+
+
+def test_text_is_tokenized_once_for_every_word_metric(monkeypatch):
+    calls = []
+    tokenize = basic.tokenize
+    monkeypatch.setattr(basic, "tokenize", lambda t: calls.append(t) or tokenize(t))
+    text = Basic(TEXT)
+    text.count_words()
+    text.count_unique_words()
+    text.show_most_repeated_word()
+    text.find_average_word_length()
+    assert len(calls) == 1
+
+
+def test_empty_text_has_neutral_metrics():
+    text = Basic.from_text("   ")
+    assert text.count_words() == 0
+    assert text.show_most_repeated_word() == ("None", 0)
+    assert text.find_average_word_length() == 0.0
+    assert text.find_average_sentence_length() == 0
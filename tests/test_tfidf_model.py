@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+import tfidf_model
+from tfidf_model import TfidfModel
+
+
+def test_idf_follows_smoothed_formula_after_add_document():
+    model = TfidfModel()
+    model.add_document(["cat", "cat", "dog"])
+    model.add_document(["dog", "fish"])
+    assert model.documents == 2
+    assert model.idf("dog") == pytest.approx(1.0)
+    assert model.idf("cat") == pytest.approx(math.log(3 / 2) + 1)
+    assert model.idf("unseen") == pytest.approx(math.log(3) + 1)
+
+
+def test_score_is_l2_normalized_and_ranked():
+    model = TfidfModel()
+    model.add_document(["common", "rare"])
+    model.add_document(["common"])
+    scores = model.score(["common", "rare", "rare"], top_k=2)
+    assert [term for term, _ in scores] == ["rare", "common"]
+    assert sum(score * score for _, score in scores) == pytest.approx(1.0)
+
+
+def test_document_without_terms_is_rejected():
+    model = TfidfModel()
+    with pytest.raises(ValueError):
+        model.add_document([])
+    assert model.documents == 0
+
+
+def test_saves_of_several_processes_are_merged(tmp_path, monkeypatch):
+    path = str(tmp_path / "tfidf.json")
+    first, second = TfidfModel(), TfidfModel()
+    first.add_document(["a", "b"])
+    second.add_document(["b", "c"])
+    second.add_document(["c"])
+
+    monkeypatch.setattr(tfidf_model, "corpus_model", first)
+    assert tfidf_model.save_corpus_model(path) == 1
+    monkeypatch.setattr(tfidf_model, "corpus_model", second)
+    assert tfidf_model.save_corpus_model(path) == 3
+    # The second process now sees the first one's document too
+    assert second.document_frequency == {"a": 1, "b": 2, "c": 2}
+
+    # Saving again without new documents adds nothing
+    monkeypatch.setattr(tfidf_model, "corpus_model", first)
+    assert tfidf_model.save_corpus_model(path) == 3
+
+    reloaded = TfidfModel()
+    monkeypatch.setattr(tfidf_model, "corpus_model", reloaded)
+    assert tfidf_model.load_corpus_model(path) == 3
+    assert reloaded.document_frequency == {"a": 1, "b": 2, "c": 2}
+
+
+def test_throttled_save_waits_for_the_interval(tmp_path, monkeypatch):
+    path = str(tmp_path / "tfidf.json")
+    model = TfidfModel()
+    monkeypatch.setattr(tfidf_model, "corpus_model", model)
+    model.add_document(["a"])
+    assert tfidf_model.save_corpus_model_throttled(path, interval=0)
+    model.add_document(["b"])
+    assert not tfidf_model.save_corpus_model_throttled(path, interval=3600)
+    assert tfidf_model.load_corpus_model(path) == 1
@@ -0,0 +1,59 @@
+import numpy as np
+
+from basic import Basic
+from tokenizer import TokenSpans, tokenize
+
+TEXT = "The cat saw the Dog. भारत महान है।"
+
+
+def test_offsets_map_back_to_the_text():
+    spans = TokenSpans.from_text(TEXT)
+    assert spans.to_list() == tokenize(TEXT)
+    for (start, end), token in zip(spans.spans(), spans):
+        assert TEXT[start:end] == token
+    assert spans.offsets.dtype == np.int32
+    assert spans.nbytes == len(spans) * 2 * 4
+
+
+def test_indexing_and_slicing():
+    spans = TokenSpans.from_text(TEXT)
+    assert spans[1] == "cat"
+    assert spans[-1] == "है"
+    tail = spans[4:6]
+    assert isinstance(tail, TokenSpans)
+    assert tail.to_list() == ["Dog", "भारत"]
+    assert tail.starts.tolist() == [TEXT.index("Dog"), TEXT.index("भारत")]
+
+
+def test_lowercase_iteration():
+    spans = TokenSpans.from_text("The THE the")
+    assert list(spans.iter_tokens(lowercase=True)) == ["the", "the", "the"]
+    assert spans.to_list() == ["The", "THE", "the"]
+
+
+def test_without_and_select_keep_positions():
+    spans = TokenSpans.from_text(TEXT)
+    content = spans.without({"the"})
+    assert content.to_list() == ["cat", "saw", "Dog", "भारत", "महान", "है"]
+    assert content.text is TEXT
+    assert content.starts[0] == TEXT.index("cat")
+
+    exact = spans.without({"the"}, lowercase=False)
+    assert exact.to_list()[0] == "The"
+
+    selected = spans.select(np.array([0, 2]))
+    assert selected.to_list() == ["The", "saw"]
+
+
+def test_empty_text():
+    spans = TokenSpans.from_text("... !")
+    assert len(spans) == 0
+    assert spans.offsets.shape == (0, 2)
+    assert spans.to_list() == []
+    assert len(spans.without({"x"})) == 0
+
+
+def test_basic_reuses_its_spans():
+    basic = Basic(TEXT)
+    assert basic.token_spans() is basic.token_spans()
+    assert basic.token_spans().to_list() == tokenize(TEXT)
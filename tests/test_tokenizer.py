@@ -0,0 +1,61 @@
+from tokenizer import (
+    count_punctuation_marks,
+    ends_inside_word,
+    find_proper_nouns,
+    last_sentence_end,
+    split_sentences,
+    strip_punctuation,
+    tokenize,
+)
+
+
+def test_ascii_tokens():
+    assert tokenize("Hello, world! It's 2024.") == ["Hello", "world", "It", "s", "2024"]
+
+
+def test_devanagari_words_keep_their_matras_and_viramas():
+    assert tokenize("भारत एक विशाल देश है।") == ["भारत", "एक", "विशाल", "देश", "है"]
+    assert tokenize("क्षत्रिय") == ["क्षत्रिय"]
+
+
+def test_zero_width_joiners_stay_inside_words():
+    word = "क्‍ष"
+    assert tokenize(f"{word} और") == [word, "और"]
+
+
+def test_adjacent_scripts_are_split():
+    assert tokenize("Delhiदिल्ली") == ["Delhi", "दिल्ली"]
+
+
+def test_split_sentences_at_danda():
+    text = "यह पहला वाक्य है। यह दूसरा है॥ And a third?"
+    assert split_sentences(text) == ["यह पहला वाक्य है", "यह दूसरा है", "And a third"]
+    assert split_sentences(text, keep_terminators=True) == [
+        "यह पहला वाक्य है।",
+        "यह दूसरा है॥",
+        "And a third?",
+    ]
+
+
+def test_last_sentence_end():
+    assert last_sentence_end("One. Two") == 4
+    assert last_sentence_end("एक। दो") == 3
+    assert last_sentence_end("no terminator") == 0
+
+
+def test_ends_inside_word():
+    assert ends_inside_word("partial wor")
+    assert ends_inside_word("देश")
+    assert not ends_inside_word("done ")
+    assert not ends_inside_word("")
+
+
+def test_punctuation_includes_unicode_marks():
+    assert strip_punctuation("Hi, there!") == "Hi there"
+    assert strip_punctuation("«नमस्ते», दुनिया।") == "नमस्ते दुनिया"
+    assert count_punctuation_marks("«नमस्ते», दुनिया।") == 4
+
+
+def test_proper_nouns_in_cased_scripts():
+    assert find_proper_nouns("Alice met Bob in Paris.") == ["Alice", "Bob", "Paris"]
+    assert find_proper_nouns("Élodie visits München") == ["Élodie", "München"]
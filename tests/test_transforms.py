@@ -0,0 +1,47 @@
+import itertools
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from basic import _DELETION_PASSES, TRANSFORMS, compile_transforms
+from BackEnd.src.api.endpoints.basic import router
+
+TEXT = "  Hello,  World 42!\tÇa  va? ß-Straße 3.5  "
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def apply_one_by_one(text, steps):
+    for step in steps:
+        kind, implementation = TRANSFORMS[step]
+        if kind == "delete":
+            implementation = _DELETION_PASSES[frozenset({implementation})]
+        text = implementation(text)
+    return text
+
+
+@pytest.mark.parametrize("steps", itertools.permutations(TRANSFORMS, 3))
+def test_fused_pipeline_matches_step_by_step(steps):
+    assert compile_transforms(steps)(TEXT) == apply_one_by_one(TEXT, steps)
+
+
+def test_adjacent_deletions_and_repeated_case_maps_are_fused():
+    pipeline = compile_transforms(
+        ["lowercase", "remove_punctuation", "lowercase", "remove_numbers"]
+    )
+    assert len(pipeline.passes) == 2
+
+
+def test_unknown_step_is_rejected():
+    with pytest.raises(ValueError):
+        compile_transforms(["lowercase", "stem"])
+
+
+def test_transform_endpoint():
+    body = {"text": TEXT, "steps": ["remove_numbers", "remove_extra_whitespace"]}
+    response = client.post("/basic/transform", json=body)
+    assert response.status_code == 200
+    assert response.json()["result"] == "Hello, World ! Ça va? ß-Straße ."
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from basic import detect_encoding, iter_txt_chunks
+
+TEXT = "Café naïve — नमस्ते दुनिया. " * 50
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16"])
+def test_chunks_decode_across_multibyte_boundaries(tmp_path, encoding):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(TEXT.encode(encoding))
+    chunks = list(iter_txt_chunks(str(path), chunk_size=7))
+    assert "".join(chunks) == TEXT
+
+
+def test_sequential_streams_match_mapped_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(TEXT.encode("utf-8"))
+    stream = io.BufferedReader(io.BytesIO(TEXT.encode("utf-8")))
+    sequential = "".join(iter_txt_chunks(stream, chunk_size=7))
+    assert sequential == "".join(iter_txt_chunks(str(path))) == TEXT
+
+
+@pytest.mark.parametrize("encoding", ["cp1251", "koi8-r"])
+def test_legacy_encoding_is_detected(encoding):
+    text = "Это пример текста на русском языке для проверки кодировки. " * 20
+    assert detect_encoding(text.encode(encoding)) == encoding
+
+
+def test_utf8_sample_cut_inside_a_character_is_still_utf8():
+    assert detect_encoding("नमस्ते".encode("utf-8")[:-1]) == "utf-8"
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert "".join(iter_txt_chunks(str(path))) == ""